@@ -8,8 +8,163 @@ import os
 import sys
 import subprocess
 import shutil
+import pkgutil
+import concurrent.futures
+import hashlib
+import importlib.metadata
+import platform
 from pathlib import Path
 
+# 需要自动收集隐藏导入的项目包
+PROJECT_PACKAGES = ["src/core", "src/utils"]
+
+
+def get_project_hidden_imports():
+    """扫描项目包，生成 --hidden-import 参数，新增模块无需手动维护"""
+    hidden_imports = []
+    for package_dir in PROJECT_PACKAGES:
+        prefix = Path(package_dir).name + "."
+        for module_info in pkgutil.walk_packages([package_dir], prefix=prefix):
+            hidden_imports.append(f"--hidden-import={module_info.name}")
+    return hidden_imports
+
+
+# 打包输出目录
+DIST_DIR = Path("dist/TuleajPluginAggregator")
+
+# 构建指纹文件名（位于输出目录中）
+BUILD_HASH_FILE = ".build_hash"
+
+# 不影响打包产物的命令行参数，不计入构建指纹
+HASH_IGNORED_ARGS = {"--fresh"}
+
+# 打包前需要存在的目录
+REQUIRED_DIRS = ("src/assets", "plugins", "envs")
+
+# 启动脚本内容（批处理文件使用 CRLF 换行）
+STARTUP_SCRIPT = (
+    b"@echo off\r\n"
+    b"echo Starting Tuleaj Plugin Aggregator...\r\n"
+    b"TuleajPluginAggregator.exe\r\n"
+    b"pause\r\n"
+)
+
+# 打包输出中的README内容
+README_CONTENT = """# Tuleaj Plugin Aggregator
+
+## 运行说明
+
+1. 双击 `TuleajPluginAggregator.exe` 启动程序
+2. 或双击 `start.bat` 启动程序（会显示启动信息）
+
+## 功能说明
+
+- 插件管理：启动、停止、卸载插件
+- 依赖管理：自动管理插件依赖
+- 系统托盘：程序可以最小化到系统托盘
+- 配置管理：支持配置文件管理
+
+## 注意事项
+
+- 首次运行可能需要较长时间（系统需要将 `_internal` 目录中的文件载入磁盘缓存，之后启动会明显加快）
+- 插件文件位于 `plugins` 目录
+- 配置文件为 `config.toml`
+- 日志文件位于 `logs` 目录
+
+## 系统要求
+
+- Windows 10/11
+- 无需安装Python环境
+- 建议8GB以上内存
+
+## 技术支持
+
+如有问题，请查看日志文件或联系技术支持。
+"""
+
+# 打包后保留的 Qt 翻译语言
+KEEP_TRANSLATIONS = ("zh_CN", "en")
+
+
+def remove_unused_translations(dist_dir):
+    """删除未使用语言的 Qt 翻译文件，返回删除的文件数"""
+    removed = 0
+    for translations_dir in (dist_dir / "_internal" / "PySide6").rglob("translations"):
+        for qm_file in translations_dir.glob("*.qm"):
+            if not qm_file.stem.endswith(KEEP_TRANSLATIONS):
+                qm_file.unlink()
+                removed += 1
+    return removed
+
+
+# 打包后从 _internal 中删除的目录名和文件后缀（运行时不会读取）
+# 不按 test/tests 目录名删除：--noarchive 时部分库在运行时会导入同名的子包，删除后程序无法启动
+PRUNE_DIR_NAMES = {"__pycache__"}
+PRUNE_FILE_SUFFIXES = (".pyi",)
+
+
+def prune_internal_dir(directory):
+    """递归删除运行时不需要的字节码缓存和类型存根，返回删除的条目数"""
+    removed = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in PRUNE_DIR_NAMES:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                    removed += 1
+                else:
+                    removed += prune_internal_dir(entry.path)
+            elif entry.name.endswith(PRUNE_FILE_SUFFIXES):
+                os.unlink(entry.path)
+                removed += 1
+    return removed
+
+
+def compute_build_hash():
+    """根据源码、打包脚本、影响产物的构建参数以及 PySide6/Python 版本计算构建指纹"""
+    digest = hashlib.blake2b(digest_size=16)
+    
+    source_files = sorted(path for path in Path("src").rglob("*") if path.is_file())
+    for extra_file in (Path(__file__), Path("config.toml")):
+        if extra_file.is_file():
+            source_files.append(extra_file)
+    
+    for path in source_files:
+        if "__pycache__" in path.parts:
+            continue
+        digest.update(path.as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    
+    try:
+        pyside_version = importlib.metadata.version("PySide6")
+    except importlib.metadata.PackageNotFoundError:
+        pyside_version = "unknown"
+    digest.update(pyside_version.encode("utf-8"))
+    digest.update(platform.python_version().encode("utf-8"))
+    build_args = sorted(arg for arg in sys.argv[1:] if arg not in HASH_IGNORED_ARGS)
+    digest.update(" ".join(build_args).encode("utf-8"))
+    
+    return digest.hexdigest()
+
+
+def run_pyinstaller(cmd):
+    """运行 PyInstaller 并实时转发输出，失败时抛出 CalledProcessError"""
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        encoding="utf-8",
+        errors="replace"
+    )
+    for line in process.stdout:
+        sys.stdout.write(line)
+    return_code = process.wait()
+    if return_code:
+        raise subprocess.CalledProcessError(return_code, cmd)
+
+
 def main():
     """修复版打包流程"""
     print("🚀 开始打包 Tuleaj Plugin Aggregator (修复版)...")
@@ -19,56 +174,54 @@ def main():
         print("❌ 错误: 请在项目根目录运行此脚本")
         return False
     
+    # 源码和环境均未变化时跳过构建（--fresh 强制重新构建）
+    build_hash = compute_build_hash()
+    build_hash_file = DIST_DIR / BUILD_HASH_FILE
+    if "--fresh" not in sys.argv and build_hash_file.is_file():
+        if build_hash_file.read_text(encoding="utf-8").strip() == build_hash:
+            print("✅ 源码和构建环境未变化，跳过打包")
+            return True
+    
     # 清理旧的构建文件
-    print("🧹 清理旧文件...")
-    for dir_name in ["build", "dist"]:
-        if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
+    # 默认保留 build/ 中的分析缓存，仅清理输出目录；传入 --fresh 时完整重建
+    if "--fresh" in sys.argv:
+        print("🧹 完整重建，清理 build/ 和 dist/ ...")
+        for dir_name in ["build", "dist"]:
+            shutil.rmtree(dir_name, ignore_errors=True)
+    else:
+        print("🧹 清理旧输出（保留 build/ 分析缓存）...")
+        shutil.rmtree(DIST_DIR, ignore_errors=True)
     
     # 确保必要目录存在
     print("📁 确保目录结构...")
-    Path("src/assets").mkdir(exist_ok=True)
-    Path("plugins").mkdir(exist_ok=True)
-    Path("envs").mkdir(exist_ok=True)
+    for dir_name in REQUIRED_DIRS:
+        Path(dir_name).mkdir(exist_ok=True)
     
     # PyInstaller命令 - 修复版
     cmd = [
         "pyinstaller",
-        "--clean",
         "--noconfirm",
         "--onedir",  # 打包成文件夹，兼容性更好
         "--windowed",  # 不显示控制台
+        "--noupx",  # 禁用 UPX，避免启动时解压 Qt DLL
         "--name=TuleajPluginAggregator",
+        "--optimize=2",  # 等同 python -OO，去除文档字符串和 assert
         
         # 添加数据文件 - 修复路径问题
         "--add-data=src/ui;ui",
         "--add-data=src/assets;assets",
         
-        # WebEngine相关文件
-        "--collect-all=PySide6.QtWebEngine",
-        "--collect-all=PySide6.QtWebEngineCore",
-        "--collect-all=PySide6.QtWebEngineWidgets",
+        # WebEngine相关文件 - 由 PyInstaller 自带的 PySide6 hook 收集
+        # QtWebEngineProcess 和 resources，不再使用 --collect-all 全量扫描
+        "--hidden-import=PySide6.QtWebEngineQuick",
         
-        # 隐藏导入 - 确保所有模块都被包含
-        "--hidden-import=PySide6.QtCore",
-        "--hidden-import=PySide6.QtGui", 
-        "--hidden-import=PySide6.QtWidgets",
-        "--hidden-import=PySide6.QtQml",
+        # 隐藏导入 - QtCore/QtGui/QtWidgets/QtQml 已被 src 直接导入，
+        # 这里只列出仅由 QML 使用、静态分析无法发现的模块
         "--hidden-import=PySide6.QtQuick",
         "--hidden-import=PySide6.QtQuickControls2",
-        "--hidden-import=PySide6.QtQuickLayouts",
-        "--hidden-import=PySide6.QtWebEngine",
-        "--hidden-import=PySide6.QtWebEngineCore",
-        "--hidden-import=PySide6.QtWebEngineWidgets",
         
         # 项目模块
-        "--hidden-import=core.config_bridge",
-        "--hidden-import=core.plugin_bridge",
-        "--hidden-import=core.plugin_process_manager", 
-        "--hidden-import=core.dependency_manager",
-        "--hidden-import=core.config_manager",
-        "--hidden-import=utils.logger",
-        "--hidden-import=utils.exception_handler",
+        *get_project_hidden_imports(),
         
         # 第三方库
         "--hidden-import=toml",
@@ -89,76 +242,80 @@ def main():
         "--exclude-module=tensorflow",
         "--exclude-module=torch",
         
+        # 排除未使用的 Qt 模块
+        "--exclude-module=PySide6.Qt3DCore",
+        "--exclude-module=PySide6.Qt3DRender",
+        "--exclude-module=PySide6.QtCharts",
+        "--exclude-module=PySide6.QtMultimedia",
+        "--exclude-module=PySide6.QtMultimediaWidgets",
+        "--exclude-module=PySide6.QtPdf",
+        "--exclude-module=PySide6.QtPdfWidgets",
+        "--exclude-module=PySide6.QtSensors",
+        "--exclude-module=PySide6.QtSerialPort",
+        "--exclude-module=PySide6.QtPositioning",
+        "--exclude-module=PySide6.QtLocation",
+        "--exclude-module=PySide6.QtDataVisualization",
+        
         # 主程序文件
         "src/main.py"
     ]
     
+    # --fast-start: 以散装 .pyc 代替 PYZ 归档，省去导入时的解压
+    if "--fast-start" in sys.argv:
+        cmd.insert(-1, "--noarchive")
+    
+    # 必须保持 --onedir：--onefile 每次启动都会把 PySide6/QtWebEngine 解压到临时目录
+    if "--onefile" in cmd:
+        print("❌ 错误: 不支持 --onefile 模式，每次启动都会重新解压 PySide6 和 QtWebEngine，请保持 --onedir")
+        return False
+    
     print("🔨 执行打包命令...")
     print("命令:", " ".join(cmd))
     
     try:
-        # 执行打包
-        result = subprocess.run(cmd, check=True, text=True)
+        # 执行打包，逐行输出 PyInstaller 日志以便实时查看进度
+        run_pyinstaller(cmd)
         print("✅ 打包成功！")
         
         # 检查输出目录
-        dist_dir = Path("dist/TuleajPluginAggregator")
-        if dist_dir.exists():
+        dist_dir = DIST_DIR
+        if dist_dir.is_dir():
             print(f"📁 输出目录: {dist_dir.absolute()}")
             print(f"🚀 可执行文件: {dist_dir / 'TuleajPluginAggregator.exe'}")
             
-            # 复制配置文件
-            if Path("config.toml").exists():
-                shutil.copy2("config.toml", dist_dir)
+            # 删除未使用的翻译文件
+            removed = remove_unused_translations(dist_dir)
+            print(f"✅ 已删除 {removed} 个未使用的翻译文件")
+            
+            # 清理运行时不需要的文件
+            internal_dir = dist_dir / "_internal"
+            if internal_dir.is_dir():
+                removed = prune_internal_dir(internal_dir)
+                print(f"✅ 已清理 {removed} 个无用的缓存/存根文件")
+            
+            # 并行复制配置文件、创建启动脚本和README（二进制写入，避免换行符转换）
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                config_future = executor.submit(shutil.copy2, "config.toml", dist_dir)
+                startup_future = executor.submit((dist_dir / "start.bat").write_bytes, STARTUP_SCRIPT)
+                readme_future = executor.submit(
+                    (dist_dir / "README.txt").write_bytes, README_CONTENT.encode("utf-8")
+                )
+            
+            try:
+                config_future.result()
                 print("✅ 已复制配置文件")
+            except FileNotFoundError:
+                pass
             
-            # 创建启动脚本
-            startup_script = dist_dir / "start.bat"
-            with open(startup_script, "w", encoding="utf-8") as f:
-                f.write("@echo off\n")
-                f.write("echo Starting Tuleaj Plugin Aggregator...\n")
-                f.write("TuleajPluginAggregator.exe\n")
-                f.write("pause\n")
+            startup_future.result()
             print("✅ 启动脚本已创建")
             
-            # 创建README
-            readme_content = """# Tuleaj Plugin Aggregator
-
-## 运行说明
-
-1. 双击 `TuleajPluginAggregator.exe` 启动程序
-2. 或双击 `start.bat` 启动程序（会显示启动信息）
-
-## 功能说明
-
-- 插件管理：启动、停止、卸载插件
-- 依赖管理：自动管理插件依赖
-- 系统托盘：程序可以最小化到系统托盘
-- 配置管理：支持配置文件管理
-
-## 注意事项
-
-- 首次运行可能需要较长时间
-- 插件文件位于 `plugins` 目录
-- 配置文件为 `config.toml`
-- 日志文件位于 `logs` 目录
-
-## 系统要求
-
-- Windows 10/11
-- 无需安装Python环境
-- 建议8GB以上内存
-
-## 技术支持
-
-如有问题，请查看日志文件或联系技术支持。
-"""
-            
-            readme_file = dist_dir / "README.txt"
-            with open(readme_file, "w", encoding="utf-8") as f:
-                f.write(readme_content)
+            readme_future.result()
             print("✅ README文件已创建")
             
+            # 记录构建指纹，供下次构建判断是否需要重新打包
+            build_hash_file.write_text(build_hash, encoding="utf-8")
+            
             return True
         else:
             print("❌ 错误: 输出目录不存在")
@@ -10,11 +10,12 @@ from PySide6.QtCore import QCoreApplication, QUrl
 from PySide6.QtQml import qmlRegisterType, QQmlApplicationEngine
 from PySide6.QtGui import QGuiApplication
 
-# 添加当前目录到 Python 路径
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
+# 以 `python main.py` 方式运行时，脚本所在目录已是 sys.path[0]，无需手动插入
 from system_monitor_backend import SystemMonitorBackend, register_types
 
+# QML 文件路径
+QML_FILE = os.path.join(os.path.dirname(__file__), "system_monitor.qml")
+
 
 def main():
     """主函数"""
@@ -28,8 +29,7 @@ def main():
     engine = QQmlApplicationEngine()
     
     # 加载 QML 文件
-    qml_file = os.path.join(os.path.dirname(__file__), "system_monitor.qml")
-    engine.load(QUrl.fromLocalFile(qml_file))
+    engine.load(QUrl.fromLocalFile(QML_FILE))
     
     # 检查是否成功加载
     if not engine.rootObjects():
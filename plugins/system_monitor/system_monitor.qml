@@ -14,27 +14,16 @@ ApplicationWindow {
     SystemMonitorBackend {
         id: systemMonitor
         
-        onCpuUsageChanged: function(usage) {
-            cpuProgressBar.value = usage
-            cpuLabel.text = "CPU: " + usage.toFixed(1) + "%"
-        }
-        
-        onMemoryUsageChanged: function(usage) {
-            memoryProgressBar.value = usage
-            memoryLabel.text = "内存: " + usage.toFixed(1) + "%"
-        }
-        
-        onMemoryTotalChanged: function(total) {
-            memoryTotalLabel.text = "总内存: " + total + " MB"
-        }
-        
-        onMemoryUsedChanged: function(used) {
-            memoryUsedLabel.text = "已用: " + used + " MB"
-        }
-        
-        onNetworkSpeedChanged: function(download, upload) {
-            downloadLabel.text = "下载: " + download.toFixed(2) + " MB/s"
-            uploadLabel.text = "上传: " + upload.toFixed(2) + " MB/s"
+        onStatsChanged: function(stats) {
+            cpuProgressBar.value = stats.cpu
+            cpuLabel.text = "CPU: " + stats.cpu.toFixed(1) + "%"
+            
+            memoryProgressBar.value = stats.memPct
+            memoryLabel.text = "内存: " + stats.memPct.toFixed(1) + "%"
+            memoryUsedLabel.text = "已用: " + stats.memUsed + " MB"
+            
+            downloadLabel.text = "下载: " + stats.down.toFixed(2) + " MB/s"
+            uploadLabel.text = "上传: " + stats.up.toFixed(2) + " MB/s"
         }
     }
     
@@ -124,7 +113,7 @@ ApplicationWindow {
                         
                         Text {
                             id: memoryTotalLabel
-                            text: "总内存: 0 MB"
+                            text: "总内存: " + systemMonitor.memoryTotal + " MB"
                             font.pixelSize: 12
                             color: "#666666"
                         }
@@ -7,40 +7,55 @@
 
 import psutil
 import time
-import threading
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import (
+    QObject, Signal, Slot, Property, QTimer, QThread, QCoreApplication, QMetaObject, Qt
+)
 from PySide6.QtQml import qmlRegisterType
 
+# CPU 频率变化缓慢，缓存时间 (秒)
+CPU_FREQ_TTL = 10.0
 
-class SystemMonitorBackend(QObject):
-    """系统监控后端类"""
+
+class SystemMonitorSampler(QObject):
+    """系统信息采样器，运行在工作线程中，避免在主线程中访问系统接口"""
     
-    # 信号定义
-    cpuUsageChanged = Signal(float)  # CPU 使用率
-    memoryUsageChanged = Signal(float)  # 内存使用率
-    memoryTotalChanged = Signal(int)  # 总内存 (MB)
-    memoryUsedChanged = Signal(int)  # 已用内存 (MB)
-    networkSpeedChanged = Signal(float, float)  # 下载速度, 上传速度 (MB/s)
+    # 采样结果: CPU 使用率, 内存使用率, 已用内存 (MB), 下载速度, 上传速度 (MB/s)
+    sampled = Signal(float, float, int, float, float)
     
-    def __init__(self, parent=None):
+    def __init__(self, interval_ms=1000, parent=None):
         super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.timer = None
         
         # 初始化网络监控
         self.last_bytes_sent = 0
         self.last_bytes_recv = 0
         self.last_time = time.time()
-        
-        # 创建定时器
-        self.timer = QTimer()
+    
+    @Slot()
+    def start(self):
+        """在工作线程中启动定时采样"""
+        # 定时器必须在工作线程中创建，才能在该线程的事件循环中触发
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_system_info)
-        self.timer.start(1000)  # 每秒更新一次
+        
+        # 预热 CPU 统计，之后的非阻塞调用返回距上次调用的使用率
+        psutil.cpu_percent(interval=None)
         
         # 初始化网络统计
         self.init_network_stats()
         
+        self.timer.start(self.interval_ms)
+        
         # 立即更新一次
         self.update_system_info()
     
+    @Slot()
+    def stop(self):
+        """停止定时采样"""
+        if self.timer:
+            self.timer.stop()
+    
     def init_network_stats(self):
         """初始化网络统计"""
         net_io = psutil.net_io_counters()
@@ -48,31 +63,30 @@ class SystemMonitorBackend(QObject):
         self.last_bytes_recv = net_io.bytes_recv
         self.last_time = time.time()
     
+    @Slot()
     def update_system_info(self):
         """更新系统信息"""
         try:
             # 更新 CPU 使用率
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            self.cpuUsageChanged.emit(cpu_percent)
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             # 更新内存信息
             memory = psutil.virtual_memory()
             memory_percent = memory.percent
-            memory_total_mb = memory.total // (1024 * 1024)
-            memory_used_mb = memory.used // (1024 * 1024)
-            
-            self.memoryUsageChanged.emit(memory_percent)
-            self.memoryTotalChanged.emit(memory_total_mb)
-            self.memoryUsedChanged.emit(memory_used_mb)
+            memory_used_mb = memory.used >> 20
             
             # 更新网络速度
-            self.update_network_speed()
+            download_speed, upload_speed = self.update_network_speed()
+            
+            self.sampled.emit(cpu_percent, memory_percent, memory_used_mb, download_speed, upload_speed)
             
         except Exception as e:
             print(f"更新系统信息时出错: {e}")
     
     def update_network_speed(self):
-        """更新网络速度"""
+        """更新网络速度，返回 (下载速度, 上传速度)，单位 MB/s"""
+        download_speed = 0.0
+        upload_speed = 0.0
         try:
             current_time = time.time()
             net_io = psutil.net_io_counters()
@@ -87,8 +101,6 @@ class SystemMonitorBackend(QObject):
                 # 转换为 MB/s
                 upload_speed = (bytes_sent_diff / time_diff) / (1024 * 1024)
                 download_speed = (bytes_recv_diff / time_diff) / (1024 * 1024)
-                
-                self.networkSpeedChanged.emit(download_speed, upload_speed)
             
             # 更新统计信息
             self.last_bytes_sent = net_io.bytes_sent
@@ -97,18 +109,84 @@ class SystemMonitorBackend(QObject):
             
         except Exception as e:
             print(f"更新网络速度时出错: {e}")
+        
+        return download_speed, upload_speed
+
+
+class SystemMonitorBackend(QObject):
+    """系统监控后端类"""
+    
+    # 信号定义
+    # 每次采样只发送一次聚合信号，键: cpu, memPct, memUsed (MB), down, up (MB/s)
+    statsChanged = Signal('QVariantMap')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        # 总内存和 CPU 核心数在运行期间不会变化，只读取一次
+        self._memory_total_mb = psutil.virtual_memory().total >> 20
+        self._cpu_count = psutil.cpu_count()
+        
+        # CPU 频率缓存 (读取时间, 频率)
+        self._cpu_freq_time = 0.0
+        self._cpu_freq_value = 0
+        
+        # 在工作线程中采样，结果通过队列连接回到主线程
+        self.sampler_thread = QThread(self)
+        self.sampler = SystemMonitorSampler()
+        self.sampler.moveToThread(self.sampler_thread)
+        self.sampler_thread.started.connect(self.sampler.start)
+        self.sampler_thread.finished.connect(self.sampler.deleteLater)
+        self.sampler.sampled.connect(self._on_sampled)
+        
+        # 应用退出时停止工作线程
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.stop)
+        
+        self.sampler_thread.start()
+    
+    @Property(int, constant=True)
+    def memoryTotal(self):
+        """总内存 (MB)"""
+        return self._memory_total_mb
+    
+    @Slot(float, float, int, float, float)
+    def _on_sampled(self, cpu_percent, memory_percent, memory_used_mb, download_speed, upload_speed):
+        """将采样结果合并为一个信号转发给 QML"""
+        self.statsChanged.emit({
+            "cpu": cpu_percent,
+            "memPct": memory_percent,
+            "memUsed": memory_used_mb,
+            "down": download_speed,
+            "up": upload_speed,
+        })
+    
+    @Slot()
+    def stop(self):
+        """停止采样线程"""
+        if self.sampler_thread.isRunning():
+            QMetaObject.invokeMethod(self.sampler, "stop", Qt.BlockingQueuedConnection)
+            self.sampler_thread.quit()
+            self.sampler_thread.wait()
     
     def get_cpu_count(self):
         """获取 CPU 核心数"""
-        return psutil.cpu_count()
+        return self._cpu_count
     
     def get_cpu_freq(self):
-        """获取 CPU 频率"""
+        """获取 CPU 频率（缓存 CPU_FREQ_TTL 秒）"""
+        now = time.monotonic()
+        if self._cpu_freq_time and now - self._cpu_freq_time < CPU_FREQ_TTL:
+            return self._cpu_freq_value
+        
         try:
             freq = psutil.cpu_freq()
-            return freq.current if freq else 0
+            self._cpu_freq_value = freq.current if freq else 0
         except:
-            return 0
+            self._cpu_freq_value = 0
+        self._cpu_freq_time = now
+        return self._cpu_freq_value
     
     def get_boot_time(self):
         """获取系统启动时间"""
@@ -127,16 +205,16 @@ def register_types():
 if __name__ == "__main__":
     # 测试代码
     import sys
-    from PySide6.QtCore import QCoreApplication
     
     app = QCoreApplication(sys.argv)
     
     monitor = SystemMonitorBackend()
     
     # 连接信号到打印函数
-    monitor.cpuUsageChanged.connect(lambda x: print(f"CPU: {x:.1f}%"))
-    monitor.memoryUsageChanged.connect(lambda x: print(f"内存: {x:.1f}%"))
-    monitor.networkSpeedChanged.connect(lambda d, u: print(f"网络: 下载 {d:.2f} MB/s, 上传 {u:.2f} MB/s"))
+    monitor.statsChanged.connect(lambda stats: print(
+        f"CPU: {stats['cpu']:.1f}%, 内存: {stats['memPct']:.1f}%, "
+        f"网络: 下载 {stats['down']:.2f} MB/s, 上传 {stats['up']:.2f} MB/s"
+    ))
     
     print("系统监控插件测试")
     print("按 Ctrl+C 退出")
@@ -5,18 +5,32 @@
 """
 
 import sys
+import json
 import subprocess
 import os
+import re
+import shutil
+import stat
+import threading
+import time
+import operator
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from PySide6.QtCore import QObject, Signal, Property, QTimer, Slot, QThread
+from typing import Dict, Any, List, Optional, Tuple
+from PySide6.QtCore import (
+    QObject, Signal, Property, QTimer, Slot, QThread, QCoreApplication, QRunnable, QThreadPool, Qt
+)
 from PySide6.QtQml import qmlRegisterType
 
 # 添加src目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.config_manager import ConfigManager
+from core.environments_model import EnvironmentsModel
 from utils.logger import Logger
+from utils.site_packages import find_site_packages, scan_site_packages
 from utils.exception_handler import (
     ExceptionHandler, 
     set_global_exception_handler,
@@ -25,6 +39,72 @@ from utils.exception_handler import (
 )
 
 
+# 环境信息磁盘缓存文件（位于环境目录下）
+ENV_INFO_CACHE_FILE = ".cache.json"
+
+# 虚拟环境中 Python/pip 可执行文件的相对路径及隐藏子进程窗口的启动信息（按平台只计算一次）
+if os.name == 'nt':  # Windows
+    VENV_PYTHON_REL = ("Scripts", "python.exe")
+    VENV_PIP_REL = ("Scripts", "pip.exe")
+    # 虚拟环境 pyvenv.cfg 中 home 目录下基础解释器的文件名
+    BASE_PYTHON_NAMES = ("python.exe",)
+    # Popen 使用时会复制一份，可以在多次调用间共享
+    HIDDEN_STARTUPINFO = subprocess.STARTUPINFO()
+    HIDDEN_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    HIDDEN_STARTUPINFO.wShowWindow = subprocess.SW_HIDE
+else:  # Unix/Linux
+    VENV_PYTHON_REL = ("bin", "python")
+    VENV_PIP_REL = ("bin", "pip")
+    BASE_PYTHON_NAMES = ("python3", "python")
+    HIDDEN_STARTUPINFO = None
+
+# 环境包列表缓存有效期（秒），超时后重新读取以反映外部的安装/卸载
+PACKAGE_CACHE_TTL = 60.0
+
+# 环境名称校验：字母、数字、下划线和连字符
+ENV_NAME_PATTERN = re.compile(r"[\w-]+")
+
+# 模板虚拟环境目录（位于环境目录下，按Python版本存放）及模板提示符占位符
+ENV_TEMPLATES_DIR = ".templates"
+ENV_PROMPT_PLACEHOLDER = "__tuleaj_env__"
+
+# 新建环境的 pyproject.toml 模板
+PYPROJECT_TEMPLATE = """[project]
+name = "{name}"
+version = "0.1.0"
+description = "Virtual environment for {name}"
+requires-python = ">={python_version}"
+
+[tool.uv]
+dev-dependencies = []
+"""
+
+# 镜像源按优先级排序的键
+MIRROR_PRIORITY_KEY = operator.itemgetter("priority")
+
+# 计算环境大小时统计的目录及统计上限（100MB）
+ENV_SIZE_DIRS = {'.venv', 'Scripts', 'bin', 'lib', 'include'}
+ENV_SIZE_LIMIT = 100 * 1024 * 1024
+
+# 计算环境大小时跳过的目录（字节码缓存会随运行频繁变化）
+ENV_SIZE_SKIP_DIRS = {'__pycache__'}
+
+
+class MirrorTestTask(QRunnable):
+    """在线程池中执行的镜像源连接测试任务"""
+    
+    def __init__(self, bridge, url: str, timeout: int):
+        super().__init__()
+        self._bridge = bridge
+        self._url = url
+        self._timeout = timeout
+    
+    def run(self):
+        """执行连接测试，结果通过信号回到主线程"""
+        result = self._bridge._check_mirror_connection(self._url, self._timeout)
+        self._bridge.mirrorTestCompleted.emit(self._url, result)
+
+
 class PythonEnvironmentWorker(QThread):
     """Python环境管理工作线程"""
     
@@ -32,7 +112,7 @@ class PythonEnvironmentWorker(QThread):
     environmentCreated = Signal(str, bool, str)  # 环境名, 成功状态, 消息
     environmentDeleted = Signal(str, bool, str)  # 环境名, 成功状态, 消息
     environmentListUpdated = Signal(list)  # 环境列表
-    environmentInfoUpdated = Signal(dict)  # 环境信息
+    environmentInfoUpdated = Signal(dict)  # 完整环境信息（含大小）
     
     # 内部信号，用于在工作线程中触发操作
     createEnvironmentRequested = Signal(str, str, int)  # 环境名, Python版本, 超时时间
@@ -40,24 +120,43 @@ class PythonEnvironmentWorker(QThread):
     @staticmethod
     def _get_hidden_subprocess_startupinfo():
         """获取隐藏窗口的subprocess启动信息"""
-        import subprocess
-        if os.name == 'nt':  # Windows
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            return startupinfo
-        return None
+        return HIDDEN_STARTUPINFO
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, logger: Optional[Logger] = None):
         super().__init__(parent)
-        self.logger = Logger(log_level="INFO")
+        # 优先复用父对象的日志器，避免重复创建处理器
+        self.logger = logger or Logger(log_level="INFO")
         # 设置环境目录为项目根目录下的envs目录
         project_root = Path(__file__).parent.parent.parent  # 从src/core/config_bridge.py回到项目根目录
         self.environments_dir = project_root / "envs"
         self.environments_dir.mkdir(exist_ok=True)
         
+        # 虚拟环境中可执行文件的相对路径
+        self._python_rel = VENV_PYTHON_REL
+        self._pip_rel = VENV_PIP_REL
+        
+        # 环境目录列表缓存 (envs 目录修改时间, 环境名列表)，目录增删环境时失效
+        self._envs_dir_listing = (None, [])
+        
+        # uv 可执行文件的绝对路径，只在启动和重新探测时查找 PATH，避免每次启动子进程都搜索
+        self._uv_path = shutil.which("uv") or "uv"
+        
+        # uv 版本探测结果：None 表示尚未探测，空字符串表示 uv 不可用
+        self._uv_version = None
+        self._uv_error = ""
+        
+        # 环境信息缓存 {环境名: {"mtime": 目录修改时间, "info": 环境信息}}
+        self._info_cache_file = self.environments_dir / ENV_INFO_CACHE_FILE
+        self._info_cache_lock = threading.Lock()
+        self._info_cache = self._load_info_cache()
+        # 内存中的缓存自上次写盘后是否有变化（在 _info_cache_lock 内读写）
+        self._info_cache_dirty = False
+        
+        # 持久线程池，用于并行获取各环境信息（子进程调用和大小计算）
+        self._pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                        thread_name_prefix="env-info")
+        
         # 连接内部信号，使用QueuedConnection确保在工作线程中执行
-        from PySide6.QtCore import Qt
         self.createEnvironmentRequested.connect(self.create_environment, Qt.QueuedConnection)
     
     def run(self):
@@ -76,10 +175,128 @@ class PythonEnvironmentWorker(QThread):
             # 即使出错也要发送空列表，避免前端卡住
             self.environmentListUpdated.emit([])
     
+    def _load_info_cache(self) -> Dict[str, Any]:
+        """从磁盘加载环境信息缓存"""
+        try:
+            with open(self._info_cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    @silent_exceptions()
+    def _save_info_cache(self):
+        """缓存有变化时写入磁盘（先写临时文件再替换，中断时不会留下截断的缓存文件）"""
+        with self._info_cache_lock:
+            if not self._info_cache_dirty:
+                return
+            data = json.dumps(self._info_cache, ensure_ascii=False)
+            tmp_file = self._info_cache_file.with_name(self._info_cache_file.name + ".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_file, self._info_cache_file)
+            self._info_cache_dirty = False
+    
+    def _invalidate_info_cache(self, env_name: str):
+        """使指定环境的缓存失效"""
+        with self._info_cache_lock:
+            removed = self._info_cache.pop(env_name, None)
+            if removed is not None:
+                self._info_cache_dirty = True
+        if removed is not None:
+            self._save_info_cache()
+    
+    def shutdown(self):
+        """关闭线程池"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    @staticmethod
+    def _dir_size(path: str, limit: int) -> int:
+        """使用 os.scandir 计算目录大小（不跟随符号链接、跳过字节码缓存），超过 limit 字节后停止统计"""
+        total_size = 0
+        stack = [path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ENV_SIZE_SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                        if total_size > limit:
+                            return total_size
+        return total_size
+    
+    def _probe_uv(self) -> str:
+        """探测 uv 是否可用，返回版本号，不可用时返回空字符串"""
+        try:
+            self._uv_path = shutil.which("uv") or "uv"
+            startupinfo = self._get_hidden_subprocess_startupinfo()
+            uv_check = subprocess.run([self._uv_path, "--version"], capture_output=True, text=True, timeout=10, 
+                                    encoding='utf-8', errors='ignore', startupinfo=startupinfo)
+            self._uv_error = ""
+            self.logger.info(f"uv 版本检查: {uv_check.stdout.strip()}")
+            return uv_check.stdout.strip() or "unknown"
+        except Exception as e:
+            self._uv_error = str(e)
+            self.logger.error(f"uv 命令检查失败: {str(e)}")
+            return ""
+    
+    def _run_uv_venv(self, cmd: List[str], cwd: Path, timeout_seconds: int):
+        """执行 uv venv 命令，失败时抛出 CalledProcessError"""
+        self.logger.info(f"执行命令: {' '.join(cmd)}")
+        self.logger.info(f"工作目录: {cwd}")
+        
+        startupinfo = self._get_hidden_subprocess_startupinfo()
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True, 
+                              timeout=timeout_seconds, cwd=str(cwd), encoding='utf-8', errors='ignore',
+                              startupinfo=startupinfo)
+        self.logger.info(f"uv venv 输出: {result.stdout}")
+        if result.stderr:
+            self.logger.info(f"uv venv 错误输出: {result.stderr}")
+    
+    def _ensure_template(self, python_version: str, timeout_seconds: int) -> Path:
+        """确保指定Python版本的模板虚拟环境存在（只在首次使用时运行 uv venv），返回模板 .venv 路径"""
+        template_root = self.environments_dir / ENV_TEMPLATES_DIR / f"py{python_version}"
+        template_venv = template_root / ".venv"
+        if (template_venv / "pyvenv.cfg").is_file():
+            return template_venv
+        
+        # 清理上次未完成的模板后重新创建，提示符使用占位符，复制时替换为环境名
+        shutil.rmtree(template_root, ignore_errors=True)
+        template_root.mkdir(parents=True, exist_ok=True)
+        self._run_uv_venv(
+            [self._uv_path, "venv", "--python", python_version, "--prompt", ENV_PROMPT_PLACEHOLDER, ".venv"],
+            template_root, timeout_seconds
+        )
+        return template_venv
+    
+    def _clone_template(self, template_venv: Path, venv_path: Path, env_name: str):
+        """从模板复制虚拟环境，并改写其中记录了模板路径和提示符的文本文件"""
+        # 逐个复制文件而不是硬链接：环境中的文件（.pth、启动器等）可能被原地改写，共享 inode 会波及模板和其他环境
+        # 模板只是未安装任何包的空虚拟环境，复制的开销很小
+        shutil.copytree(template_venv, venv_path, symlinks=True)
+        
+        replacements = (
+            (str(template_venv).encode('utf-8'), str(venv_path).encode('utf-8')),
+            (ENV_PROMPT_PLACEHOLDER.encode('utf-8'), env_name.encode('utf-8')),
+        )
+        text_files = [venv_path / "pyvenv.cfg"]
+        with os.scandir(venv_path / self._python_rel[0]) as entries:
+            text_files.extend(Path(entry.path) for entry in entries
+                              if entry.name.startswith(("activate", "deactivate")) and entry.is_file(follow_symlinks=False))
+        
+        for text_file in text_files:
+            content = text_file.read_bytes()
+            for old, new in replacements:
+                content = content.replace(old, new)
+            text_file.write_bytes(content)
+    
     def create_environment(self, env_name: str, python_version: str = "3.11", timeout_seconds: int = 60):
         """使用uv init创建项目环境"""
         try:
             env_path = self.environments_dir / env_name
+            self._invalidate_info_cache(env_name)
             
             if env_path.exists():
                 self.environmentCreated.emit(env_name, False, f"环境 '{env_name}' 已存在")
@@ -93,46 +310,33 @@ class PythonEnvironmentWorker(QThread):
             try:
                 self.logger.info(f"开始创建环境 {env_name}，超时时间: {timeout_seconds} 秒")
                 
-                # 检查 uv 是否可用
-                try:
-                    startupinfo = self._get_hidden_subprocess_startupinfo()
-                    uv_check = subprocess.run(["uv", "--version"], capture_output=True, text=True, timeout=10, 
-                                            encoding='utf-8', errors='ignore', startupinfo=startupinfo)
-                    self.logger.info(f"uv 版本检查: {uv_check.stdout.strip()}")
-                except Exception as e:
-                    self.logger.error(f"uv 命令检查失败: {str(e)}")
-                    self.environmentCreated.emit(env_name, False, f"uv 命令不可用: {str(e)}")
+                # 检查 uv 是否可用（只在首次创建时探测一次）
+                if self._uv_version is None:
+                    self._uv_version = self._probe_uv()
+                if not self._uv_version:
+                    self.environmentCreated.emit(env_name, False, f"uv 命令不可用: {self._uv_error}")
                     return
                 
                 # 创建 pyproject.toml 文件
-                pyproject_content = f'''[project]
-name = "{env_name}"
-version = "0.1.0"
-description = "Virtual environment for {env_name}"
-requires-python = ">={python_version}"
-
-[tool.uv]
-dev-dependencies = []
-'''
-                
                 pyproject_path = env_path / "pyproject.toml"
-                with open(pyproject_path, 'w', encoding='utf-8') as f:
-                    f.write(pyproject_content)
+                pyproject_path.write_text(
+                    PYPROJECT_TEMPLATE.format(name=env_name, python_version=python_version),
+                    encoding='utf-8'
+                )
                 
                 self.logger.info(f"创建 pyproject.toml 文件: {pyproject_path}")
                 
-                # 使用 uv venv 来创建虚拟环境（这会直接创建 .venv 目录）
-                cmd = ["uv", "venv", "--python", f"{python_version}"]
-                self.logger.info(f"执行命令: {' '.join(cmd)}")
-                self.logger.info(f"工作目录: {env_path}")
-                
-                startupinfo = self._get_hidden_subprocess_startupinfo()
-                result = subprocess.run(cmd, check=True, capture_output=True, text=True, 
-                                      timeout=timeout_seconds, cwd=str(env_path), encoding='utf-8', errors='ignore',
-                                      startupinfo=startupinfo)
-                self.logger.info(f"uv venv 输出: {result.stdout}")
-                if result.stderr:
-                    self.logger.info(f"uv venv 错误输出: {result.stderr}")
+                # 优先从模板复制虚拟环境，避免每次都运行 uv venv
+                try:
+                    template_venv = self._ensure_template(python_version, timeout_seconds)
+                    self._clone_template(template_venv, env_path / ".venv", env_name)
+                    self.logger.info(f"已从模板创建虚拟环境: {template_venv}")
+                except (OSError, subprocess.CalledProcessError) as e:
+                    self.logger.warning(f"从模板创建虚拟环境失败，改用 uv venv: {str(e)}")
+                    shutil.rmtree(env_path / ".venv", ignore_errors=True)
+                    
+                    # 使用 uv venv 来创建虚拟环境（这会直接创建 .venv 目录）
+                    self._run_uv_venv([self._uv_path, "venv", "--python", f"{python_version}"], env_path, timeout_seconds)
                     
             except subprocess.TimeoutExpired:
                 self.logger.error(f"环境创建超时: {env_name}，超时时间: {timeout_seconds} 秒")
@@ -152,10 +356,7 @@ dev-dependencies = []
                 return
             
             # 获取Python可执行文件路径
-            if os.name == 'nt':  # Windows
-                python_exe = venv_path / "Scripts" / "python.exe"
-            else:  # Unix/Linux
-                python_exe = venv_path / "bin" / "python"
+            python_exe = venv_path.joinpath(*self._python_rel)
             
             # 获取Python版本信息
             try:
@@ -188,17 +389,42 @@ dev-dependencies = []
             return
         
         # 删除环境目录
-        import shutil
-        shutil.rmtree(env_path)
+        self._fast_rmtree(env_path)
+        self._invalidate_info_cache(env_name)
         
         self.logger.info(f"成功删除虚拟环境: {env_name}")
         self.environmentDeleted.emit(env_name, True, f"环境 '{env_name}' 删除成功")
     
+    @staticmethod
+    def _fast_rmtree(path: Path):
+        """删除目录树；Windows 下交给系统 rmdir 递归删除，失败时回退到 shutil.rmtree"""
+        if os.name == 'nt':
+            subprocess.run(["cmd", "/c", "rmdir", "/s", "/q", str(path)], capture_output=True,
+                           startupinfo=PythonEnvironmentWorker._get_hidden_subprocess_startupinfo())
+            if not path.exists():
+                return
+        
+        def _on_error(func, failed_path, exc):
+            # 只读文件（如 Windows 下的 .pyd）去掉只读属性后重试
+            os.chmod(failed_path, stat.S_IWRITE)
+            func(failed_path)
+        
+        # Python 3.12 起 onerror 已弃用，改用 onexc（回调签名相同，只是第三个参数为异常对象）
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=_on_error)
+        else:
+            shutil.rmtree(path, onerror=_on_error)
+    
     @handle_exceptions(context="刷新环境列表", show_dialog=False, log_level="WARNING")
     def refresh_environments(self):
         """刷新环境列表"""
+        # 上次探测 uv 失败时，下次创建环境重新探测
+        if self._uv_version == "":
+            self._uv_version = None
+        
         self.logger.info(f"开始扫描环境目录: {self.environments_dir}")
         environments = []
+        pending = []
         
         if not self.environments_dir.exists():
             self.logger.warning(f"环境目录不存在: {self.environments_dir}")
@@ -206,54 +432,118 @@ dev-dependencies = []
             return
         
         try:
-            env_dirs = list(self.environments_dir.iterdir())
-            self.logger.info(f"找到 {len(env_dirs)} 个目录")
+            env_names = self._list_environment_dirs()
+            self.logger.info(f"找到 {len(env_names)} 个环境目录")
+            
+            # 并行获取各环境的轻量信息，按原顺序收集结果
+            futures = []
+            for env_name in env_names:
+                self.logger.info(f"扫描环境: {env_name}")
+                futures.append((env_name, self._pool.submit(self._get_env_info_light, env_name)))
             
-            for env_dir in env_dirs:
-                if env_dir.is_dir():
-                    self.logger.info(f"扫描环境: {env_dir.name}")
-                    env_info = self.get_environment_info(env_dir.name)
-                    if env_info:
-                        environments.append(env_info)
-                        self.logger.info(f"成功获取环境信息: {env_dir.name}")
-                    else:
-                        self.logger.warning(f"无法获取环境信息: {env_dir.name}")
+            for env_name, future in futures:
+                env_info, complete = future.result()
+                if env_info:
+                    if not complete:
+                        # 先用轻量信息填充列表，环境大小在线程池中后台计算
+                        pending.append(env_info)
+                        env_info = {k: v for k, v in env_info.items() if k != "mtime"}
+                    environments.append(env_info)
+                    self.logger.info(f"成功获取环境信息: {env_name}")
                 else:
-                    self.logger.debug(f"跳过非目录项: {env_dir.name}")
+                    self.logger.warning(f"无法获取环境信息: {env_name}")
         except Exception as e:
             self.logger.error(f"扫描环境目录时发生错误: {str(e)}")
         
+        # 移除已不存在的环境缓存，有变化时写回磁盘
+        valid_names = {env["name"] for env in environments}
+        with self._info_cache_lock:
+            for name in list(self._info_cache):
+                if name not in valid_names:
+                    del self._info_cache[name]
+                    self._info_cache_dirty = True
+        self._save_info_cache()
+        
         self.logger.info(f"扫描完成，找到 {len(environments)} 个有效环境")
         self.environmentListUpdated.emit(environments)
+        
+        for env_info in pending:
+            self._pool.submit(self._complete_environment_info, env_info)
     
-    @silent_exceptions(return_value=None)
-    def get_environment_info(self, env_name: str) -> Optional[Dict[str, Any]]:
-        """获取环境信息（优化版本，减少外部命令调用）"""
+    def _list_environment_dirs(self) -> List[str]:
+        """列出环境目录名，envs 目录未变化时直接返回缓存的列表"""
+        mtime_ns = self.environments_dir.stat().st_mtime_ns
+        cached_mtime, cached_names = self._envs_dir_listing
+        if cached_mtime == mtime_ns:
+            return cached_names
+        
+        with os.scandir(self.environments_dir) as entries:
+            # 跳过以点开头的目录（如模板目录）
+            env_names = [entry.name for entry in entries if entry.is_dir() and not entry.name.startswith(".")]
+        self._envs_dir_listing = (mtime_ns, env_names)
+        return env_names
+    
+    def _locate_environment(self, env_name: str) -> Optional[Tuple[Path, Path, Path]]:
+        """返回 (环境目录, 虚拟环境根目录, Python可执行文件)，环境无效时返回 None"""
         env_path = self.environments_dir / env_name
         
         if not env_path.exists():
             self.logger.warning(f"环境路径不存在: {env_path}")
             return None
         
-        # 检查是否是 uv init 创建的环境（有 .venv 目录）
+        # 检查是否是 uv init 创建的环境（有 .venv 目录），否则为传统的 venv 环境
         venv_path = env_path / ".venv"
-        if venv_path.exists():
-            # uv init 创建的环境
-            if os.name == 'nt':  # Windows
-                python_exe = venv_path / "Scripts" / "python.exe"
-            else:  # Unix/Linux
-                python_exe = venv_path / "bin" / "python"
-        else:
-            # 传统的 venv 创建的环境
-            if os.name == 'nt':  # Windows
-                python_exe = env_path / "Scripts" / "python.exe"
-            else:  # Unix/Linux
-                python_exe = env_path / "bin" / "python"
+        env_root = venv_path if venv_path.exists() else env_path
+        python_exe = env_root.joinpath(*self._python_rel)
         
         if not python_exe.exists():
             self.logger.warning(f"Python可执行文件不存在: {python_exe}")
             return None
         
+        return env_path, env_root, python_exe
+    
+    def _current_environment_name(self) -> str:
+        """获取当前环境名称"""
+        if hasattr(self.parent(), 'currentEnvironmentName'):
+            return self.parent().currentEnvironmentName
+        return ""
+    
+    @staticmethod
+    def _read_pyvenv_cfg(env_root: str) -> Dict[str, str]:
+        """读取虚拟环境的 pyvenv.cfg，文件不存在或无法读取时返回空字典"""
+        cfg = {}
+        try:
+            with open(os.path.join(env_root, "pyvenv.cfg"), 'r', encoding='utf-8') as f:
+                for line in f:
+                    key, sep, value = line.partition("=")
+                    if sep:
+                        cfg[key.strip()] = value.strip()
+        except OSError:
+            pass
+        return cfg
+    
+    @staticmethod
+    def _base_python_exists(cfg: Dict[str, str]) -> bool:
+        """检查 pyvenv.cfg 记录的基础解释器文件是否仍存在（优先使用 executable，否则在 home 目录下查找）"""
+        executable = cfg.get("executable")
+        if executable:
+            return os.path.isfile(executable)
+        home = cfg.get("home")
+        if not home:
+            return False
+        names = list(BASE_PYTHON_NAMES)
+        version = cfg.get("version_info") or cfg.get("version") or ""
+        if os.name != 'nt' and version.count(".") >= 1:
+            names.insert(0, "python" + ".".join(version.split(".")[:2]))
+        return any(os.path.isfile(os.path.join(home, name)) for name in names)
+    
+    def _read_python_version(self, env_root: Path, python_exe: Path) -> str:
+        """获取环境的Python版本，优先读取 pyvenv.cfg，读取失败时再启动解释器"""
+        cfg = self._read_pyvenv_cfg(env_root)
+        version = cfg.get("version_info") or cfg.get("version")
+        if version:
+            return f"Python {version}"
+        
         # 快速获取Python版本（减少超时时间）
         python_version = "Python 3.11.13"  # 默认版本
         try:
@@ -266,47 +556,97 @@ dev-dependencies = []
             self.logger.debug(f"获取到Python版本: {python_version}")
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             self.logger.warning(f"获取Python版本失败，使用默认版本: {str(e)}")
+        return python_version
+    
+    @silent_exceptions(return_value=(None, True))
+    def _get_env_info_light(self, env_name: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        获取轻量环境信息（不计算环境大小）
+        
+        Returns:
+            (环境信息, 是否已是完整信息)；环境目录未变化时直接返回缓存的完整信息
+        """
+        located = self._locate_environment(env_name)
+        if not located:
+            return None, True
+        env_path, env_root, python_exe = located
+        current_env_name = self._current_environment_name()
+        
+        # 环境目录和 site-packages 未变化时直接使用缓存
+        site_packages = find_site_packages(env_root)
+        mtime_ns = env_root.stat().st_mtime_ns
+        if site_packages:
+            mtime_ns = max(mtime_ns, site_packages.stat().st_mtime_ns)
+        with self._info_cache_lock:
+            cached = self._info_cache.get(env_name)
+        if cached and cached.get("mtime") == mtime_ns and cached.get("info", {}).get("path") == str(env_path):
+            env_info = dict(cached["info"])
+            env_info["is_active"] = env_name == current_env_name
+            self.logger.debug(f"使用缓存的环境信息: {env_name}")
+            return env_info, True
+        
+        # 直接统计 site-packages 中的包元数据，不调用 uv pip list
+        packages_count = len(scan_site_packages(site_packages)) if site_packages else 0
         
-        # 跳过包列表获取（这是最耗时的操作）
-        # 在环境管理界面中，包列表可以通过其他方式获取
-        packages_count = 0
-        
-        # 快速获取环境大小（限制递归深度）
+        env_info = {
+            "name": env_name,
+            "path": str(env_path),
+            "python_version": self._read_python_version(env_root, python_exe),
+            "packages_count": packages_count,
+            "size_mb": 0,
+            "created_time": env_path.stat().st_ctime,
+            "is_active": env_name == current_env_name,
+            "mtime": mtime_ns
+        }
+        return env_info, False
+    
+    def _compute_env_size(self, env_path: Path) -> int:
+        """快速计算环境大小（字节），只统计主要目录，超过上限后停止"""
         total_size = 0
         try:
-            # 只计算主要目录的大小，避免深度递归
-            for item in env_path.iterdir():
-                if item.is_file():
-                    total_size += item.stat().st_size
-                elif item.is_dir() and item.name in ['.venv', 'Scripts', 'bin', 'lib', 'include']:
-                    # 只计算重要目录
-                    for file_path in item.rglob('*'):
-                        if file_path.is_file():
-                            total_size += file_path.stat().st_size
-                            if total_size > 100 * 1024 * 1024:  # 限制最大100MB
-                                break
+            with os.scandir(env_path) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False) and entry.name in ENV_SIZE_DIRS:
+                        # 只计算重要目录
+                        total_size += self._dir_size(entry.path, ENV_SIZE_LIMIT - total_size)
+                    if total_size > ENV_SIZE_LIMIT:
+                        break
         except Exception as e:
             self.logger.warning(f"计算环境大小时发生错误: {str(e)}")
             total_size = 0
+        return total_size
+    
+    def _get_env_info_full(self, env_name: str, light_info: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """在轻量信息的基础上计算环境大小，得到完整信息并写入缓存"""
+        if light_info is None:
+            light_info, complete = self._get_env_info_light(env_name)
+            if light_info is None or complete:
+                return light_info
         
-        # 检查是否为当前环境
-        current_env_name = ""
-        if hasattr(self.parent(), 'currentEnvironmentName'):
-            current_env_name = self.parent().currentEnvironmentName
+        env_info = dict(light_info)
+        mtime_ns = env_info.pop("mtime")
+        env_info["size_mb"] = round(self._compute_env_size(Path(env_info["path"])) / (1024 * 1024), 2)
         
-        env_info = {
-            "name": env_name,
-            "path": str(env_path),
-            "python_version": python_version,
-            "packages_count": packages_count,
-            "size_mb": round(total_size / (1024 * 1024), 2),
-            "created_time": env_path.stat().st_ctime,
-            "is_active": env_name == current_env_name
-        }
+        with self._info_cache_lock:
+            self._info_cache[env_name] = {"mtime": mtime_ns, "info": env_info}
+            self._info_cache_dirty = True
         
         self.logger.debug(f"构建环境信息: {env_info}")
         return env_info
-
+    
+    @silent_exceptions(return_value=None)
+    def get_environment_info(self, env_name: str) -> Optional[Dict[str, Any]]:
+        """获取完整的环境信息（优化版本，减少外部命令调用）"""
+        return self._get_env_info_full(env_name)
+    
+    def _complete_environment_info(self, light_info: Dict[str, Any]):
+        """在线程池中计算完整环境信息，完成后通过 environmentInfoUpdated 通知"""
+        env_info = self._get_env_info_full(light_info["name"], light_info)
+        if env_info:
+            self._save_info_cache()
+            self.environmentInfoUpdated.emit(env_info)
 
 class ConfigBridge(QObject):
     """配置桥接器 - 连接Python配置管理器和QML界面"""
@@ -318,6 +658,7 @@ class ConfigBridge(QObject):
     mirrorSourceAdded = Signal(str, str, int)  # 名称, URL, 优先级
     mirrorSourceRemoved = Signal(str)
     mirrorSourcesChanged = Signal()  # 镜像源列表变化
+    mirrorTestCompleted = Signal(str, bool)  # 镜像源URL, 连接是否成功
     pluginAdded = Signal(str)  # 插件名称
     pluginRemoved = Signal(str)
     
@@ -326,7 +667,18 @@ class ConfigBridge(QObject):
     environmentDeleted = Signal(str, bool, str)  # 环境名, 成功状态, 消息
     environmentListUpdated = Signal(list)  # 环境列表
     environmentsListChanged = Signal()  # 环境列表变化
+    environmentAdded = Signal(str)  # 新增的环境名
+    environmentRemoved = Signal(str)  # 移除的环境名
+    environmentUpdated = Signal(str)  # 信息变化的环境名
     currentEnvironmentChanged = Signal(str)  # 当前环境变化
+    packageOperationFinished = Signal(str, str, bool, str)  # 操作类型, 环境名, 成功状态, 消息
+    environmentTested = Signal(str, bool)  # 环境名, 是否可用
+    environmentPackagesLoaded = Signal(str, list)  # 环境名, 包列表（后台通过 uv 获取时发送）
+    
+    # 内部信号，后台线程完成后排队到主线程处理
+    environmentPackagesListed = Signal(str, object, object)  # 环境名, 获取任务, 包列表（失败时为 None）
+    uvCommandCompleted = Signal(str, str, bool, str)  # 操作类型, 环境名, 成功状态, 消息
+    environmentTestCompleted = Signal(str, object, bool)  # 环境名, 解释器 (修改时间, 大小), 是否可用
     
     # 统一消息提示信号
     showMessageSignal = Signal(str, str, str, int)  # 类型, 标题, 内容, 持续时间
@@ -342,7 +694,28 @@ class ConfigBridge(QObject):
         # 初始化配置管理器
         self.config_manager = ConfigManager("config.toml")
         
+        # 配置属性缓存及默认镜像源URL缓存，配置变化或重新加载时清空
+        self._config_cache = {}
+        self._mirror_url_cache = None
+        
+        # 是否有未保存的配置修改，自动保存时用于快速跳过
+        self._config_dirty = False
+        
+        # 列表变化信号合并：同一事件循环内的多次修改只通知 QML 一次
+        self._mirror_changed_timer = QTimer(self, singleShot=True, interval=0)
+        self._mirror_changed_timer.timeout.connect(self.mirrorSourcesChanged.emit)
+        self._environments_changed_timer = QTimer(self, singleShot=True, interval=0)
+        self._environments_changed_timer.timeout.connect(self._sync_environments_model)
+        self._environments_changed_timer.timeout.connect(self.environmentsListChanged.emit)
+        
+        # 环境列表模型，QML 按行读取，刷新时只更新变化的行
+        self._environments_model = EnvironmentsModel(self)
+        
         # 连接配置管理器信号
+        self.config_manager.config_changed.connect(self._clear_config_cache)
+        self.config_manager.config_changed.connect(self._mark_config_dirty)
+        self.config_manager.config_loaded.connect(self._clear_config_cache)
+        self.config_manager.config_saved.connect(self._clear_config_dirty)
         self.config_manager.config_loaded.connect(self.configLoaded.emit)
         self.config_manager.config_saved.connect(self.configSaved.emit)
         self.config_manager.config_error.connect(self.configError.emit)
@@ -356,20 +729,56 @@ class ConfigBridge(QObject):
         self.save_timer.start(30000)  # 30秒自动保存一次
         
         # 初始化Python环境工作线程
-        self.env_worker = PythonEnvironmentWorker(self)
+        self.env_worker = PythonEnvironmentWorker(self, logger=self.logger)
         self.env_worker.environmentCreated.connect(self._on_environment_created)
         self.env_worker.environmentDeleted.connect(self._on_environment_deleted)
         self.env_worker.environmentListUpdated.connect(self._update_environments_cache)
         self.env_worker.environmentListUpdated.connect(self.environmentListUpdated.emit)
+        self.env_worker.environmentInfoUpdated.connect(self._on_environment_info_updated)
+        self._env_worker_started = False
         
-        # 启动环境工作线程
-        self.env_worker.start()
+        # 环境工作线程延迟到首次使用环境功能时启动，避免拖慢应用启动
+        
+        # 应用退出时关闭环境工作线程的线程池
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.env_worker.shutdown)
+            app.aboutToQuit.connect(self.config_manager.flush_pending_save)
         
-        # 环境列表缓存
+        # 安装、卸载、同步等 uv 命令在后台线程执行，避免阻塞界面
+        self._exec = ThreadPoolExecutor(max_workers=4)
+        # 会修改环境的 uv 操作（安装、卸载、同步）排队在同一个后台线程依次执行，避免并发争用环境锁
+        self._uv_exec = ThreadPoolExecutor(max_workers=1)
+        if app:
+            app.aboutToQuit.connect(lambda: self._exec.shutdown(wait=False))
+            app.aboutToQuit.connect(lambda: self._uv_exec.shutdown(wait=False, cancel_futures=True))
+        
+        # uv 可执行文件的绝对路径，找不到可执行文件时重新查找
+        self._uv_path = shutil.which("uv") or "uv"
+        
+        # 环境列表缓存、按名称索引及Python可执行文件路径缓存
         self._environments_cache = []
+        self._env_by_name = {}
+        self._active_env_name = None
+        self._python_exe_cache = {}
+        
+        # 环境包列表缓存 {环境名: (缓存时间, 包列表)}，安装/卸载/同步成功后失效
+        self._pkg_cache = {}
+        
+        # 正在后台获取的包列表 {环境名: {"proc": uv 进程, "cancelled": 是否已取消}}，只在主线程增删
+        # 同一环境获取未完成时复用该任务；proc 和 cancelled 由后台线程和主线程在 _pkg_list_lock 内读写
+        self._pkg_list_jobs = {}
+        self._pkg_list_lock = threading.Lock()
+        # 后台线程的获取结果排队到主线程处理，缓存只在主线程中修改
+        self.environmentPackagesListed.connect(self._on_environment_packages_listed, Qt.QueuedConnection)
+        self.uvCommandCompleted.connect(self._on_uv_command_completed, Qt.QueuedConnection)
+        self.environmentTestCompleted.connect(self._on_environment_test_completed, Qt.QueuedConnection)
         
-        # 镜像源列表缓存
-        self._mirror_sources_cache = self.config_manager.get("mirrors.sources", [])
+        # 环境测试通过记录 {环境名: (解释器修改时间, 解释器大小)}，解释器变化或安装/卸载后失效
+        self._test_cache = {}
+        
+        # 镜像源列表缓存及按名称索引
+        self._set_mirror_sources_cache(self.config_manager.get_mirror_sources())
         
         # 从配置文件加载已保存的环境信息（快速加载）
         self._load_environments_from_config()
@@ -379,23 +788,23 @@ class ConfigBridge(QObject):
     @Property(str, constant=True)
     def appName(self) -> str:
         """应用名称"""
-        return self.config_manager.get("app.name", "Tuleaj Plugin Aggregator")
+        return self._get_cached_config("app.name", "Tuleaj Plugin Aggregator")
     
     @Property(str, constant=True)
     def appVersion(self) -> str:
         """应用版本"""
-        return self.config_manager.get("app.version", "1.0.0")
+        return self._get_cached_config("app.version", "1.0.0")
     
     @Property(str, constant=True)
     def logLevel(self) -> str:
         """日志级别"""
-        return self.config_manager.get("logging.log_level", "INFO")
+        return self._get_cached_config("logging.log_level", "INFO")
     
     # === UI配置属性 ===
     @Property(str, constant=True)
     def theme(self) -> str:
         """主题"""
-        return self.config_manager.get("ui.theme", "auto")
+        return self._get_cached_config("ui.theme", "auto")
     
     # 移除不再需要的UI配置属性，因为配置文件中只有theme是有用的
     
@@ -403,64 +812,75 @@ class ConfigBridge(QObject):
     @Property(str, constant=True)
     def defaultEnvironment(self) -> str:
         """默认环境"""
-        return self.config_manager.get("environments.default", "python3.11")
+        return self._get_cached_config("environments.default", "python3.11")
     
     @Property(list, constant=True)
     def availableEnvironments(self) -> List[str]:
         """可用环境列表"""
-        return self.config_manager.get("environments.available", ["python3.11", "python3.12"])
+        return self._get_cached_config("environments.available", ["python3.11", "python3.12"])
     
     @Property(list, notify=environmentsListChanged)
     def environmentsList(self) -> List[Dict[str, Any]]:
         """环境列表（包含详细信息）"""
+        self._ensure_env_worker_started()
         return self._environments_cache
     
+    @Property(QObject, constant=True)
+    def environmentsModel(self) -> EnvironmentsModel:
+        """环境列表模型（供 ListView 使用）"""
+        self._ensure_env_worker_started()
+        return self._environments_model
+    
+    def _sync_environments_model(self):
+        """将环境列表缓存同步到列表模型"""
+        self._environments_model.set_environments(self._environments_cache)
+    
     @Property(str, notify=currentEnvironmentChanged)
     def currentEnvironmentName(self) -> str:
         """当前环境名称"""
-        return self.config_manager.get("environments.current", "")
+        return self._get_cached_config("environments.current", "")
     
     @Property(str, notify=currentEnvironmentChanged)
     def currentEnvironmentPath(self) -> str:
         """当前环境路径"""
-        return self.config_manager.get("environments.current_path", "")
+        return self._get_cached_config("environments.current_path", "")
     
     @Property(str, notify=currentEnvironmentChanged)
     def currentPythonVersion(self) -> str:
         """当前Python版本"""
-        return self.config_manager.get("environments.current_python_version", "")
+        return self._get_cached_config("environments.current_python_version", "")
     
     # === 插件配置属性 ===
     @Property(str, constant=True)
     def pluginDirectory(self) -> str:
         """插件目录"""
-        return self.config_manager.get("plugins.directory", "plugins")
+        return self._get_cached_config("plugins.directory", "plugins")
     
     @Property(bool, constant=True)
     def autoScan(self) -> bool:
         """自动扫描"""
-        return self.config_manager.get("plugins.auto_scan", True)
+        return self._get_cached_config("plugins.auto_scan", True)
     
     @Property(int, constant=True)
     def pluginTimeout(self) -> int:
         """插件超时时间"""
-        return self.config_manager.get("plugins.plugin_timeout_seconds", 30)
+        return self._get_cached_config("plugins.plugin_timeout_seconds", 30)
     
     @Property(list, constant=True)
     def installedPlugins(self) -> List[Dict[str, Any]]:
         """已安装插件列表"""
-        return self.config_manager.get("plugins.installed_plugins", [])
+        return self._get_cached_config("plugins.installed_plugins", [])
     
     # === 镜像源配置属性 ===
     @Property(bool, constant=True)
     def mirrorEnabled(self) -> bool:
         """镜像源是否启用"""
-        return self.config_manager.get("mirrors.enabled", True)
+        return self._get_cached_config("mirrors.enabled", True)
     
     @Property(str, constant=True)
     def defaultMirrorSource(self) -> str:
         """默认镜像源"""
-        return self.config_manager.get("mirrors.default_source", "tsinghua")
+        return self._get_cached_config("mirrors.default_source", "tsinghua")
     
     @Property(list, notify=mirrorSourcesChanged)
     def mirrorSources(self) -> List[Dict[str, Any]]:
@@ -470,23 +890,23 @@ class ConfigBridge(QObject):
     @Property(int, constant=True)
     def mirrorTimeout(self) -> int:
         """镜像源超时时间"""
-        return self.config_manager.get("mirrors.timeout_seconds", 30)
+        return self._get_cached_config("mirrors.timeout_seconds", 30)
     
     @Property(int, constant=True)
     def mirrorRetryCount(self) -> int:
         """镜像源重试次数"""
-        return self.config_manager.get("mirrors.retry_count", 3)
+        return self._get_cached_config("mirrors.retry_count", 3)
     
     @Property(bool, constant=True)
     def sslVerify(self) -> bool:
         """SSL验证"""
-        return self.config_manager.get("mirrors.verify_ssl", True)
+        return self._get_cached_config("mirrors.verify_ssl", True)
     
     # === 高级配置属性 ===
     @Property(bool, constant=True)
     def debugMode(self) -> bool:
         """调试模式"""
-        return self.config_manager.get("advanced.debug_mode", False)
+        return self._get_cached_config("advanced.debug_mode", False)
     
     # === 配置操作方法 ===
     @Slot(str, result=bool)
@@ -522,39 +942,44 @@ class ConfigBridge(QObject):
     @Slot(str, str, int, result=bool)
     def addMirrorSource(self, name: str, url: str, priority: int) -> bool:
         """添加镜像源"""
-        result = self.config_manager.add_mirror_source(name, url, priority)
+        result, sources = self.config_manager.add_mirror_source(name, url, priority)
         if result:
             # 更新缓存
-            self._mirror_sources_cache = self.config_manager.get("mirrors.sources", [])
+            self._set_mirror_sources_cache(sources)
             self.mirrorSourceAdded.emit(name, url, priority)
-            self.mirrorSourcesChanged.emit()  # 触发镜像源列表变化信号
+            self._mirror_changed_timer.start()  # 合并触发镜像源列表变化信号
         return result
     
     @Slot(str, result=bool)
     def removeMirrorSource(self, name: str) -> bool:
         """移除镜像源"""
-        result = self.config_manager.remove_mirror_source(name)
+        result, sources = self.config_manager.remove_mirror_source(name)
         if result:
             # 更新缓存
-            self._mirror_sources_cache = self.config_manager.get("mirrors.sources", [])
+            self._set_mirror_sources_cache(sources)
             self.mirrorSourceRemoved.emit(name)
-            self.mirrorSourcesChanged.emit()  # 触发镜像源列表变化信号
+            self._mirror_changed_timer.start()  # 合并触发镜像源列表变化信号
         return result
     
     @Slot(str, bool, result=bool)
     def setMirrorSourceEnabled(self, name: str, enabled: bool) -> bool:
         """设置镜像源启用状态"""
-        result = self.config_manager.set_mirror_source_enabled(name, enabled)
+        result, sources = self.config_manager.set_mirror_source_enabled(name, enabled)
         if result:
             # 更新缓存
-            self._mirror_sources_cache = self.config_manager.get("mirrors.sources", [])
-            self.mirrorSourcesChanged.emit()  # 触发镜像源列表变化信号
+            self._set_mirror_sources_cache(sources)
+            self._mirror_changed_timer.start()  # 合并触发镜像源列表变化信号
         return result
     
     @Slot(str, str, int, result=bool)
     def updateMirrorSource(self, name: str, url: str = None, priority: int = None) -> bool:
         """更新镜像源"""
-        return self.config_manager.update_mirror_source(name, url, priority)
+        result, sources = self.config_manager.update_mirror_source(name, url, priority)
+        if result:
+            # 优先级可能变化，更新缓存
+            self._set_mirror_sources_cache(sources)
+            self._mirror_changed_timer.start()  # 合并触发镜像源列表变化信号
+        return result
     
     @Slot(int, result=bool)
     def setMirrorTimeout(self, timeout: int) -> bool:
@@ -634,24 +1059,40 @@ class ConfigBridge(QObject):
         """获取配置统计信息"""
         return self.config_manager.get_config_stats()
     
+    def _mark_config_dirty(self, *args):
+        """标记配置有未保存的修改"""
+        self._config_dirty = True
+    
+    def _clear_config_dirty(self, *args):
+        """配置保存后清除修改标记"""
+        self._config_dirty = False
+    
     def auto_save_config(self):
         """自动保存配置"""
+        # 没有修改时直接返回，避免每次都深度比较整个配置
+        if not self._config_dirty:
+            return
         if self.config_manager.has_changes():
             self.config_manager.save_config()
+        else:
+            self._config_dirty = False
+    
+    @Slot(str)
+    def testMirrorConnectionAsync(self, url: str):
+        """在线程池中异步测试镜像源连接，结果通过 mirrorTestCompleted 信号返回"""
+        QThreadPool.globalInstance().start(MirrorTestTask(self, url, self.mirrorTimeout))
     
     @Slot(str, result=bool)
     def testMirrorConnection(self, url: str) -> bool:
+        """同步测试镜像源连接（会阻塞调用线程，界面请使用 testMirrorConnectionAsync）"""
+        return self._check_mirror_connection(url, self.mirrorTimeout)
+    
+    def _check_mirror_connection(self, url: str, timeout: int) -> bool:
         """测试镜像源连接"""
         try:
-            import urllib.request
-            import urllib.error
-            
             # 构建测试URL
             test_url = url.rstrip('/') + '/simple/'
             
-            # 设置超时时间
-            timeout = self.mirrorTimeout
-            
             # 创建请求
             request = urllib.request.Request(test_url)
             request.add_header('User-Agent', 'Tuleaj Plugin Aggregator/1.0')
@@ -681,32 +1122,29 @@ class ConfigBridge(QObject):
     @Slot(str, result='QVariantMap')
     def getMirrorSourceByName(self, name: str) -> Optional[Dict[str, Any]]:
         """根据名称获取镜像源信息"""
-        sources = self.mirrorSources
-        for source in sources:
-            if source.get("name") == name:
-                return source
-        return None
+        return self._mirror_by_name.get(name)
     
     @Slot(result='QVariantList')
     def getEnabledMirrorSources(self) -> List[Dict[str, Any]]:
         """获取启用的镜像源列表（按优先级排序）"""
-        sources = self.mirrorSources
-        # 过滤启用的镜像源
-        enabled_sources = [source for source in sources if source.get("enabled", True)]
-        # 按优先级排序
-        enabled_sources.sort(key=lambda x: x.get("priority", 999))
-        return enabled_sources
+        return self._enabled_sorted_mirrors
     
     @Slot(result=str)
     def getDefaultMirrorUrl(self) -> str:
-        """获取默认镜像源的URL"""
+        """获取默认镜像源的URL（结果缓存到镜像源或配置变化时）"""
+        if self._mirror_url_cache is None:
+            self._mirror_url_cache = self._resolve_default_mirror_url()
+        return self._mirror_url_cache
+    
+    def _resolve_default_mirror_url(self) -> str:
+        """查找默认镜像源的URL"""
         default_source = self.defaultMirrorSource
         sources = self.mirrorSources
         
         # 首先尝试找到默认的镜像源
-        for source in sources:
-            if source.get("name") == default_source and source.get("enabled", True):
-                return source.get("url", "https://pypi.org/simple/")
+        source = self._mirror_by_name.get(default_source)
+        if source and source.get("enabled", True):
+            return source.get("url", "https://pypi.org/simple/")
         
         # 如果默认镜像源不可用，返回第一个启用的镜像源
         for source in sources:
@@ -716,6 +1154,15 @@ class ConfigBridge(QObject):
         # 如果都没有启用的，返回默认URL
         return "https://pypi.org/simple/"
     
+    def _build_uv_cmd(self, subcmd: Tuple[str, ...], python_exe: str, with_mirror: bool = False) -> List[str]:
+        """构建在指定环境中执行的 uv 命令，with_mirror 为 True 且启用镜像源时附加 --index-url"""
+        cmd = [self._uv_path, *subcmd, "--python", python_exe]
+        if with_mirror and self.mirrorEnabled:
+            mirror_url = self.getDefaultMirrorUrl()
+            cmd += ["--index-url", mirror_url]
+            self.logger.info(f"使用镜像源: {mirror_url}")
+        return cmd
+    
     # === Python环境管理方法 ===
     @Slot(str, str, int, result=bool)
     @handle_exceptions(context="创建虚拟环境", show_dialog=False, log_level="ERROR", return_value=False)
@@ -726,11 +1173,12 @@ class ConfigBridge(QObject):
             return False
         
         # 验证环境名称
-        if not env_name.replace("_", "").replace("-", "").isalnum():
+        if not ENV_NAME_PATTERN.fullmatch(env_name.strip()):
             self.configError.emit("环境名称只能包含字母、数字、下划线和连字符")
             return False
         
         # 通过信号在工作线程中创建环境
+        self._ensure_env_worker_started()
         self.env_worker.createEnvironmentRequested.emit(env_name.strip(), python_version, timeout_seconds)
         return True
     
@@ -748,6 +1196,7 @@ class ConfigBridge(QObject):
             return False
         
         # 在工作线程中删除环境
+        self._ensure_env_worker_started()
         self.env_worker.delete_environment(env_name)
         return True
     
@@ -757,7 +1206,10 @@ class ConfigBridge(QObject):
         # 首先尝试从配置文件加载已保存的环境信息
         self._load_environments_from_config()
         
-        # 然后启动工作线程重新扫描环境
+        # 然后启动工作线程重新扫描环境；线程刚启动且没有已保存的环境信息时，
+        # run() 会自行扫描，这里不再重复扫描
+        if self._ensure_env_worker_started() and not self._environments_cache:
+            return True
         self.env_worker.refresh_environments()
         return True
     
@@ -768,21 +1220,20 @@ class ConfigBridge(QObject):
             self.configError.emit("环境名称不能为空")
             return False
         
-        # 查找环境信息
-        env_info = None
-        for env in self._environments_cache:
-            if env.get("name") == env_name:
-                env_info = env
-                break
+        self._ensure_env_worker_started()
         
+        # 查找环境信息
+        env_info = self._env_by_name.get(env_name)
         if not env_info:
             self.configError.emit(f"环境 '{env_name}' 不存在")
             return False
         
         # 更新当前环境配置
-        self.config_manager.set("environments.current", env_name)
-        self.config_manager.set("environments.current_path", env_info.get("path", ""))
-        self.config_manager.set("environments.current_python_version", env_info.get("python_version", ""))
+        self.config_manager.set_many("environments", {
+            "current": env_name,
+            "current_path": env_info.get("path", ""),
+            "current_python_version": env_info.get("python_version", ""),
+        })
         
         # 更新环境列表中的激活状态
         self._update_environment_active_status(env_name)
@@ -799,86 +1250,188 @@ class ConfigBridge(QObject):
     @Slot(str, result='QVariantMap')
     def getEnvironmentInfo(self, env_name: str) -> Optional[Dict[str, Any]]:
         """获取环境详细信息"""
-        for env in self._environments_cache:
-            if env.get("name") == env_name:
-                return env
-        return None
+        return self._env_by_name.get(env_name)
     
     @Slot(str, result=bool)
     def testEnvironment(self, env_name: str) -> bool:
-        """测试环境是否可用"""
+        """测试环境是否可用（后台执行，结果通过 environmentTested 通知），返回测试是否已开始"""
         env_info = self.getEnvironmentInfo(env_name)
         if not env_info:
             return False
         
+        python_exe = self._get_python_exe(env_info)
+        if not python_exe:
+            return False
+        
+        # 解释器文件未变化且上次测试通过时直接返回结果
+        try:
+            st = os.stat(python_exe)
+        except OSError:
+            return False
+        test_key = (st.st_mtime_ns, st.st_size)
+        if self._test_cache.get(env_name) == test_key:
+            self.environmentTested.emit(env_name, True)
+            return True
+        
+        # 虚拟环境的 pyvenv.cfg 记录了版本且基础解释器文件仍存在时无需启动解释器，否则以实际启动的结果为准
+        # （可执行文件位于 <venv>/Scripts 或 <venv>/bin）
+        cfg = PythonEnvironmentWorker._read_pyvenv_cfg(os.path.dirname(os.path.dirname(python_exe)))
+        if (cfg.get("version_info") or cfg.get("version")) and PythonEnvironmentWorker._base_python_exists(cfg):
+            self._test_cache[env_name] = test_key
+            self.environmentTested.emit(env_name, True)
+            return True
+        
+        self._exec.submit(self._run_environment_test, env_name, python_exe, test_key)
+        return True
+    
+    def _run_environment_test(self, env_name: str, python_exe: str, test_key: Tuple[int, int]):
+        """在后台线程中启动解释器测试环境是否可用，结果交给主线程处理"""
         try:
-            env_path = Path(env_info.get("path", ""))
-            if not env_path.exists():
-                return False
-            
-            # 获取Python可执行文件路径
-            if os.name == 'nt':  # Windows
-                python_exe = env_path / "Scripts" / "python.exe"
-            else:  # Unix/Linux
-                python_exe = env_path / "bin" / "python"
-            
-            if not python_exe.exists():
-                return False
-            
             # 测试Python是否可执行
             startupinfo = PythonEnvironmentWorker._get_hidden_subprocess_startupinfo()
-            result = subprocess.run([str(python_exe), "--version"], 
-                                  capture_output=True, text=True, timeout=10, startupinfo=startupinfo)
-            return result.returncode == 0
-            
+            result = subprocess.run([python_exe, "--version"], 
+                                    capture_output=True, text=True, timeout=10, startupinfo=startupinfo)
+            available = result.returncode == 0
         except Exception as e:
             self.logger.error(f"测试环境时发生错误: {str(e)}")
+            available = False
+        self.environmentTestCompleted.emit(env_name, test_key, available)
+    
+    @Slot(str, object, bool)
+    def _on_environment_test_completed(self, env_name: str, test_key: Tuple[int, int], available: bool):
+        """在主线程中记录环境测试结果并通知前端"""
+        if available:
+            self._test_cache[env_name] = test_key
+        else:
+            self._test_cache.pop(env_name, None)
+        self.environmentTested.emit(env_name, available)
+    
+    def _get_cached_config(self, key: str, default: Any = None) -> Any:
+        """读取配置值并缓存，避免QML属性求值时重复遍历配置字典"""
+        try:
+            return self._config_cache[key]
+        except KeyError:
+            value = self._config_cache[key] = self.config_manager.get(key, default)
+            return value
+    
+    def _clear_config_cache(self, *args):
+        """清空配置属性缓存"""
+        self._config_cache.clear()
+        self._mirror_url_cache = None
+    
+    def _set_mirror_sources_cache(self, sources: List[Dict[str, Any]]):
+        """更新镜像源缓存并重建名称索引"""
+        self._mirror_sources_cache = sources
+        self._mirror_by_name = {source.get("name"): source for source in sources}
+        self._mirror_url_cache = None
+        self._rebuild_enabled_sorted()
+    
+    def _rebuild_enabled_sorted(self):
+        """重建启用镜像源的优先级排序视图"""
+        self._enabled_sorted_mirrors = sorted(
+            (source for source in self._mirror_sources_cache if source.get("enabled", True)),
+            key=MIRROR_PRIORITY_KEY
+        )
+    
+    def _set_environments_cache(self, environments: List[Dict[str, Any]]):
+        """更新环境列表缓存并重建名称索引"""
+        self._environments_cache = environments
+        self._env_by_name = {env.get("name"): env for env in environments}
+        self._active_env_name = next((env.get("name") for env in environments if env.get("is_active")), None)
+        self._python_exe_cache = {}
+    
+    def _get_python_exe(self, env_info: Dict[str, Any]) -> Optional[str]:
+        """获取环境的Python可执行文件路径，不存在时返回 None（按环境名缓存，环境列表更新时清空）"""
+        env_name = env_info.get("name")
+        try:
+            return self._python_exe_cache[env_name]
+        except KeyError:
+            pass
+        
+        # uv 创建的环境位于 .venv 目录下，否则为传统的 venv 环境；可执行文件存在即说明环境有效，每个候选只需一次 stat
+        env_path = env_info.get("path", "")
+        python_exe = None
+        for candidate in (os.path.join(env_path, ".venv", *VENV_PYTHON_REL), os.path.join(env_path, *VENV_PYTHON_REL)):
+            if env_path and os.path.isfile(candidate):
+                python_exe = candidate
+                break
+        
+        self._python_exe_cache[env_name] = python_exe
+        return python_exe
+    
+    def _ensure_env_worker_started(self) -> bool:
+        """首次使用环境功能时启动环境工作线程，返回本次调用是否启动了线程"""
+        if self._env_worker_started:
             return False
+        self._env_worker_started = True
+        self.env_worker.start()
+        return True
     
     def _update_environments_cache(self, environments: List[Dict[str, Any]]):
-        """更新环境列表缓存"""
+        """更新环境列表缓存，只对新增、移除和变化的环境发送信号"""
         self.logger.info(f"更新环境缓存，收到 {len(environments)} 个环境")
-        for i, env in enumerate(environments):
-            self.logger.info(f"环境 {i+1}: {env}")
-        
-        self._environments_cache = environments
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(f"环境列表: {environments}")
+        
+        old_by_name = self._env_by_name
+        old_order = [env.get("name") for env in self._environments_cache]
+        self._set_environments_cache(environments)
+        new_by_name = self._env_by_name
+        
+        added = [name for name in new_by_name if name not in old_by_name]
+        removed = [name for name in old_by_name if name not in new_by_name]
+        updated = [name for name, env in new_by_name.items()
+                   if name in old_by_name and old_by_name[name] != env]
+        order_changed = old_order != [env.get("name") for env in environments]
+        
+        if not (added or removed or updated or order_changed):
+            self.logger.debug("环境列表未变化，跳过保存和通知")
+            return
         
         # 将环境信息保存到配置文件
         self._save_environments_to_config(environments)
         
+        # 发送逐个环境的变化信号
+        for name in added:
+            self.environmentAdded.emit(name)
+        for name in removed:
+            self.environmentRemoved.emit(name)
+        for name in updated:
+            self.environmentUpdated.emit(name)
+        
         # 发送属性变化信号
-        self.environmentsListChanged.emit()
+        self._environments_changed_timer.start()
+    
+    def _on_environment_info_updated(self, env_info: Dict[str, Any]):
+        """后台计算出完整环境信息后，替换缓存中对应的条目"""
+        name = env_info.get("name")
+        if name not in self._env_by_name:
+            return
+        environments = [env_info if env.get("name") == name else env for env in self._environments_cache]
+        self._update_environments_cache(environments)
     
     def _save_environments_to_config(self, environments: List[Dict[str, Any]]):
         """将环境信息保存到配置文件"""
         try:
-            self.logger.info(f"开始保存环境信息到配置文件，共 {len(environments)} 个环境")
-            
             # 更新配置文件中的扫描环境信息
-            result = self.config_manager.set("environments.scanned_environments", environments)
-            self.logger.info(f"设置环境信息到配置管理器: {result}")
+            self.config_manager.set("environments.scanned_environments", environments)
             
             # 如果有环境，设置第一个为当前环境（如果没有设置的话）
             if environments and not self.config_manager.get("environments.current"):
                 first_env = environments[0]
-                self.config_manager.set("environments.current", first_env.get("name", ""))
-                self.config_manager.set("environments.current_path", first_env.get("path", ""))
-                self.config_manager.set("environments.current_python_version", first_env.get("python_version", ""))
+                self.config_manager.set_many("environments", {
+                    "current": first_env.get("name", ""),
+                    "current_path": first_env.get("path", ""),
+                    "current_python_version": first_env.get("python_version", ""),
+                })
                 self.logger.info(f"设置当前环境: {first_env.get('name', '')}")
             
-            # 保存配置
-            save_result = self.config_manager.save_config()
-            self.logger.info(f"保存配置文件结果: {save_result}")
-            
-            if save_result:
-                self.logger.info(f"环境信息已保存到配置文件，共 {len(environments)} 个环境")
-            else:
-                self.logger.error("保存配置文件失败")
+            # 延迟保存配置，与随后的激活状态更新合并为一次写入
+            self.config_manager.request_save()
+            self.logger.info(f"环境信息已更新到配置，共 {len(environments)} 个环境")
             
         except Exception as e:
-            self.logger.error(f"保存环境信息到配置文件失败: {str(e)}")
-            import traceback
-            self.logger.error(f"详细错误信息: {traceback.format_exc()}")
+            self.logger.exception(f"保存环境信息到配置文件失败: {str(e)}")
     
     def _load_environments_from_config(self):
         """从配置文件加载环境信息"""
@@ -887,7 +1440,7 @@ class ConfigBridge(QObject):
             saved_environments = self.config_manager.get("environments.scanned_environments", [])
             
             if saved_environments:
-                self._environments_cache = saved_environments
+                self._set_environments_cache(saved_environments)
                 self.logger.info(f"从配置文件加载了 {len(saved_environments)} 个环境信息")
                 
                 # 更新当前环境的激活状态
@@ -896,28 +1449,32 @@ class ConfigBridge(QObject):
                     self._update_environment_active_status(current_env)
                 
                 # 发送属性变化信号，通知前端更新
-                self.environmentsListChanged.emit()
+                self._environments_changed_timer.start()
             else:
                 self.logger.info("配置文件中没有保存的环境信息")
                 
         except Exception as e:
-            self.logger.error(f"从配置文件加载环境信息失败: {str(e)}")
-            import traceback
-            self.logger.error(f"详细错误信息: {traceback.format_exc()}")
+            self.logger.exception(f"从配置文件加载环境信息失败: {str(e)}")
     
     def _update_environment_active_status(self, active_env_name: str):
-        """更新环境列表中的激活状态"""
+        """更新环境列表中的激活状态（只修改状态发生变化的环境，未变化时不写配置）"""
         try:
-            # 更新缓存中的激活状态
-            for env in self._environments_cache:
-                env["is_active"] = (env.get("name") == active_env_name)
+            if active_env_name == self._active_env_name:
+                return
+            
+            # 只需更新原激活环境和新激活环境
+            for name in (self._active_env_name, active_env_name):
+                env = self._env_by_name.get(name)
+                if env is not None:
+                    env["is_active"] = (name == active_env_name)
+            self._active_env_name = active_env_name
             
-            # 保存到配置文件
+            # 保存到配置文件（延迟合并写入）
             self.config_manager.set("environments.scanned_environments", self._environments_cache)
-            self.config_manager.save_config()
+            self.config_manager.request_save()
             
             # 发送信号通知前端更新
-            self.environmentsListChanged.emit()
+            self._environments_changed_timer.start()
             self.currentEnvironmentChanged.emit(active_env_name)
             
             self.logger.info(f"更新环境激活状态: {active_env_name}")
@@ -926,116 +1483,192 @@ class ConfigBridge(QObject):
             self.logger.error(f"更新环境激活状态失败: {str(e)}")
     
     # === uv特有的环境管理方法 ===
+    def _run_uv_in_background(self, operation: str, env_name: str, cmd: List[str], success_message: str):
+        """在 uv 操作队列中执行命令，完成后通过 packageOperationFinished 信号通知结果"""
+        self._uv_exec.submit(self._run_uv_command, operation, env_name, cmd, success_message)
+    
+    def _run_uv_command(self, operation: str, env_name: str, cmd: List[str], success_message: str):
+        """在后台线程执行 uv 命令，只收集结果，缓存失效和通知交给主线程处理"""
+        try:
+            # 成功时不需要输出，只保留 stderr 的原始字节，失败时再解码
+            startupinfo = PythonEnvironmentWorker._get_hidden_subprocess_startupinfo()
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, startupinfo=startupinfo)
+            success = result.returncode == 0
+            if success:
+                message = success_message
+            else:
+                message = result.stderr.decode('utf-8', errors='replace').strip() or f"命令退出码: {result.returncode}"
+        except Exception as e:
+            success, message = False, str(e)
+        self.uvCommandCompleted.emit(operation, env_name, success, message)
+    
+    @Slot(str, str, bool, str)
+    def _on_uv_command_completed(self, operation: str, env_name: str, success: bool, message: str):
+        """在主线程中处理 uv 命令结果：成功时使环境缓存失效，然后通知前端"""
+        if success:
+            self._pkg_cache.pop(env_name, None)
+            self._test_cache.pop(env_name, None)
+            self.logger.info(message)
+        else:
+            # uv 可执行文件被移动或删除时重新查找
+            if not os.path.isfile(self._uv_path):
+                self._uv_path = shutil.which("uv") or "uv"
+            self.logger.error(f"{operation}失败: {message}")
+        self.packageOperationFinished.emit(operation, env_name, success, message)
+    
     @Slot(str, str, result=bool)
     @handle_exceptions(context="安装包", show_dialog=False, log_level="ERROR", return_value=False)
     def installPackage(self, env_name: str, package_name: str) -> bool:
-        """使用uv在指定环境中安装包"""
+        """使用uv在指定环境中安装包（后台执行，结果通过 packageOperationFinished 通知）"""
         env_info = self.getEnvironmentInfo(env_name)
         if not env_info:
             self.configError.emit(f"环境 '{env_name}' 不存在")
             return False
         
-        env_path = Path(env_info.get("path", ""))
-        if not env_path.exists():
-            self.configError.emit(f"环境路径不存在: {env_path}")
+        python_exe = self._get_python_exe(env_info)
+        if not python_exe:
+            self.configError.emit(f"环境中的Python可执行文件不存在: {env_info.get('path', '')}")
             return False
         
         # 构建uv安装命令
-        cmd = ["uv", "pip", "install", package_name, "--python", str(env_path / ("Scripts" if os.name == 'nt' else "bin") / "python.exe")]
-        
-        # 如果启用了镜像源，添加镜像源参数
-        if self.mirrorEnabled:
-            mirror_url = self.getDefaultMirrorUrl()
-            cmd.extend(["--index-url", mirror_url])
-            self.logger.info(f"使用镜像源安装包: {mirror_url}")
-        
-        startupinfo = PythonEnvironmentWorker._get_hidden_subprocess_startupinfo()
-        subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='replace', startupinfo=startupinfo)
-        
-        self.logger.info(f"在环境 {env_name} 中成功安装包: {package_name}")
+        cmd = self._build_uv_cmd(("pip", "install", package_name), python_exe, with_mirror=True)
+        self._run_uv_in_background("安装包", env_name, cmd, f"在环境 {env_name} 中成功安装包: {package_name}")
         return True
     
     @Slot(str, str, result=bool)
     @handle_exceptions(context="卸载包", show_dialog=False, log_level="ERROR", return_value=False)
     def uninstallPackage(self, env_name: str, package_name: str) -> bool:
-        """使用uv在指定环境中卸载包"""
+        """使用uv在指定环境中卸载包（后台执行，结果通过 packageOperationFinished 通知）"""
         env_info = self.getEnvironmentInfo(env_name)
         if not env_info:
             self.configError.emit(f"环境 '{env_name}' 不存在")
             return False
         
-        env_path = Path(env_info.get("path", ""))
-        if not env_path.exists():
-            self.configError.emit(f"环境路径不存在: {env_path}")
+        python_exe = self._get_python_exe(env_info)
+        if not python_exe:
+            self.configError.emit(f"环境中的Python可执行文件不存在: {env_info.get('path', '')}")
             return False
         
         # 使用uv卸载包
-        cmd = ["uv", "pip", "uninstall", package_name, "--python", str(env_path / ("Scripts" if os.name == 'nt' else "bin") / "python.exe")]
-        startupinfo = PythonEnvironmentWorker._get_hidden_subprocess_startupinfo()
-        subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='replace', startupinfo=startupinfo)
-        
-        self.logger.info(f"在环境 {env_name} 中成功卸载包: {package_name}")
+        cmd = self._build_uv_cmd(("pip", "uninstall", package_name), python_exe)
+        self._run_uv_in_background("卸载包", env_name, cmd, f"在环境 {env_name} 中成功卸载包: {package_name}")
         return True
     
     @Slot(str, result='QVariantList')
     @silent_exceptions(return_value=[])
     def getEnvironmentPackages(self, env_name: str) -> List[Dict[str, Any]]:
-        """获取环境中已安装的包列表"""
+        """
+        获取环境中已安装的包列表
+        
+        需要调用 uv 时返回空列表，结果稍后通过 environmentPackagesLoaded 发送，
+        此时 isLoadingEnvironmentPackages() 返回 True，可以据此区分"正在获取"和"没有安装任何包"
+        """
         env_info = self.getEnvironmentInfo(env_name)
         if not env_info:
             return []
         
-        env_path = Path(env_info.get("path", ""))
-        if not env_path.exists():
+        python_exe = self._get_python_exe(env_info)
+        if not python_exe:
             return []
         
-        python_exe = env_path / ("Scripts" if os.name == 'nt' else "bin") / "python.exe"
+        cached = self._pkg_cache.get(env_name)
+        if cached and time.monotonic() - cached[0] < PACKAGE_CACHE_TTL:
+            return cached[1]
         
-        # 使用uv获取包列表
-        cmd = ["uv", "pip", "list", "--python", str(python_exe)]
-        startupinfo = PythonEnvironmentWorker._get_hidden_subprocess_startupinfo()
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace', startupinfo=startupinfo)
+        # 优先直接读取 site-packages，避免启动子进程（可执行文件位于 <venv>/Scripts 或 <venv>/bin）
+        site_packages = find_site_packages(Path(os.path.dirname(os.path.dirname(python_exe))))
+        if site_packages:
+            packages = scan_site_packages(site_packages)
+            self._pkg_cache[env_name] = (time.monotonic(), packages)
+            return packages
         
+        # 该环境已在后台获取时等待同一次结果，不重复启动 uv
+        if env_name in self._pkg_list_jobs:
+            return []
+        
+        # site-packages 不存在时在后台通过 uv 获取包列表，结果通过 environmentPackagesLoaded 通知
+        # 使用 freeze 格式逐行读取输出，不必等进程结束后再整体解析，也可以中途取消
+        cmd = self._build_uv_cmd(("pip", "list", "--format=freeze"), python_exe)
+        job = self._pkg_list_jobs[env_name] = {"proc": None, "cancelled": False}
+        self._exec.submit(self._list_packages_with_uv, env_name, job, cmd)
+        return []
+    
+    def _list_packages_with_uv(self, env_name: str, job: Dict[str, Any], cmd: List[str]):
+        """在后台线程运行 uv pip list，只读取输出，结果交给主线程处理"""
         packages = []
-        lines = result.stdout.strip().split('\n')
-        for line in lines[2:]:  # 跳过标题行
-            if line.strip():
-                parts = line.split()
-                if len(parts) >= 2:
-                    packages.append({
-                        "name": parts[0],
-                        "version": parts[1]
-                    })
-        
-        return packages
+        try:
+            startupinfo = PythonEnvironmentWorker._get_hidden_subprocess_startupinfo()
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                                  encoding='utf-8', errors='replace', startupinfo=startupinfo) as proc:
+                # 进程登记前已取消时直接结束进程
+                with self._pkg_list_lock:
+                    job["proc"] = proc
+                    cancelled = job["cancelled"]
+                if cancelled:
+                    proc.terminate()
+                for line in proc.stdout:
+                    name, sep, version = line.strip().partition("==")
+                    if not sep:
+                        name, sep, version = line.strip().partition(" @ ")
+                        version = ""
+                    if sep:
+                        packages.append({"name": name, "version": version})
+            if proc.returncode and not job["cancelled"]:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
+        except Exception as e:
+            self.logger.error(f"获取环境 {env_name} 的包列表失败: {str(e)}")
+            packages = None
+        self.environmentPackagesListed.emit(env_name, job, packages)
+    
+    @Slot(str, object, object)
+    def _on_environment_packages_listed(self, env_name: str, job: Dict[str, Any],
+                                        packages: Optional[List[Dict[str, Any]]]):
+        """在主线程中处理后台获取的包列表：更新缓存并通知前端"""
+        if self._pkg_list_jobs.get(env_name) is job:
+            del self._pkg_list_jobs[env_name]
+        # 被 cancelEnvironmentPackages 取消时不再通知结果
+        if job["cancelled"]:
+            return
+        if packages is None:
+            packages = []
+        else:
+            self._pkg_cache[env_name] = (time.monotonic(), packages)
+        self.environmentPackagesLoaded.emit(env_name, packages)
+    
+    @Slot(str, result=bool)
+    def isLoadingEnvironmentPackages(self, env_name: str) -> bool:
+        """检查是否正在后台获取环境的包列表"""
+        return env_name in self._pkg_list_jobs
+    
+    @Slot(str)
+    def cancelEnvironmentPackages(self, env_name: str):
+        """取消正在后台获取的环境包列表（uv 进程尚未启动时，启动后立即结束）"""
+        job = self._pkg_list_jobs.pop(env_name, None)
+        if job is None:
+            return
+        with self._pkg_list_lock:
+            job["cancelled"] = True
+            proc = job["proc"]
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
     
     @Slot(str, result=bool)
     @handle_exceptions(context="同步环境依赖", show_dialog=False, log_level="ERROR", return_value=False)
     def syncEnvironment(self, env_name: str) -> bool:
-        """使用uv同步环境依赖"""
+        """使用uv同步环境依赖（后台执行，结果通过 packageOperationFinished 通知）"""
         env_info = self.getEnvironmentInfo(env_name)
         if not env_info:
             self.configError.emit(f"环境 '{env_name}' 不存在")
             return False
         
-        env_path = Path(env_info.get("path", ""))
-        if not env_path.exists():
-            self.configError.emit(f"环境路径不存在: {env_path}")
+        python_exe = self._get_python_exe(env_info)
+        if not python_exe:
+            self.configError.emit(f"环境中的Python可执行文件不存在: {env_info.get('path', '')}")
             return False
         
         # 构建uv同步命令
-        cmd = ["uv", "sync", "--python", str(env_path / ("Scripts" if os.name == 'nt' else "bin") / "python.exe")]
-        
-        # 如果启用了镜像源，添加镜像源参数
-        if self.mirrorEnabled:
-            mirror_url = self.getDefaultMirrorUrl()
-            cmd.extend(["--index-url", mirror_url])
-            self.logger.info(f"使用镜像源同步环境: {mirror_url}")
-        
-        startupinfo = PythonEnvironmentWorker._get_hidden_subprocess_startupinfo()
-        subprocess.run(cmd, check=True, capture_output=True, text=True, encoding='utf-8', errors='replace', startupinfo=startupinfo)
-        
-        self.logger.info(f"成功同步环境 {env_name} 的依赖")
+        cmd = self._build_uv_cmd(("sync",), python_exe, with_mirror=True)
+        self._run_uv_in_background("同步环境", env_name, cmd, f"成功同步环境 {env_name} 的依赖")
         return True
     
     # === 统一消息提示方法 ===
@@ -1084,9 +1717,17 @@ class ConfigBridge(QObject):
             self.showErrorMessage("环境删除失败", message or f"删除环境 '{env_name}' 时发生错误", 5000)
 
 
+# QML类型是否已注册
+_qml_types_registered = False
+
+
 # 注册QML类型
 def register_qml_types():
-    """注册QML类型"""
+    """注册QML类型（重复调用时直接返回）"""
+    global _qml_types_registered
+    if _qml_types_registered:
+        return
     qmlRegisterType(ConfigBridge, "ConfigBridge", 1, 0, "ConfigBridge")
+    _qml_types_registered = True
 
 
@@ -4,10 +4,18 @@
 使用装饰器异常管理
 """
 
+import os
+import functools
+import hashlib
+import operator
+import pickle
+import shutil
+import tomllib
 import toml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from PySide6.QtCore import QObject, Signal
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple, Mapping
+from PySide6.QtCore import QObject, Signal, QTimer
 
 # 导入异常管理装饰器
 from utils.exception_handler import (
@@ -15,6 +23,126 @@ from utils.exception_handler import (
     silent_exceptions
 )
 
+# 解析后配置的缓存文件后缀（与配置文件同目录），配置文件和默认配置都不变时直接加载
+CONFIG_CACHE_SUFFIX = ".cache.pkl"
+
+# request_save() 延迟保存的时间（毫秒），期间的多次修改合并为一次写入
+CONFIG_SAVE_DELAY_MS = 250
+
+# 配置文件读写缓冲区大小，整个文件通常一次系统调用即可读写完成
+CONFIG_IO_BUFFER_SIZE = 64 * 1024
+
+# 配置验证规则：(配置节, 键, 期望类型)
+CONFIG_TYPE_RULES = (
+    ("app", "name", str),
+    ("environments", "available", list),
+    ("mirrors", "sources", list),
+    ("plugins", "installed_plugins", list),
+)
+
+# 每个镜像源必需的键
+MIRROR_SOURCE_KEYS = frozenset({"name", "url", "priority", "enabled"})
+
+# 镜像源按优先级排序的键
+MIRROR_PRIORITY_KEY = operator.itemgetter("priority")
+
+# 配置项不存在时的占位值（与 None 区分）
+MISSING = object()
+
+
+def freeze_config(value: Any) -> Any:
+    """递归转换为只读结构：字典 -> MappingProxyType，列表 -> 元组"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_config(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_config(item) for item in value)
+    return value
+
+
+def thaw_config(value: Any) -> Any:
+    """将只读配置还原为可修改的字典和列表（每次调用都得到独立副本）"""
+    if isinstance(value, Mapping):
+        return {key: thaw_config(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_config(item) for item in value]
+    return value
+
+
+# 默认配置模板（模块导入时只构建一次，逐层只读；使用时通过 thaw_config 得到独立副本）
+DEFAULT_CONFIG = freeze_config({
+    "app": {
+        "name": "Tuleaj Plugin Aggregator",
+        "version": "1.0.0",
+        "description": "PySide6 QML 插件聚合工具",
+        "author": "Tuleaj"
+    },
+    "ui": {
+        "theme": "auto"
+    },
+    "environments": {
+        "default": "python3.11",
+        "available": ["python3.11", "python3.12"]
+    },
+    "plugins": {
+        "directory": "plugins",
+        "auto_scan": True,
+        "plugin_timeout_seconds": 30,
+        "installed_plugins": []
+    },
+    "mirrors": {
+        "enabled": True,
+        "default_source": "pypi",
+        "sources": [
+            {"name": "pypi", "url": "https://pypi.org/simple/", "priority": 1, "enabled": True},
+            {"name": "tsinghua", "url": "https://pypi.tuna.tsinghua.edu.cn/simple/", "priority": 2, "enabled": True},
+            {"name": "aliyun", "url": "https://mirrors.aliyun.com/pypi/simple/", "priority": 3, "enabled": True}
+        ],
+        "timeout_seconds": 30,
+        "retry_count": 3,
+        "verify_ssl": True
+    },
+    "logging": {
+        "enable_file_logging": True,
+        "enable_console_logging": True,
+        "log_format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "date_format": "%Y-%m-%d %H:%M:%S",
+        "enable_plugin_logs": True,
+        "plugin_log_dir": "logs/plugins",
+        "log_level": "INFO",
+        "log_dir": "logs",
+        "max_log_files": 10,
+        "log_file_size_mb": 10
+    },
+    "advanced": {
+        "debug_mode": False,
+        "enable_metrics": True,
+        "metrics_retention_days": 30,
+        "enable_telemetry": False
+    }
+})
+
+# 解析缓存格式版本，合并或验证逻辑变化时递增，使旧缓存失效
+CONFIG_CACHE_VERSION = 1
+
+# 默认配置和验证规则的指纹，随缓存一起保存；程序升级导致两者变化时旧缓存不再命中
+CONFIG_SCHEMA_FINGERPRINT = hashlib.blake2b(
+    repr((CONFIG_CACHE_VERSION, thaw_config(DEFAULT_CONFIG), CONFIG_TYPE_RULES, sorted(MIRROR_SOURCE_KEYS))).encode("utf-8"),
+    digest_size=16
+).hexdigest()
+
+
+def is_unchanged(old_value: Any, new_value: Any) -> bool:
+    """判断配置值是否未变化；同一个列表/字典对象说明调用方原地修改了 get() 的返回值，视为已变化"""
+    if old_value is new_value:
+        return not isinstance(new_value, (list, dict))
+    return old_value == new_value
+
+
+@functools.lru_cache(maxsize=256)
+def split_config_key(key: str) -> Tuple[str, ...]:
+    """拆分点分配置键（结果缓存，常用键只拆分一次）"""
+    return tuple(key.split('.'))
+
 
 class ConfigManager(QObject):
     """配置管理器"""
@@ -30,81 +158,64 @@ class ConfigManager(QObject):
         self.config_file = Path(config_file)
         self.config = {}
         self.default_config = self._get_default_config()
-        self._backup_config = None
-        
-    def _get_default_config(self) -> Dict[str, Any]:
-        """获取默认配置"""
-        return {
-            "app": {
-                "name": "Tuleaj Plugin Aggregator",
-                "version": "1.0.0",
-                "description": "PySide6 QML 插件聚合工具",
-                "author": "Tuleaj"
-            },
-            "ui": {
-                "theme": "auto"
-            },
-            "environments": {
-                "default": "python3.11",
-                "available": ["python3.11", "python3.12"]
-            },
-            "plugins": {
-                "directory": "plugins",
-                "auto_scan": True,
-                "plugin_timeout_seconds": 30,
-                "installed_plugins": []
-            },
-            "mirrors": {
-                "enabled": True,
-                "default_source": "pypi",
-                "sources": [
-                    {"name": "pypi", "url": "https://pypi.org/simple/", "priority": 1, "enabled": True},
-                    {"name": "tsinghua", "url": "https://pypi.tuna.tsinghua.edu.cn/simple/", "priority": 2, "enabled": True},
-                    {"name": "aliyun", "url": "https://mirrors.aliyun.com/pypi/simple/", "priority": 3, "enabled": True}
-                ],
-                "timeout_seconds": 30,
-                "retry_count": 3,
-                "verify_ssl": True
-            },
-            "logging": {
-                "enable_file_logging": True,
-                "enable_console_logging": True,
-                "log_format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                "date_format": "%Y-%m-%d %H:%M:%S",
-                "enable_plugin_logs": True,
-                "plugin_log_dir": "logs/plugins",
-                "log_level": "INFO",
-                "log_dir": "logs",
-                "max_log_files": 10,
-                "log_file_size_mb": 10
-            },
-            "advanced": {
-                "debug_mode": False,
-                "enable_metrics": True,
-                "metrics_retention_days": 30,
-                "enable_telemetry": False
-            }
-        }
+        # 上次加载或保存时配置的 pickle 快照，用于恢复备份（同时作为解析缓存的内容写入磁盘）
+        self._backup_snapshot = None
+        self._cache_file = self.config_file.with_name(self.config_file.name + CONFIG_CACHE_SUFFIX)
+        # get() 的查找路径缓存 {点分键: (父级字典, 末级键)} 以及镜像源、插件的名称索引，配置被修改或替换时清空
+        self._get_cache = {}
+        self._mirror_by_name = None
+        self._plugin_by_name = None
+        self._env_set = None
+        # set() 的跳转表 {点分键: (父级字典, 末级键)}，配置被替换或中间的表被覆盖时清空
+        self._leaf_slots = {}
+        # 上次加载或保存时配置文件的 stat 结果，文件不存在时为 None
+        self._last_stat = None
+        # get_config_stats() 的结果缓存，配置修改或保存时失效
+        self._stats_cache = None
+        # 镜像源列表是否已按优先级排序，读取时才排序
+        self._mirrors_sorted = False
+        # 配置自上次加载或保存后是否被修改过，未修改时 save_config 直接返回
+        self._dirty = True
+        # 延迟保存定时器，连续的 request_save() 只触发一次 save_config()
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(CONFIG_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save_config)
+        
+    def _get_default_config(self) -> Mapping[str, Any]:
+        """获取默认配置（只读模板，需要修改时先用 thaw_config 复制）"""
+        return DEFAULT_CONFIG
     
     @config_handle_exceptions(context="配置加载", show_dialog=False, log_level="ERROR", return_value=False)
     def load_config(self) -> bool:
         """加载配置文件"""
-        if self.config_file.exists():
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                loaded_config = toml.load(f)
-                # 合并默认配置和加载的配置
-                self.config = self._merge_configs(self.default_config, loaded_config)
-        else:
-            self.config = self.default_config.copy()
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
+            st = None
+        self._last_stat = st
+        
+        self._invalidate_lookups()
+        self._leaf_slots.clear()
+        if st is None:
+            self.config = thaw_config(self.default_config)
+            self._dirty = True
             self.save_config()
+        elif not self._load_config_cache(st):
+            with open(self.config_file, 'rb', buffering=CONFIG_IO_BUFFER_SIZE) as f:
+                loaded_config = tomllib.load(f)
+            # 合并默认配置和加载的配置
+            self.config = self._merge_configs(self.default_config, loaded_config)
+            
+            # 验证配置
+            if not self._validate_config():
+                self.config_error.emit("配置文件验证失败")
+                return False
+            
+            self._backup_snapshot = pickle.dumps(self.config, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write_config_cache()
         
-        # 验证配置
-        if not self._validate_config():
-            self.config_error.emit("配置文件验证失败")
-            return False
-        
-        # 创建备份
-        self._backup_config = self.config.copy()
+        self._dirty = False
         
         self.config_loaded.emit()
         return True
@@ -112,6 +223,11 @@ class ConfigManager(QObject):
     @config_handle_exceptions(context="配置保存", show_dialog=False, log_level="ERROR", return_value=False)
     def save_config(self) -> bool:
         """保存配置文件"""
+        # 自上次加载或保存后没有修改时无需重新写入（原地修改 get() 返回的列表/字典后需调用 _touch() 标记）
+        if not self._dirty and self.config_file.exists():
+            self.config_saved.emit()
+            return True
+        
         # 确保配置目录存在
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
         
@@ -120,69 +236,204 @@ class ConfigManager(QObject):
             self.config_error.emit("配置验证失败，无法保存")
             return False
         
-        # 创建备份
+        # 先完整写入临时文件，再备份旧文件，最后一步用临时文件替换配置文件（配置文件路径始终存在，写入中断也不会损坏配置）
+        data = toml.dumps(self.config).encode('utf-8')
+        tmp_file = self.config_file.with_suffix('.toml.tmp')
+        with open(tmp_file, 'wb', buffering=CONFIG_IO_BUFFER_SIZE) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
         if self.config_file.exists():
-            backup_file = self.config_file.with_suffix('.toml.backup')
-            with open(self.config_file, 'r', encoding='utf-8') as src:
-                with open(backup_file, 'w', encoding='utf-8') as dst:
-                    dst.write(src.read())
-        
-        # 保存配置
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            toml.dump(self.config, f)
+            self._backup_config_file()
+        os.replace(tmp_file, self.config_file)
+        self._last_stat = self.config_file.stat()
         
-        # 更新备份
-        self._backup_config = self.config.copy()
+        # 更新备份快照
+        self._backup_snapshot = pickle.dumps(self.config, protocol=pickle.HIGHEST_PROTOCOL)
+        self._write_config_cache()
+        self._dirty = False
+        self._stats_cache = None
         
         self.config_saved.emit()
         return True
     
+    def _backup_config_file(self):
+        """将当前配置文件备份为 .toml.backup（优先建立硬链接，不支持时复制），配置文件本身保持不动"""
+        backup_file = self.config_file.with_suffix('.toml.backup')
+        link_file = backup_file.with_name(backup_file.name + ".tmp")
+        try:
+            if os.path.lexists(link_file):
+                os.unlink(link_file)
+            os.link(self.config_file, link_file)
+            os.replace(link_file, backup_file)
+        except OSError:
+            shutil.copy2(self.config_file, backup_file)
+    
+    def request_save(self):
+        """请求延迟保存配置，短时间内的多次请求合并为一次写入"""
+        self._save_timer.start()
+    
+    def flush_pending_save(self) -> bool:
+        """立即执行尚未触发的延迟保存（如程序退出时），没有待保存的请求时直接返回 True"""
+        if not self._save_timer.isActive():
+            return True
+        self._save_timer.stop()
+        return self.save_config()
+    
+    @silent_exceptions(return_value=False)
+    def _load_config_cache(self, st: os.stat_result) -> bool:
+        """配置文件大小、修改时间以及默认配置指纹与缓存记录一致时加载缓存的配置快照（已合并并验证），返回是否命中"""
+        with open(self._cache_file, 'rb', buffering=CONFIG_IO_BUFFER_SIZE) as f:
+            fingerprint, size, mtime_ns, snapshot = pickle.load(f)
+        if (fingerprint, size, mtime_ns) != (CONFIG_SCHEMA_FINGERPRINT, st.st_size, st.st_mtime_ns):
+            return False
+        self.config = pickle.loads(snapshot)
+        self._backup_snapshot = snapshot
+        return True
+    
+    @silent_exceptions()
+    def _write_config_cache(self):
+        """将配置快照连同默认配置指纹、上次加载或保存时配置文件的大小和修改时间写入缓存（先写临时文件再替换）"""
+        st = self._last_stat
+        tmp_file = self._cache_file.with_name(self._cache_file.name + ".tmp")
+        record = (CONFIG_SCHEMA_FINGERPRINT, st.st_size, st.st_mtime_ns, self._backup_snapshot)
+        with open(tmp_file, 'wb', buffering=CONFIG_IO_BUFFER_SIZE) as f:
+            pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, self._cache_file)
+    
+    def _invalidate_lookups(self):
+        """清空 get() 结果缓存和名称索引，并在下次读取时重新对镜像源排序"""
+        self._get_cache.clear()
+        self._mirror_by_name = None
+        self._plugin_by_name = None
+        self._env_set = None
+        self._stats_cache = None
+        self._mirrors_sorted = False
+    
+    def _mirror_index(self) -> Dict[str, Dict[str, Any]]:
+        """按名称索引镜像源（首次使用时构建，同名时保留第一个）"""
+        if self._mirror_by_name is None:
+            self._mirror_by_name = {source["name"]: source for source in reversed(self.get_mirror_sources())}
+        return self._mirror_by_name
+    
+    def _plugin_index(self) -> Dict[str, Dict[str, Any]]:
+        """按名称索引已安装插件（首次使用时构建，同名时保留第一个）"""
+        if self._plugin_by_name is None:
+            self._plugin_by_name = {plugin.get("name"): plugin for plugin in reversed(self.get_installed_plugins())}
+        return self._plugin_by_name
+    
+    def _environment_set(self) -> set:
+        """可用环境名集合（首次使用时构建），用于 O(1) 判断环境是否存在"""
+        if self._env_set is None:
+            self._env_set = set(self.get_available_environments())
+        return self._env_set
+    
     @silent_exceptions(return_value=None)
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值"""
-        keys = key.split('.')
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        return value
+        # 只缓存查找路径（父级字典, 末级键），值每次从父级字典读取，原地修改上级表后也不会读到旧值
+        try:
+            parent, leaf = self._get_cache[key]
+        except KeyError:
+            keys = split_config_key(key)
+            parent = self.config
+            for k in keys[:-1]:
+                parent = parent.get(k)
+                if not isinstance(parent, dict):
+                    return default
+            leaf = keys[-1]
+            self._get_cache[key] = (parent, leaf)
+        return parent.get(leaf, default)
+    
+    def _leaf_slot(self, key: str) -> Tuple[Dict[str, Any], str]:
+        """返回点分键对应的 (父级字典, 末级键)，缺失的中间表会被创建；结果记录在跳转表中"""
+        try:
+            return self._leaf_slots[key]
+        except KeyError:
+            pass
+        
+        keys = split_config_key(key)
+        config = self.config
+        for k in keys[:-1]:
+            config = config.setdefault(k, {})
+        slot = self._leaf_slots[key] = (config, keys[-1])
+        return slot
     
     @config_handle_exceptions(context="设置配置", show_dialog=False, log_level="WARNING", return_value=False)
     def set(self, key: str, value: Any) -> bool:
-        """设置配置值"""
-        keys = key.split('.')
-        config = self.config
-        
-        # 导航到目标位置
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+        """设置配置值（值未变化时直接返回，不清空缓存也不发送信号）"""
+        config, leaf = self._leaf_slot(key)
+        old_value = config.get(leaf, MISSING)
+        if is_unchanged(old_value, value):
+            return True
         
-        # 设置值
-        old_value = config.get(keys[-1])
-        config[keys[-1]] = value
+        # 设置值；覆盖或写入整张表时，跳转表中记录的下级父字典可能失效
+        self._invalidate_lookups()
+        self._dirty = True
+        config[leaf] = value
+        if isinstance(value, dict) or isinstance(old_value, dict):
+            self._leaf_slots.clear()
         
         # 发送变化信号
-        if old_value != value:
-            self.config_changed.emit(key, value)
+        self.config_changed.emit(key, value)
+        
+        return True
+    
+    @config_handle_exceptions(context="批量设置配置", show_dialog=False, log_level="WARNING", return_value=False)
+    def set_many(self, section: str, values: Dict[str, Any]) -> bool:
+        """批量设置同一配置节下的多个值，只清空一次缓存并发送一次变化信号 (配置节, 变化的值)"""
+        parent, leaf = self._leaf_slot(section)
+        config = parent.setdefault(leaf, {})
+        
+        changed = {}
+        for key, value in values.items():
+            if not is_unchanged(config.get(key, MISSING), value):
+                config[key] = value
+                changed[key] = value
+        if not changed:
+            return True
         
+        self._invalidate_lookups()
+        self._dirty = True
+        if any(isinstance(value, dict) for value in changed.values()):
+            self._leaf_slots.clear()
+        self.config_changed.emit(section, changed)
+        return True
+    
+    def _touch(self, key: str, value: Any = MISSING) -> bool:
+        """列表等可变配置值已原地修改后调用：清空缓存、标记已修改并发送变化信号，无需像 set() 那样重新写入"""
+        if value is MISSING:
+            value = self.get(key)
+        elif self.get(key) is not value:
+            # 值不是配置中的对象（如配置项缺失时返回的默认值），仍需写入
+            return self.set(key, value)
+        self._invalidate_lookups()
+        self._dirty = True
+        self.config_changed.emit(key, value)
         return True
     
     @config_handle_exceptions(context="重置配置", show_dialog=False, log_level="INFO", return_value=False)
     def reset_to_default(self) -> bool:
         """重置为默认配置"""
-        self.config = self.default_config.copy()
+        self._invalidate_lookups()
+        self._leaf_slots.clear()
+        self._dirty = True
+        self.config = thaw_config(self.default_config)
         self.config_changed.emit("config", "reset")
         return True
     
     @config_handle_exceptions(context="恢复备份", show_dialog=False, log_level="WARNING", return_value=False)
     def restore_backup(self) -> bool:
         """恢复备份配置"""
-        if self._backup_config:
-            self.config = self._backup_config.copy()
+        if self._backup_snapshot:
+            # 自上次加载或保存后没有修改时配置与快照一致，无需反序列化
+            if not self._dirty:
+                return True
+            # 快照即上次加载或保存时的内容，恢复后与磁盘上的配置一致
+            self._invalidate_lookups()
+            self._leaf_slots.clear()
+            self._dirty = False
+            self.config = pickle.loads(self._backup_snapshot)
             self.config_changed.emit("config", "restored")
             return True
         else:
@@ -190,52 +441,43 @@ class ConfigManager(QObject):
             return False
     
     def has_changes(self) -> bool:
-        """检查是否有未保存的更改"""
-        return self.config != self._backup_config
-    
-    def _merge_configs(self, default: Dict[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
-        """合并配置"""
-        result = default.copy()
-        
-        for key, value in loaded.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        """检查是否有未保存的更改（原地修改 get() 的返回值后需调用 _touch() 才会被记录）"""
+        return self._dirty
+    
+    def _merge_configs(self, default: Mapping[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
+        """合并配置（复制一次默认配置后用显式栈逐层合并，只进入两侧都是字典的子表）"""
+        result = thaw_config(default)
+        stack = [(result, loaded)]
+        
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                dst_value = dst.get(key)
+                if isinstance(dst_value, dict) and isinstance(value, dict):
+                    stack.append((dst_value, value))
+                else:
+                    dst[key] = value
         
         return result
     
     def _validate_config(self) -> bool:
         """验证配置"""
         try:
-            # 验证应用配置
-            app_config = self.config.get("app", {})
-            if not isinstance(app_config.get("name"), str):
-                return False
-            
-            # 验证环境配置
-            env_config = self.config.get("environments", {})
-            if not isinstance(env_config.get("available"), list):
-                return False
+            # 验证各配置节中必需项的类型（TOML 解析结果只有内置类型，直接比较类型）
+            for section, key, expected_type in CONFIG_TYPE_RULES:
+                if type(self.config.get(section, {}).get(key)) is not expected_type:
+                    return False
             
             # 验证镜像源配置
-            mirror_config = self.config.get("mirrors", {})
-            if not isinstance(mirror_config.get("sources"), list):
-                return False
-            
-            for source in mirror_config.get("sources", []):
-                if not all(key in source for key in ["name", "url", "priority", "enabled"]):
+            for source in self.config["mirrors"]["sources"]:
+                if not MIRROR_SOURCE_KEYS <= source.keys():
                     return False
-                if not isinstance(source["priority"], int) or source["priority"] < 1:
+                # bool 是 int 的子类，类型比较可以同时排除 true/false 形式的优先级
+                if type(source["priority"]) is not int or source["priority"] < 1:
                     return False
-                if not isinstance(source["enabled"], bool):
+                if type(source["enabled"]) is not bool:
                     return False
             
-            # 验证插件配置
-            plugin_config = self.config.get("plugins", {})
-            if not isinstance(plugin_config.get("installed_plugins"), list):
-                return False
-            
             return True
             
         except Exception:
@@ -243,19 +485,22 @@ class ConfigManager(QObject):
     
     # 镜像源管理方法
     def get_mirror_sources(self) -> List[Dict[str, Any]]:
-        """获取镜像源列表"""
-        return self.get("mirrors.sources", [])
-    
-    @config_handle_exceptions(context="添加镜像源", show_dialog=False, log_level="WARNING", return_value=False)
-    def add_mirror_source(self, name: str, url: str, priority: int) -> bool:
-        """添加镜像源"""
+        """获取镜像源列表（按优先级排序，修改后首次读取时才排序）"""
+        sources = self.get("mirrors.sources", [])
+        if not self._mirrors_sorted:
+            sources.sort(key=MIRROR_PRIORITY_KEY)
+            self._mirrors_sorted = True
+        return sources
+    
+    @config_handle_exceptions(context="添加镜像源", show_dialog=False, log_level="WARNING", return_value=(False, []))
+    def add_mirror_source(self, name: str, url: str, priority: int) -> Tuple[bool, List[Dict[str, Any]]]:
+        """添加镜像源，返回 (是否成功, 更新后的镜像源列表)"""
         sources = self.get_mirror_sources()
         
         # 检查是否已存在
-        for source in sources:
-            if source["name"] == name:
-                self.config_error.emit(f"镜像源 '{name}' 已存在")
-                return False
+        if name in self._mirror_index():
+            self.config_error.emit(f"镜像源 '{name}' 已存在")
+            return False, sources
         
         # 添加新源
         new_source = {
@@ -266,51 +511,48 @@ class ConfigManager(QObject):
         }
         sources.append(new_source)
         
-        # 按优先级排序
-        sources.sort(key=lambda x: x["priority"])
-        
-        return self.set("mirrors.sources", sources)
+        # _touch() 会将镜像源标记为未排序，返回前读取一次得到排序后的列表
+        result = self._touch("mirrors.sources", sources)
+        return result, self.get_mirror_sources()
     
-    @config_handle_exceptions(context="移除镜像源", show_dialog=False, log_level="INFO", return_value=False)
-    def remove_mirror_source(self, name: str) -> bool:
-        """移除镜像源"""
+    @config_handle_exceptions(context="移除镜像源", show_dialog=False, log_level="INFO", return_value=(False, []))
+    def remove_mirror_source(self, name: str) -> Tuple[bool, List[Dict[str, Any]]]:
+        """移除镜像源，返回 (是否成功, 更新后的镜像源列表)"""
         sources = self.get_mirror_sources()
-        sources = [s for s in sources if s["name"] != name]
-        return self.set("mirrors.sources", sources)
-    
-    @config_handle_exceptions(context="更新镜像源", show_dialog=False, log_level="WARNING", return_value=False)
-    def update_mirror_source(self, name: str, url: str = None, priority: int = None) -> bool:
-        """更新镜像源"""
+        if name not in self._mirror_index():
+            return True, sources
+        sources[:] = [s for s in sources if s["name"] != name]
+        return self._touch("mirrors.sources", sources), sources
+    
+    @config_handle_exceptions(context="更新镜像源", show_dialog=False, log_level="WARNING", return_value=(False, []))
+    def update_mirror_source(self, name: str, url: str = None, priority: int = None) -> Tuple[bool, List[Dict[str, Any]]]:
+        """更新镜像源，返回 (是否成功, 更新后的镜像源列表)"""
         sources = self.get_mirror_sources()
-        
-        for source in sources:
-            if source["name"] == name:
-                if url is not None:
-                    source["url"] = url
-                if priority is not None:
-                    source["priority"] = priority
-                break
-        else:
+        source = self._mirror_index().get(name)
+        if source is None:
             self.config_error.emit(f"镜像源 '{name}' 不存在")
-            return False
+            return False, sources
         
-        # 按优先级排序
-        sources.sort(key=lambda x: x["priority"])
+        if url is not None:
+            source["url"] = url
+        if priority is not None:
+            source["priority"] = priority
         
-        return self.set("mirrors.sources", sources)
+        # _touch() 会将镜像源标记为未排序，返回前读取一次得到排序后的列表
+        result = self._touch("mirrors.sources", sources)
+        return result, self.get_mirror_sources()
     
-    @config_handle_exceptions(context="设置镜像源启用状态", show_dialog=False, log_level="INFO", return_value=False)
-    def set_mirror_source_enabled(self, name: str, enabled: bool) -> bool:
-        """设置镜像源启用状态"""
+    @config_handle_exceptions(context="设置镜像源启用状态", show_dialog=False, log_level="INFO", return_value=(False, []))
+    def set_mirror_source_enabled(self, name: str, enabled: bool) -> Tuple[bool, List[Dict[str, Any]]]:
+        """设置镜像源启用状态，返回 (是否成功, 更新后的镜像源列表)"""
         sources = self.get_mirror_sources()
+        source = self._mirror_index().get(name)
+        if source is None:
+            self.config_error.emit(f"镜像源 '{name}' 不存在")
+            return False, sources
         
-        for source in sources:
-            if source["name"] == name:
-                source["enabled"] = enabled
-                return self.set("mirrors.sources", sources)
-        
-        self.config_error.emit(f"镜像源 '{name}' 不存在")
-        return False
+        source["enabled"] = enabled
+        return self._touch("mirrors.sources", sources), sources
     
     def get_default_mirror_source(self) -> str:
         """获取默认镜像源"""
@@ -319,10 +561,7 @@ class ConfigManager(QObject):
     @config_handle_exceptions(context="设置默认镜像源", show_dialog=False, log_level="WARNING", return_value=False)
     def set_default_mirror_source(self, source_name: str) -> bool:
         """设置默认镜像源"""
-        sources = self.get_mirror_sources()
-        source_names = [s["name"] for s in sources]
-        
-        if source_name not in source_names:
+        if source_name not in self._mirror_index():
             self.config_error.emit(f"镜像源 '{source_name}' 不存在")
             return False
         
@@ -344,42 +583,37 @@ class ConfigManager(QObject):
             self.config_error.emit("插件名称不能为空")
             return False
         
-        for plugin in plugins:
-            if plugin.get("name") == plugin_name:
-                self.config_error.emit(f"插件 '{plugin_name}' 已存在")
-                return False
+        if plugin_name in self._plugin_index():
+            self.config_error.emit(f"插件 '{plugin_name}' 已存在")
+            return False
         
         # 添加插件
         plugins.append(plugin_info)
-        return self.set("plugins.installed_plugins", plugins)
+        return self._touch("plugins.installed_plugins", plugins)
     
     @config_handle_exceptions(context="移除插件", show_dialog=False, log_level="INFO", return_value=False)
     def remove_plugin(self, plugin_name: str) -> bool:
         """从配置中移除插件"""
+        if plugin_name not in self._plugin_index():
+            return True
         plugins = self.get_installed_plugins()
-        plugins = [p for p in plugins if p.get("name") != plugin_name]
-        return self.set("plugins.installed_plugins", plugins)
+        plugins[:] = [p for p in plugins if p.get("name") != plugin_name]
+        return self._touch("plugins.installed_plugins", plugins)
     
     @config_handle_exceptions(context="更新插件", show_dialog=False, log_level="WARNING", return_value=False)
     def update_plugin(self, plugin_name: str, updates: Dict[str, Any]) -> bool:
         """更新插件信息"""
-        plugins = self.get_installed_plugins()
-        
-        for plugin in plugins:
-            if plugin.get("name") == plugin_name:
-                plugin.update(updates)
-                return self.set("plugins.installed_plugins", plugins)
+        plugin = self._plugin_index().get(plugin_name)
+        if plugin is None:
+            self.config_error.emit(f"插件 '{plugin_name}' 不存在")
+            return False
         
-        self.config_error.emit(f"插件 '{plugin_name}' 不存在")
-        return False
+        plugin.update(updates)
+        return self._touch("plugins.installed_plugins", self.get_installed_plugins())
     
     def get_plugin_info(self, plugin_name: str) -> Optional[Dict[str, Any]]:
         """获取插件信息"""
-        plugins = self.get_installed_plugins()
-        for plugin in plugins:
-            if plugin.get("name") == plugin_name:
-                return plugin
-        return None
+        return self._plugin_index().get(plugin_name)
     
     # 环境管理方法
     def get_available_environments(self) -> List[str]:
@@ -389,24 +623,25 @@ class ConfigManager(QObject):
     @config_handle_exceptions(context="添加环境", show_dialog=False, log_level="INFO", return_value=False)
     def add_environment(self, env_name: str) -> bool:
         """添加环境"""
+        if env_name in self._environment_set():
+            return True
         envs = self.get_available_environments()
-        if env_name not in envs:
-            envs.append(env_name)
-            return self.set("environments.available", envs)
-        return True
+        envs.append(env_name)
+        return self._touch("environments.available", envs)
     
     @config_handle_exceptions(context="移除环境", show_dialog=False, log_level="WARNING", return_value=False)
     def remove_environment(self, env_name: str) -> bool:
         """移除环境"""
+        if env_name not in self._environment_set():
+            return True
         envs = self.get_available_environments()
-        envs = [e for e in envs if e != env_name]
-        return self.set("environments.available", envs)
+        envs[:] = [e for e in envs if e != env_name]
+        return self._touch("environments.available", envs)
     
     @config_handle_exceptions(context="设置默认环境", show_dialog=False, log_level="WARNING", return_value=False)
     def set_default_environment(self, env_name: str) -> bool:
         """设置默认环境"""
-        envs = self.get_available_environments()
-        if env_name not in envs:
+        if env_name not in self._environment_set():
             self.config_error.emit(f"环境 '{env_name}' 不存在")
             return False
         return self.set("environments.default", env_name)
@@ -514,8 +749,8 @@ class ConfigManager(QObject):
     def export_config(self, file_path: str) -> bool:
         """导出配置到文件"""
         export_path = Path(file_path)
-        with open(export_path, 'w', encoding='utf-8') as f:
-            toml.dump(self.config, f)
+        with open(export_path, 'wb', buffering=CONFIG_IO_BUFFER_SIZE) as f:
+            f.write(toml.dumps(self.config).encode('utf-8'))
         return True
     
     @config_handle_exceptions(context="导入配置", show_dialog=False, log_level="ERROR", return_value=False)
@@ -526,10 +761,13 @@ class ConfigManager(QObject):
             self.config_error.emit(f"配置文件不存在: {file_path}")
             return False
         
-        with open(import_path, 'r', encoding='utf-8') as f:
-            imported_config = toml.load(f)
+        with open(import_path, 'rb', buffering=CONFIG_IO_BUFFER_SIZE) as f:
+            imported_config = tomllib.load(f)
         
         # 合并配置
+        self._invalidate_lookups()
+        self._leaf_slots.clear()
+        self._dirty = True
         self.config = self._merge_configs(self.default_config, imported_config)
         
         # 验证配置
@@ -542,13 +780,15 @@ class ConfigManager(QObject):
     
     # 配置统计信息
     def get_config_stats(self) -> Dict[str, Any]:
-        """获取配置统计信息"""
-        return {
-            "total_sections": len(self.config),
-            "mirror_sources_count": len(self.get_mirror_sources()),
-            "installed_plugins_count": len(self.get_installed_plugins()),
-            "available_environments_count": len(self.get_available_environments()),
-            "has_changes": self.has_changes(),
-            "config_file_exists": self.config_file.exists(),
-            "config_file_size": self.config_file.stat().st_size if self.config_file.exists() else 0
-        }
+        """获取配置统计信息（结果缓存到配置下次修改或保存）"""
+        if self._stats_cache is None:
+            self._stats_cache = {
+                "total_sections": len(self.config),
+                "mirror_sources_count": len(self.get_mirror_sources()),
+                "installed_plugins_count": len(self.get_installed_plugins()),
+                "available_environments_count": len(self.get_available_environments()),
+                "has_changes": self.has_changes(),
+                "config_file_exists": self._last_stat is not None,
+                "config_file_size": self._last_stat.st_size if self._last_stat is not None else 0
+            }
+        return dict(self._stats_cache)
@@ -5,16 +5,32 @@
 基于虚拟环境的依赖管理，支持版本协商和懒加载
 """
 
-import toml
+import json
+import tomllib
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-from packaging import specifiers
+from typing import Dict, List, Optional, Set, Tuple
+from packaging import specifiers, version
+from packaging.requirements import Requirement, InvalidRequirement
 from PySide6.QtCore import QObject, Signal
 from utils.logger import Logger
+from utils.site_packages import find_site_packages
 from utils.exception_handler import ExceptionHandler, handle_exceptions
 
+# 在目标环境中列出已安装的包（输出格式同 pip list --format=json），无需导入 pip
+LIST_INSTALLED_SCRIPT = (
+    "import json, sys\n"
+    "from importlib.metadata import distributions\n"
+    "packages = {}\n"
+    "for dist in distributions():\n"
+    "    name = dist.metadata['Name']\n"
+    "    if name and name not in packages:\n"
+    "        packages[name] = dist.version\n"
+    "json.dump([{'name': n, 'version': v} for n, v in packages.items()], sys.stdout)\n"
+)
+
 
 class DependencyInfo:
     """依赖信息类"""
@@ -35,12 +51,13 @@ class VersionResolver:
     """版本协商器"""
     
     @staticmethod
-    def resolve_version_conflict(deps: List[DependencyInfo]) -> Optional[str]:
+    def resolve_version_conflict(deps: List[DependencyInfo], logger: Optional[Logger] = None) -> Optional[str]:
         """
         解决版本冲突，优先使用高版本要求
         
         Args:
             deps: 依赖信息列表
+            logger: 用于记录调试信息的日志管理器（可选）
             
         Returns:
             协商后的版本规范，如果无法协商则返回None
@@ -58,67 +75,53 @@ class VersionResolver:
                 spec = specifiers.SpecifierSet(dep.version_spec)
                 version_specs.append((dep.version_spec, spec))
             except Exception as e:
-                print(f"解析版本规范失败: {dep.version_spec}, 错误: {e}")
+                if logger:
+                    logger.debug(f"解析版本规范失败: {dep.version_spec}, 错误: {e}")
                 continue
         
         if not version_specs:
             return None
         
-        # 优先使用高版本策略
+        # 优先使用高版本策略：选择下界版本最高的规范
         try:
-            # 直接选择版本要求最高的规范（优先高版本）
-            print("使用高版本优先策略")
-            highest_spec = max(version_specs, key=lambda x: VersionResolver._get_version_priority(x[0]))
-            print(f"选择最高版本要求: {highest_spec[0]}")
-            return highest_spec[0]
+            parsed = []
+            for version_spec, spec_set in version_specs:
+                lower_bound = VersionResolver._extract_lower_bound(spec_set)
+                if lower_bound is not None:
+                    parsed.append((lower_bound, version_spec))
+            if not parsed:
+                return version_specs[0][0]
+            return max(parsed, key=lambda item: item[0])[1]
             
         except Exception as e:
-            print(f"版本协商失败: {e}")
+            if logger:
+                logger.debug(f"版本协商失败: {e}")
             # 回退到使用第一个规范
             return version_specs[0][0]
     
     @staticmethod
-    def _get_version_priority(version_spec: str) -> float:
+    def _extract_lower_bound(spec_set: specifiers.SpecifierSet) -> Optional[version.Version]:
         """
-        获取版本规范的优先级（数值越大优先级越高）
+        获取版本规范的下界版本
         
         Args:
-            version_spec: 版本规范字符串，如 ">=7.1.0", ">=8.0.0"
+            spec_set: 版本规范集合，如 SpecifierSet(">=7.1.0,<8")
             
         Returns:
-            优先级数值
+            下界（或精确）约束中的最高版本，没有此类约束时返回None
         """
-        try:
-            # 提取版本号
-            if '>=' in version_spec:
-                version_str = version_spec.split('>=')[1]
-            elif '>' in version_spec:
-                version_str = version_spec.split('>')[1]
-            elif '==' in version_spec:
-                version_str = version_spec.split('==')[1]
-            elif '<=' in version_spec:
-                version_str = version_spec.split('<=')[1]
-            elif '<' in version_spec:
-                version_str = version_spec.split('<')[1]
-            else:
-                return 0.0
-            
-            # 将版本号转换为数值进行比较
-            from packaging import version
-            ver = version.parse(version_str)
-            
-            # 计算优先级：主版本*10000 + 次版本*100 + 修订版本
-            major = ver.major if ver.major is not None else 0
-            minor = ver.minor if ver.minor is not None else 0
-            micro = ver.micro if ver.micro is not None else 0
-            
-            priority = major * 10000 + minor * 100 + micro
-            print(f"版本 {version_spec} 的优先级: {priority}")
-            return priority
-            
-        except Exception as e:
-            print(f"计算版本优先级失败: {version_spec}, 错误: {e}")
-            return 0.0
+        lower_bound = None
+        for spec in spec_set:
+            if spec.operator not in ('>=', '>', '==', '~='):
+                continue
+            try:
+                spec_version = version.Version(spec.version)
+            except version.InvalidVersion:
+                # 如 "==1.*" 这类通配版本
+                continue
+            if lower_bound is None or spec_version > lower_bound:
+                lower_bound = spec_version
+        return lower_bound
     
     @staticmethod
     def is_compatible(version_spec1: str, version_spec2: str) -> bool:
@@ -158,7 +161,10 @@ class DependencyManager(QObject):
         
         # 缓存
         self._env_dependencies_cache: Dict[str, Dict[str, DependencyInfo]] = {}
-        self._installed_packages_cache: Dict[str, Set[str]] = {}
+        # 环境名 -> (site-packages 的 mtime_ns, 包名 -> 版本, 小写包名集合)
+        self._installed_packages_cache: Dict[str, Tuple[int, Dict[str, str], Set[str]]] = {}
+        # 插件 pyproject.toml 路径 -> (mtime_ns, size, 解析出的依赖)
+        self._plugin_dep_cache: Dict[Path, Tuple[int, int, List[DependencyInfo]]] = {}
         
         # 确保环境目录存在
         self.envs_dir.mkdir(exist_ok=True)
@@ -196,47 +202,52 @@ class DependencyManager(QObject):
         """读取插件的依赖信息"""
         pyproject_file = plugin_path / "pyproject.toml"
         
-        if not pyproject_file.exists():
+        try:
+            stat = pyproject_file.stat()
+        except FileNotFoundError:
+            self._plugin_dep_cache.pop(pyproject_file, None)
             self.logger.warning(f"插件 {plugin_path.name} 缺少 pyproject.toml 文件")
             return []
         
+        # 文件未变化时直接复用上次的解析结果
+        cached = self._plugin_dep_cache.get(pyproject_file)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return list(cached[2])
+        
         try:
-            with open(pyproject_file, 'r', encoding='utf-8') as f:
-                data = toml.load(f)
+            with open(pyproject_file, 'rb') as f:
+                data = tomllib.load(f)
             
             dependencies = []
             project_deps = data.get('project', {}).get('dependencies', [])
             
             for dep in project_deps:
                 if isinstance(dep, str):
-                    # 解析依赖字符串，如 "psutil>=7.1.0"
-                    if '>=' in dep:
-                        name, version_spec = dep.split('>=', 1)
-                        version_spec = f">={version_spec}"
-                    elif '==' in dep:
-                        name, version_spec = dep.split('==', 1)
-                        version_spec = f"=={version_spec}"
-                    elif '>' in dep:
-                        name, version_spec = dep.split('>', 1)
-                        version_spec = f">{version_spec}"
-                    elif '<=' in dep:
-                        name, version_spec = dep.split('<=', 1)
-                        version_spec = f"<={version_spec}"
-                    elif '<' in dep:
-                        name, version_spec = dep.split('<', 1)
-                        version_spec = f"<{version_spec}"
-                    else:
-                        name = dep
-                        version_spec = ""
+                    # 解析依赖字符串，如 "psutil>=7.1.0" 或 "requests[socks]>=2.0,<3"
+                    try:
+                        requirement = Requirement(dep)
+                    except InvalidRequirement as e:
+                        self.logger.warning(f"插件 {plugin_path.name} 的依赖 {dep!r} 格式无效: {e}")
+                        continue
+                    
+                    # 环境标记不满足的依赖（如仅 Windows 需要的包）不安装；插件环境与主程序运行在同一平台
+                    if requirement.marker is not None and not requirement.marker.evaluate():
+                        continue
+                    
+                    # 保留 extras，安装时包名与版本规范直接拼接，如 "requests[socks]>=2.0"
+                    name = requirement.name
+                    if requirement.extras:
+                        name += "[" + ",".join(sorted(requirement.extras)) + "]"
                     
                     dependencies.append(DependencyInfo(
-                        name=name.strip(),
-                        version_spec=version_spec.strip(),
+                        name=name,
+                        version_spec=str(requirement.specifier),
                         source=plugin_path.name
                     ))
             
+            self._plugin_dep_cache[pyproject_file] = (stat.st_mtime_ns, stat.st_size, dependencies)
             self.logger.info(f"从插件 {plugin_path.name} 读取到 {len(dependencies)} 个依赖")
-            return dependencies
+            return list(dependencies)
             
         except Exception as e:
             self.logger.error(f"读取插件 {plugin_path.name} 依赖失败: {e}")
@@ -249,13 +260,20 @@ class DependencyManager(QObject):
         if not self.plugins_dir.exists():
             return dependencies_map
         
-        for plugin_dir in self.plugins_dir.iterdir():
-            if plugin_dir.is_dir():
-                plugin_deps = self.read_plugin_dependencies(plugin_dir)
-                for dep in plugin_deps:
-                    if dep.name not in dependencies_map:
-                        dependencies_map[dep.name] = []
-                    dependencies_map[dep.name].append(dep)
+        plugin_dirs = [plugin_dir for plugin_dir in self.plugins_dir.iterdir() if plugin_dir.is_dir()]
+        if not plugin_dirs:
+            return dependencies_map
+        
+        # 各插件的 pyproject.toml 相互独立，并行读取；map 保持插件顺序
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(plugin_dirs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.read_plugin_dependencies, plugin_dirs))
+        
+        for plugin_deps in results:
+            for dep in plugin_deps:
+                if dep.name not in dependencies_map:
+                    dependencies_map[dep.name] = []
+                dependencies_map[dep.name].append(dep)
         
         return dependencies_map
     
@@ -270,7 +288,7 @@ class DependencyManager(QObject):
                 resolved_deps[package_name] = dep_list[0].version_spec
             else:
                 # 多个依赖，进行版本协商
-                resolved_version = VersionResolver.resolve_version_conflict(dep_list)
+                resolved_version = VersionResolver.resolve_version_conflict(dep_list, self.logger)
                 if resolved_version:
                     resolved_deps[package_name] = resolved_version
                     
@@ -445,29 +463,47 @@ class DependencyManager(QObject):
         
         return content
     
+    def _get_installed_map(self, env_name: str) -> Optional[Tuple[Dict[str, str], Set[str]]]:
+        """
+        获取环境中已安装的包，site-packages 未变化时直接使用缓存
+        
+        Returns:
+            (包名 -> 版本, 小写包名集合)，环境不存在或查询失败时返回None
+        """
+        python_path = self.get_environment_python_path(env_name)
+        if not python_path.exists():
+            self._installed_packages_cache.pop(env_name, None)
+            return None
+        
+        # 安装或卸载包会修改 site-packages 目录的 mtime，以此判断缓存是否有效
+        site_packages = find_site_packages(python_path.parent.parent)
+        mtime_ns = site_packages.stat().st_mtime_ns if site_packages else None
+        cached = self._installed_packages_cache.get(env_name)
+        if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+        
+        result = subprocess.run(
+            [str(python_path), "-c", LIST_INSTALLED_SCRIPT],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            encoding='utf-8',
+            errors='replace'
+        )
+        if result.returncode != 0:
+            return None
+        
+        installed = {pkg['name']: pkg['version'] for pkg in json.loads(result.stdout)}
+        names_lower = {name.lower() for name in installed}
+        if mtime_ns is not None:
+            self._installed_packages_cache[env_name] = (mtime_ns, installed, names_lower)
+        return installed, names_lower
+    
     def is_package_installed(self, env_name: str, package_name: str) -> bool:
         """检查包是否已安装在环境中"""
         try:
-            python_path = self.get_environment_python_path(env_name)
-            if not python_path.exists():
-                return False
-            
-            # 使用pip list检查
-            result = subprocess.run(
-                [str(python_path), "-m", "pip", "list", "--format=json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            if result.returncode == 0:
-                import json
-                installed_packages = json.loads(result.stdout)
-                return any(pkg['name'].lower() == package_name.lower() for pkg in installed_packages)
-            
-            return False
+            installed = self._get_installed_map(env_name)
+            return installed is not None and package_name.lower() in installed[1]
             
         except Exception as e:
             self.logger.error(f"检查包 {package_name} 安装状态失败: {e}")
@@ -553,25 +589,8 @@ class DependencyManager(QObject):
     def get_environment_dependencies(self, env_name: str) -> Dict[str, str]:
         """获取环境中已安装的依赖信息"""
         try:
-            python_path = self.get_environment_python_path(env_name)
-            if not python_path.exists():
-                return {}
-            
-            result = subprocess.run(
-                [str(python_path), "-m", "pip", "list", "--format=json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            if result.returncode == 0:
-                import json
-                installed_packages = json.loads(result.stdout)
-                return {pkg['name']: pkg['version'] for pkg in installed_packages}
-            
-            return {}
+            installed = self._get_installed_map(env_name)
+            return dict(installed[0]) if installed is not None else {}
             
         except Exception as e:
             self.logger.error(f"获取环境 {env_name} 依赖信息失败: {e}")
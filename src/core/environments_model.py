@@ -0,0 +1,91 @@
+"""
+环境列表模型
+以 QAbstractListModel 的形式向 QML 提供Python环境列表，按行增量更新
+"""
+
+from typing import Dict, Any, List
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal, Property, QByteArray
+
+
+class EnvironmentsModel(QAbstractListModel):
+    """Python环境列表模型"""
+    
+    NameRole = Qt.UserRole + 1
+    PathRole = Qt.UserRole + 2
+    PythonVersionRole = Qt.UserRole + 3
+    PackagesCountRole = Qt.UserRole + 4
+    SizeRole = Qt.UserRole + 5
+    IsActiveRole = Qt.UserRole + 6
+    
+    # 角色 -> 环境信息字典中的键（同时作为 QML 中的角色名）
+    ROLE_KEYS = {
+        NameRole: "name",
+        PathRole: "path",
+        PythonVersionRole: "python_version",
+        PackagesCountRole: "packages_count",
+        SizeRole: "size_mb",
+        IsActiveRole: "is_active",
+    }
+    
+    countChanged = Signal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._environments: List[Dict[str, Any]] = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._environments)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._environments):
+            return None
+        key = "name" if role == Qt.DisplayRole else self.ROLE_KEYS.get(role)
+        if key is None:
+            return None
+        return self._environments[index.row()].get(key)
+    
+    def roleNames(self) -> Dict[int, QByteArray]:
+        return {role: QByteArray(key.encode("utf-8")) for role, key in self.ROLE_KEYS.items()}
+    
+    @Property(int, notify=countChanged)
+    def count(self) -> int:
+        """环境数量"""
+        return len(self._environments)
+    
+    def set_environments(self, environments: List[Dict[str, Any]]):
+        """按环境名对比新旧列表，只对移除、新增和变化的行发送通知"""
+        old_count = len(self._environments)
+        new_names = [env.get("name") for env in environments]
+        new_name_set = set(new_names)
+        
+        # 从后往前移除已不存在的环境，保持行号有效
+        for row in range(len(self._environments) - 1, -1, -1):
+            if self._environments[row].get("name") not in new_name_set:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._environments[row]
+                self.endRemoveRows()
+        
+        # 保留下来的环境顺序发生变化时整体重置
+        kept_names = [env.get("name") for env in self._environments]
+        kept_name_set = set(kept_names)
+        if [name for name in new_names if name in kept_name_set] != kept_names:
+            self.beginResetModel()
+            self._environments = [dict(env) for env in environments]
+            self.endResetModel()
+        else:
+            # 按新顺序合并：同名行对比内容，缺失的行就地插入
+            for row, env in enumerate(environments):
+                if row < len(self._environments) and self._environments[row].get("name") == env.get("name"):
+                    if self._environments[row] != env:
+                        self._environments[row] = dict(env)
+                        model_index = self.index(row, 0)
+                        self.dataChanged.emit(model_index, model_index)
+                else:
+                    self.beginInsertRows(QModelIndex(), row, row)
+                    self._environments.insert(row, dict(env))
+                    self.endInsertRows()
+        
+        if len(self._environments) != old_count:
+            self.countChanged.emit()
@@ -6,7 +6,7 @@
 """
 
 import os
-import toml
+import tomllib
 import markdown
 import tempfile
 from pathlib import Path
@@ -78,8 +78,8 @@ class PluginScanner(QThread):
             return None
         
         try:
-            with open(pyproject_file, 'r', encoding='utf-8') as f:
-                data = toml.load(f)
+            with open(pyproject_file, 'rb') as f:
+                data = tomllib.load(f)
             
             # 提取插件元数据
             plugin_metadata = data.get('plugin-metadata', {})
@@ -13,6 +13,17 @@ ApplicationWindow {
     visible: false
     modality: Qt.ApplicationModal
     
+    // 正在后台获取包列表的环境名
+    property string loadingPackagesEnv: ""
+    
+    // 关闭窗口时取消尚未完成的包列表获取
+    onClosing: {
+        if (configBridge && loadingPackagesEnv !== "") {
+            configBridge.cancelEnvironmentPackages(loadingPackagesEnv)
+            loadingPackagesEnv = ""
+        }
+    }
+    
     // 窗口居中函数
     function centerWindow() {
         // 确保窗口完全居中显示
@@ -83,7 +94,7 @@ ApplicationWindow {
                 }
                 
                 Text {
-                    text: "共 " + (configBridge ? configBridge.environmentsList.length : 0) + " 个环境"
+                    text: "共 " + (configBridge ? configBridge.environmentsModel.count : 0) + " 个环境"
                     font.pixelSize: 12
                     color: "#666666"
                 }
@@ -97,28 +108,25 @@ ApplicationWindow {
                 
                 ListView {
                     id: environmentManagementList
-                    model: configBridge ? configBridge.environmentsList : []
+                    model: configBridge ? configBridge.environmentsModel : null
                     spacing: 8
                     
                     Component.onCompleted: {
-                        console.log("环境管理ListView完成，模型数据:", configBridge ? configBridge.environmentsList : [])
-                        console.log("模型数据长度:", configBridge ? configBridge.environmentsList.length : 0)
+                        console.log("环境管理ListView完成，模型数据长度:", configBridge ? configBridge.environmentsModel.count : 0)
                     }
                     
                     delegate: Rectangle {
                         width: environmentManagementList.width
                         height: envManagementItemLayout.implicitHeight + 16
-                        color: (modelData.is_active || false) ? "#e8f5e8" : "#ffffff"
+                        color: (model.is_active || false) ? "#e8f5e8" : "#ffffff"
                         radius: 6
-                        border.color: (modelData.is_active || false) ? "#4CAF50" : "#e0e0e0"
+                        border.color: (model.is_active || false) ? "#4CAF50" : "#e0e0e0"
                         border.width: 1
                         
                         Component.onCompleted: {
                             console.log("环境项完成，模型数据:", model)
-                            console.log("环境名称:", modelData.name)
-                            console.log("Python版本:", modelData.python_version)
-                            console.log("模型数据类型:", typeof model)
-                            console.log("模型数据键:", Object.keys(model))
+                            console.log("环境名称:", model.name)
+                            console.log("Python版本:", model.python_version)
                         }
                         
                         ColumnLayout {
@@ -137,20 +145,20 @@ ApplicationWindow {
                                     spacing: 4
                                 
                                     Text {
-                                        text: modelData.name || "未知环境"
+                                        text: model.name || "未知环境"
                                         font.pixelSize: 14
-                                        font.bold: modelData.is_active || false
-                                        color: (modelData.is_active || false) ? "#2E7D32" : "#333333"
+                                        font.bold: model.is_active || false
+                                        color: (model.is_active || false) ? "#2E7D32" : "#333333"
                                     }
                                     
                                     Text {
-                                        text: (modelData.python_version || "未知版本") + " | " + (modelData.packages_count || 0) + " 包 | " + (modelData.size_mb || 0) + " MB"
+                                        text: (model.python_version || "未知版本") + " | " + (model.packages_count || 0) + " 包 | " + (model.size_mb || 0) + " MB"
                                         font.pixelSize: 11
                                         color: "#666666"
                                     }
                                     
                                     Text {
-                                        text: "路径: " + (modelData.path || "")
+                                        text: "路径: " + (model.path || "")
                                         font.pixelSize: 10
                                         color: "#999999"
                                         wrapMode: Text.WordWrap
@@ -160,11 +168,11 @@ ApplicationWindow {
                                 
                                 // 当前环境标识
                                 Text {
-                                    text: (modelData.is_active || false) ? "当前环境" : ""
+                                    text: (model.is_active || false) ? "当前环境" : ""
                                     font.pixelSize: 10
                                     color: "#4CAF50"
                                     font.bold: true
-                                    visible: modelData.is_active || false
+                                    visible: model.is_active || false
                                 }
                             }
                         
@@ -178,21 +186,21 @@ ApplicationWindow {
                                     width: 60
                                     height: 28
                                     font.pixelSize: 10
-                                    enabled: !(modelData.is_active || false)
+                                    enabled: !(model.is_active || false)
                                 
                                     onClicked: {
                                         if (configBridge) {
                                             // 显示切换中消息
-                                            messageManager.showInfo("切换环境", "正在切换到环境: " + modelData.name, 2000)
+                                            messageManager.showInfo("切换环境", "正在切换到环境: " + model.name, 2000)
                                             
-                                            var result = configBridge.switchEnvironment(modelData.name)
+                                            var result = configBridge.switchEnvironment(model.name)
                                             if (result) {
                                                 console.log("环境切换成功")
                                                 // 成功消息由 configBridge.switchEnvironment 内部处理
                                             } else {
                                                 console.log("环境切换失败")
                                                 // 显示错误消息
-                                                messageManager.showError("切换失败", "切换到环境 '" + modelData.name + "' 时发生错误", 3000)
+                                                messageManager.showError("切换失败", "切换到环境 '" + model.name + "' 时发生错误", 3000)
                                             }
                                         }
                                     }
@@ -205,7 +213,7 @@ ApplicationWindow {
                                     font.pixelSize: 10
                                     
                                     onClicked: {
-                                        showEnvironmentDetails(modelData.name)
+                                        showEnvironmentDetails(model.name)
                                     }
                                 }
                                 
@@ -216,7 +224,7 @@ ApplicationWindow {
                                     font.pixelSize: 10
                                     
                                     onClicked: {
-                                        showPackageManager(modelData.name)
+                                        showPackageManager(model.name)
                                     }
                                 }
                                 
@@ -225,10 +233,10 @@ ApplicationWindow {
                                     width: 60
                                     height: 28
                                     font.pixelSize: 10
-                                    enabled: !(modelData.is_active || false)
+                                    enabled: !(model.is_active || false)
                                     
                                     onClicked: {
-                                        deleteEnvironment(modelData.name)
+                                        deleteEnvironment(model.name)
                                     }
                                 }
                                 
@@ -316,6 +324,12 @@ ApplicationWindow {
         console.log("显示包管理器:", envName)
         // 获取环境中的包列表
         var packages = configBridge ? configBridge.getEnvironmentPackages(envName) : []
+        // 返回空列表时区分"正在后台获取"和"没有安装任何包"
+        loadingPackagesEnv = configBridge && configBridge.isLoadingEnvironmentPackages(envName) ? envName : ""
+        showPackages(packages)
+    }
+    
+    function showPackages(packages) {
         console.log("环境包列表:", packages)
         
         // 这里可以显示一个包管理对话框
@@ -326,6 +340,17 @@ ApplicationWindow {
         }
     }
     
+    // 需要通过 uv 获取包列表时，结果在后台获取完成后送达
+    Connections {
+        target: configBridge
+        function onEnvironmentPackagesLoaded(envName, packages) {
+            if (envName === loadingPackagesEnv) {
+                loadingPackagesEnv = ""
+            }
+            showPackages(packages)
+        }
+    }
+    
     // 删除确认对话框
     Dialog {
         id: deleteConfirmDialog
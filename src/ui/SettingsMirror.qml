@@ -20,6 +20,66 @@ Rectangle {
         mirrorHeightChanged()
     }
     
+    // 正在进行的单个镜像源测试（URL -> 名称）
+    property var pendingMirrorTests: ({})
+    
+    // 批量测试状态
+    property var batchTestUrls: ({})
+    property int batchTestTotal: 0
+    property int batchTestDone: 0
+    property int batchTestSuccess: 0
+    
+    // 发起单个镜像源的异步连接测试
+    function startMirrorTest(name, url) {
+        pendingMirrorTests[url] = name
+        configBridge.testMirrorConnectionAsync(url)
+    }
+    
+    // 监听镜像源连接测试结果（测试在后台线程执行，不阻塞界面）
+    Connections {
+        target: configBridge
+        function onMirrorTestCompleted(url, result) {
+            if (url in pendingMirrorTests) {
+                var name = pendingMirrorTests[url]
+                delete pendingMirrorTests[url]
+                if (result) {
+                    console.log("镜像源连接测试成功:", name)
+                    configBridge.showMessage("success", "连接测试成功", `镜像源 "${name}" 连接正常`, 3000)
+                } else {
+                    console.log("镜像源连接测试失败:", name)
+                    configBridge.showMessage("error", "连接测试失败", `镜像源 "${name}" 连接失败，请检查网络或URL`, 3000)
+                }
+            }
+            
+            if (url in batchTestUrls) {
+                var count = batchTestUrls[url]
+                if (count > 1) {
+                    batchTestUrls[url] = count - 1
+                } else {
+                    delete batchTestUrls[url]
+                }
+                batchTestDone++
+                if (result) {
+                    batchTestSuccess++
+                }
+                
+                // 全部完成后显示测试结果汇总
+                if (batchTestDone === batchTestTotal) {
+                    var totalCount = batchTestTotal
+                    var successCount = batchTestSuccess
+                    batchTestTotal = 0
+                    if (successCount === totalCount) {
+                        configBridge.showMessage("success", "测试完成", `所有 ${totalCount} 个镜像源连接正常`, 3000)
+                    } else if (successCount > 0) {
+                        configBridge.showMessage("warning", "测试完成", `${successCount}/${totalCount} 个镜像源连接正常，${totalCount - successCount} 个连接失败`, 3000)
+                    } else {
+                        configBridge.showMessage("error", "测试完成", `所有 ${totalCount} 个镜像源连接失败，请检查网络连接`, 3000)
+                    }
+                }
+            }
+        }
+    }
+    
     ColumnLayout {
         id: mirrorColumnLayout
         anchors.fill: parent
@@ -166,14 +226,7 @@ Rectangle {
                                 var currentUrl = modelData ? modelData.url : ""
                                 console.log("测试镜像源连接:", currentUrl)
                                 if (configBridge && currentUrl) {
-                                    var result = configBridge.testMirrorConnection(currentUrl)
-                                    if (result) {
-                                        console.log("镜像源连接测试成功:", currentName)
-                                        configBridge.showMessage("success", "连接测试成功", `镜像源 "${currentName}" 连接正常`, 3000)
-                                    } else {
-                                        console.log("镜像源连接测试失败:", currentName)
-                                        configBridge.showMessage("error", "连接测试失败", `镜像源 "${currentName}" 连接失败，请检查网络或URL`, 3000)
-                                    }
+                                    settingsMirror.startMirrorTest(currentName, currentUrl)
                                 }
                             }
                         }
@@ -319,14 +372,7 @@ Rectangle {
                         onClicked: {
                             console.log("测试自定义镜像源连接:", customMirrorUrlField.text)
                             if (configBridge) {
-                                var result = configBridge.testMirrorConnection(customMirrorUrlField.text)
-                                if (result) {
-                                    console.log("自定义镜像源连接测试成功")
-                                    configBridge.showMessage("success", "连接测试成功", `镜像源 "${customMirrorNameField.text}" 连接正常`, 3000)
-                                } else {
-                                    console.log("自定义镜像源连接测试失败")
-                                    configBridge.showMessage("error", "连接测试失败", `镜像源 "${customMirrorNameField.text}" 连接失败，请检查网络或URL`, 3000)
-                                }
+                                settingsMirror.startMirrorTest(customMirrorNameField.text, customMirrorUrlField.text)
                             }
                         }
                     }
@@ -479,30 +525,25 @@ Rectangle {
                         
                         onClicked: {
                             console.log("测试所有镜像源连接")
-                            if (configBridge) {
+                            if (configBridge && settingsMirror.batchTestTotal === 0) {
                                 var sources = configBridge.mirrorSources
-                                var successCount = 0
-                                var totalCount = sources.length
+                                if (sources.length === 0) {
+                                    return
+                                }
                                 
+                                // 并行发起所有测试，结果在 onMirrorTestCompleted 中汇总
+                                var urls = {}
                                 for (var i = 0; i < sources.length; i++) {
-                                    var source = sources[i]
-                                    console.log("测试镜像源:", source.name, source.url)
-                                    var result = configBridge.testMirrorConnection(source.url)
-                                    if (result) {
-                                        console.log("镜像源连接测试成功:", source.name)
-                                        successCount++
-                                    } else {
-                                        console.log("镜像源连接测试失败:", source.name)
-                                    }
+                                    urls[sources[i].url] = (urls[sources[i].url] || 0) + 1
                                 }
+                                settingsMirror.batchTestUrls = urls
+                                settingsMirror.batchTestDone = 0
+                                settingsMirror.batchTestSuccess = 0
+                                settingsMirror.batchTestTotal = sources.length
                                 
-                                // 显示测试结果汇总
-                                if (successCount === totalCount) {
-                                    configBridge.showMessage("success", "测试完成", `所有 ${totalCount} 个镜像源连接正常`, 3000)
-                                } else if (successCount > 0) {
-                                    configBridge.showMessage("warning", "测试完成", `${successCount}/${totalCount} 个镜像源连接正常，${totalCount - successCount} 个连接失败`, 3000)
-                                } else {
-                                    configBridge.showMessage("error", "测试完成", `所有 ${totalCount} 个镜像源连接失败，请检查网络连接`, 3000)
+                                for (var j = 0; j < sources.length; j++) {
+                                    console.log("测试镜像源:", sources[j].name, sources[j].url)
+                                    configBridge.testMirrorConnectionAsync(sources[j].url)
                                 }
                             }
                         }
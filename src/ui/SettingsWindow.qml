@@ -69,6 +69,15 @@ ApplicationWindow {
                 console.log("当前环境切换为:", envName)
             })
             
+            // 包安装、卸载、同步在后台执行，完成后显示结果
+            configBridge.packageOperationFinished.connect(function(operation, envName, success, message) {
+                if (success) {
+                    messageManager.showSuccess(operation + "成功", message, 3000)
+                } else {
+                    messageManager.showError(operation + "失败", message, 5000)
+                }
+            })
+            
             // 连接统一消息信号
             configBridge.showMessageSignal.connect(function(messageType, title, content, duration) {
                 if (messageType === "success") {
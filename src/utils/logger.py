@@ -76,12 +76,24 @@ class Logger:
         """记录错误"""
         self._log_with_caller(logging.ERROR, message)
     
+    def exception(self, message: str):
+        """记录错误及当前正在处理的异常堆栈（在 except 块中调用）"""
+        self._log_with_caller(logging.ERROR, message, exc_info=sys.exc_info())
+    
     def critical(self, message: str):
         """记录严重错误"""
         self._log_with_caller(logging.CRITICAL, message)
     
-    def _log_with_caller(self, level: int, message: str):
+    def is_enabled_for(self, level: str) -> bool:
+        """判断指定级别的日志是否会被记录，可用于跳过开销较大的日志消息构造"""
+        return self.logger.isEnabledFor(getattr(logging, level.upper()))
+    
+    def _log_with_caller(self, level: int, message: str, exc_info=None):
         """使用真正的调用者信息记录日志"""
+        # 级别未启用时直接返回，省去栈帧查找和日志记录构造
+        if not self.logger.isEnabledFor(level):
+            return
+        
         # 获取调用者的帧信息
         import inspect
         frame = inspect.currentframe()
@@ -93,7 +105,7 @@ class Logger:
             
             # 创建日志记录
             record = self.logger.makeRecord(
-                self.logger.name, level, filename, lineno, message, (), None
+                self.logger.name, level, filename, lineno, message, (), exc_info
             )
             self.logger.handle(record)
         finally:
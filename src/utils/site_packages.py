@@ -0,0 +1,79 @@
+"""
+site-packages 工具
+查找虚拟环境的 site-packages 目录，并直接读取其中的包元数据列出已安装的包，无需启动子进程
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 包元数据目录的后缀 -> 其中的元数据文件名
+METADATA_SUFFIXES = {
+    ".dist-info": "METADATA",
+    ".egg-info": "PKG-INFO",
+}
+
+
+def find_site_packages(venv_path: Path) -> Optional[Path]:
+    """查找虚拟环境的 site-packages 目录"""
+    if os.name == 'nt':  # Windows
+        site_packages = venv_path / "Lib" / "site-packages"
+        return site_packages if site_packages.is_dir() else None
+    
+    # Unix/Linux: lib/pythonX.Y/site-packages
+    try:
+        with os.scandir(venv_path / "lib") as entries:
+            for entry in entries:
+                if entry.name.startswith("python") and entry.is_dir():
+                    site_packages = Path(entry.path) / "site-packages"
+                    if site_packages.is_dir():
+                        return site_packages
+    except OSError:
+        pass
+    return None
+
+
+def read_name_version(metadata_file: str) -> Tuple[str, str]:
+    """只读取元数据文件头部的 Name 和 Version 字段（遇到空行即停止，不解析包描述）"""
+    name = version = ""
+    with open(metadata_file, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if not line.strip():
+                break
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+            if key == "Name":
+                name = value.strip()
+            elif key == "Version":
+                version = value.strip()
+            if name and version:
+                break
+    return name, version
+
+
+def scan_site_packages(site_packages: Path) -> List[Dict[str, str]]:
+    """通过 *.dist-info / *.egg-info 元数据列出已安装的包（按名称排序，同名时保留第一个）"""
+    packages = {}
+    with os.scandir(site_packages) as entries:
+        for entry in entries:
+            base, ext = os.path.splitext(entry.name)
+            metadata_name = METADATA_SUFFIXES.get(ext)
+            if metadata_name is None:
+                continue
+            
+            # 旧式 egg-info 可能是单个文件而不是目录
+            metadata_file = os.path.join(entry.path, metadata_name) if entry.is_dir() else entry.path
+            try:
+                name, version = read_name_version(metadata_file)
+            except OSError:
+                name = version = ""
+            if not name:
+                # 元数据缺失时退回目录名（形如 name-version）
+                name, _, dir_version = base.partition("-")
+                version = version or dir_version
+            
+            key = name.lower()
+            if key not in packages:
+                packages[key] = {"name": name, "version": version}
+    return [packages[key] for key in sorted(packages)]
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+测试打包脚本
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import build_fixed
+
+
+def test_prune_internal_dir():
+    """测试只删除字节码缓存和类型存根，保留同名为 test/tests 的运行时子包"""
+    print("=== 测试清理打包目录 ===")
+    
+    with tempfile.TemporaryDirectory() as internal_dir:
+        internal_dir = Path(internal_dir)
+        for rel in ("pkg/__init__.py", "pkg/__init__.pyi", "pkg/__pycache__/mod.cpython-311.pyc",
+                    "pkg/tests/__init__.py", "pkg/test/helpers.py", "pkg/tests/__pycache__/x.pyc"):
+            (internal_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+            (internal_dir / rel).write_bytes(b"")
+        
+        assert build_fixed.prune_internal_dir(internal_dir) == 3
+        remaining = sorted(path.relative_to(internal_dir).as_posix() for path in internal_dir.rglob("*") if path.is_file())
+        assert remaining == ["pkg/__init__.py", "pkg/test/helpers.py", "pkg/tests/__init__.py"], remaining
+    
+    print("清理打包目录测试完成\n")
+
+
+def _hash_with_args(*args) -> str:
+    """以指定的命令行参数计算构建指纹"""
+    old_argv = sys.argv
+    sys.argv = ["build_fixed.py", *args]
+    try:
+        return build_fixed.compute_build_hash()
+    finally:
+        sys.argv = old_argv
+
+
+def test_build_hash():
+    """测试构建指纹随源码和影响产物的参数变化，不受 --fresh 和字节码缓存影响"""
+    print("=== 测试构建指纹 ===")
+    
+    old_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as project_dir:
+        os.chdir(project_dir)
+        try:
+            source_file = Path("src/core/app.py")
+            source_file.parent.mkdir(parents=True)
+            source_file.write_text("print('v1')\n", encoding="utf-8")
+            
+            base = _hash_with_args()
+            assert _hash_with_args() == base
+            assert _hash_with_args("--fresh") == base
+            assert _hash_with_args("--fast-start") != base
+            
+            # 字节码缓存不计入指纹
+            cache_file = Path("src/core/__pycache__/app.cpython-311.pyc")
+            cache_file.parent.mkdir()
+            cache_file.write_bytes(b"cache")
+            assert _hash_with_args() == base
+            
+            source_file.write_text("print('v2')\n", encoding="utf-8")
+            assert _hash_with_args() != base
+        finally:
+            os.chdir(old_cwd)
+    
+    print("构建指纹测试完成\n")
+
+
+if __name__ == "__main__":
+    print("开始测试打包脚本...\n")
+    
+    try:
+        test_prune_internal_dir()
+        test_build_hash()
+        
+        print("✅ 所有测试完成！")
+        
+    except Exception as e:
+        print(f"❌ 测试过程中发生错误: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+测试配置桥接器与环境工作线程
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 添加src目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core import config_bridge
+from core.config_bridge import ConfigBridge, PythonEnvironmentWorker
+
+
+def _make_worker(envs_dir: Path) -> PythonEnvironmentWorker:
+    """创建使用指定环境目录的工作线程对象（不启动线程）"""
+    worker = PythonEnvironmentWorker()
+    worker.environments_dir = envs_dir
+    worker._info_cache_file = envs_dir / config_bridge.ENV_INFO_CACHE_FILE
+    worker._info_cache = {}
+    worker._info_cache_dirty = False
+    worker._envs_dir_listing = (None, [])
+    return worker
+
+
+def _make_env(envs_dir: Path, name: str, version: str = "3.11.9") -> Path:
+    """创建只包含解释器占位文件和 pyvenv.cfg 的假虚拟环境"""
+    venv_path = envs_dir / name / ".venv"
+    python_exe = venv_path.joinpath(*config_bridge.VENV_PYTHON_REL)
+    python_exe.parent.mkdir(parents=True)
+    python_exe.write_bytes(b"")
+    (venv_path / "pyvenv.cfg").write_text(f"home = /usr/bin\nversion_info = {version}\n", encoding="utf-8")
+    return venv_path
+
+
+def _fake_uv_venv(worker: PythonEnvironmentWorker) -> list:
+    """用创建最小虚拟环境的函数代替 uv venv，返回记录每次调用的 (命令, 工作目录) 列表"""
+    calls = []
+    
+    def run_uv_venv(cmd, cwd, timeout_seconds):
+        calls.append((cmd, cwd))
+        venv_path = cwd / ".venv"
+        prompt = cmd[cmd.index("--prompt") + 1] if "--prompt" in cmd else cwd.name
+        python_exe = venv_path.joinpath(*config_bridge.VENV_PYTHON_REL)
+        python_exe.parent.mkdir(parents=True)
+        python_exe.symlink_to(sys.executable)
+        (venv_path / "pyvenv.cfg").write_text(f"home = /usr/bin\nversion_info = 3.11.9\nprompt = {prompt}\n",
+                                             encoding="utf-8")
+        (python_exe.parent / "activate").write_text(f'VIRTUAL_ENV="{venv_path}"\nPS1="({prompt}) $PS1"\n',
+                                                    encoding="utf-8")
+        (venv_path / "_virtualenv.pth").write_text("import _virtualenv\n", encoding="utf-8")
+    
+    worker._uv_version = "uv 0.0.0"
+    worker._run_uv_venv = run_uv_venv
+    return calls
+
+
+@contextlib.contextmanager
+def _bridge_in(work_dir: Path):
+    """在临时工作目录中创建配置桥接器（配置文件写在该目录下），其中包含一个没有 site-packages 的环境"""
+    old_cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        bridge = ConfigBridge()
+        _make_env(work_dir, "demo")
+        bridge._set_environments_cache([{"name": "demo", "path": str(work_dir / "demo")}])
+        yield bridge
+    finally:
+        os.chdir(old_cwd)
+
+
+def _fake_uv_list(bridge: ConfigBridge, script: str) -> list:
+    """用输出 freeze 格式的 Python 脚本代替 uv pip list，返回记录每次启动命令的列表"""
+    calls = []
+    
+    def build_cmd(subcmd, python_exe, with_mirror=False):
+        calls.append(subcmd)
+        return [sys.executable, "-c", script]
+    
+    bridge._build_uv_cmd = build_cmd
+    return calls
+
+
+def _record_loaded(bridge: ConfigBridge) -> tuple:
+    """记录 environmentPackagesLoaded 信号，返回 (结果列表, 收到结果的事件)"""
+    loaded, event = [], threading.Event()
+    
+    def on_loaded(env_name, packages):
+        loaded.append((env_name, packages))
+        event.set()
+    
+    bridge.environmentPackagesLoaded.connect(on_loaded)
+    return loaded, event
+
+
+def test_packages_listing_reused():
+    """测试后台获取包列表期间报告加载状态，重复请求复用同一次获取"""
+    print("=== 测试后台获取包列表 ===")
+    
+    with tempfile.TemporaryDirectory() as work_dir, _bridge_in(Path(work_dir)) as bridge:
+        calls = _fake_uv_list(bridge, "import time; time.sleep(0.3); print('b==2'); print('a @ file:///a')")
+        loaded, event = _record_loaded(bridge)
+        
+        assert not bridge.isLoadingEnvironmentPackages("demo")
+        assert bridge.getEnvironmentPackages("demo") == []
+        assert bridge.isLoadingEnvironmentPackages("demo")
+        assert bridge.getEnvironmentPackages("demo") == []
+        assert len(calls) == 1, calls
+        
+        assert event.wait(10)
+        assert loaded == [("demo", [{"name": "b", "version": "2"}, {"name": "a", "version": ""}])], loaded
+        assert not bridge.isLoadingEnvironmentPackages("demo")
+        
+        # 结果已缓存，再次获取不启动 uv
+        assert bridge.getEnvironmentPackages("demo") == loaded[0][1]
+        assert len(calls) == 1, calls
+    
+    print("后台获取包列表测试完成\n")
+
+
+def test_packages_cancel_before_start():
+    """测试 uv 进程启动前取消获取时，进程启动后立即结束且不再通知结果"""
+    print("=== 测试启动前取消获取包列表 ===")
+    
+    with tempfile.TemporaryDirectory() as work_dir, _bridge_in(Path(work_dir)) as bridge:
+        _fake_uv_list(bridge, "import time; time.sleep(30); print('a==1')")
+        loaded, event = _record_loaded(bridge)
+        
+        # 占住唯一的后台线程，使获取任务在取消后才开始运行
+        bridge._exec = ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        bridge._exec.submit(release.wait)
+        
+        assert bridge.getEnvironmentPackages("demo") == []
+        bridge.cancelEnvironmentPackages("demo")
+        assert not bridge.isLoadingEnvironmentPackages("demo")
+        
+        started = time.monotonic()
+        release.set()
+        bridge._exec.submit(lambda: None).result(timeout=20)
+        assert time.monotonic() - started < 20
+        assert not event.is_set(), loaded
+        bridge._exec.shutdown()
+    
+    print("启动前取消获取包列表测试完成\n")
+
+
+def test_uv_command_results():
+    """测试后台 uv 命令的结果通过 packageOperationFinished 通知，成功时使包列表和测试缓存失效"""
+    print("=== 测试后台 uv 命令 ===")
+    
+    with tempfile.TemporaryDirectory() as work_dir, _bridge_in(Path(work_dir)) as bridge:
+        finished, event = [], threading.Event()
+        
+        def on_finished(*args):
+            finished.append(args)
+            event.set()
+        
+        bridge.packageOperationFinished.connect(on_finished)
+        
+        bridge._pkg_cache["demo"] = (time.monotonic(), [{"name": "a", "version": "1"}])
+        bridge._test_cache["demo"] = (0, 0)
+        _fake_uv_list(bridge, "import sys; sys.stderr.write('boom'); sys.exit(1)")
+        assert bridge.installPackage("demo", "a")
+        assert event.wait(10)
+        assert finished == [("安装包", "demo", False, "boom")], finished
+        assert "demo" in bridge._pkg_cache and "demo" in bridge._test_cache
+        
+        finished.clear()
+        event.clear()
+        _fake_uv_list(bridge, "pass")
+        assert bridge.uninstallPackage("demo", "a")
+        assert event.wait(10)
+        assert finished and finished[0][:3] == ("卸载包", "demo", True), finished
+        assert "demo" not in bridge._pkg_cache and "demo" not in bridge._test_cache
+    
+    print("后台 uv 命令测试完成\n")
+
+
+def test_environment_test_results():
+    """测试需要启动解释器的环境测试结果通过 environmentTested 通知，只记录测试通过的环境"""
+    print("=== 测试环境可用性检查 ===")
+    
+    with tempfile.TemporaryDirectory() as work_dir, _bridge_in(Path(work_dir)) as bridge:
+        tested, event = [], threading.Event()
+        
+        def on_tested(env_name, available):
+            tested.append((env_name, available))
+            event.set()
+        
+        bridge.environmentTested.connect(on_tested)
+        
+        # pyvenv.cfg 中的基础解释器目录不存在时启动解释器检查，空文件无法执行
+        venv_path = Path(work_dir) / "demo" / ".venv"
+        (venv_path / "pyvenv.cfg").write_text("home = /no/such/dir\n", encoding="utf-8")
+        assert bridge.testEnvironment("demo")
+        assert event.wait(10)
+        assert tested == [("demo", False)], tested
+        assert "demo" not in bridge._test_cache
+        
+        python_exe = venv_path.joinpath(*config_bridge.VENV_PYTHON_REL)
+        python_exe.unlink()
+        python_exe.symlink_to(sys.executable)
+        tested.clear()
+        event.clear()
+        assert bridge.testEnvironment("demo")
+        assert event.wait(10)
+        assert tested == [("demo", True)], tested
+        assert "demo" in bridge._test_cache
+    
+    print("环境可用性检查测试完成\n")
+
+
+def test_environment_test_cache():
+    """测试解释器未变化时复用通过的测试结果，解释器变化或安装包后重新测试"""
+    print("=== 测试环境测试结果缓存 ===")
+    
+    with tempfile.TemporaryDirectory() as work_dir, _bridge_in(Path(work_dir)) as bridge:
+        tested = []
+        bridge.environmentTested.connect(lambda env_name, available: tested.append((env_name, available)))
+        spawned = []
+        bridge._run_environment_test = lambda env_name, python_exe, test_key: spawned.append(env_name)
+        bridge._exec = ThreadPoolExecutor(max_workers=1)
+        
+        # 基础解释器目录不存在，首次测试需要启动解释器
+        venv_path = Path(work_dir) / "demo" / ".venv"
+        (venv_path / "pyvenv.cfg").write_text("home = /no/such/dir\n", encoding="utf-8")
+        python_exe = str(venv_path.joinpath(*config_bridge.VENV_PYTHON_REL))
+        st = os.stat(python_exe)
+        bridge._on_environment_test_completed("demo", (st.st_mtime_ns, st.st_size), True)
+        tested.clear()
+        
+        assert bridge.testEnvironment("demo")
+        bridge._exec.submit(lambda: None).result(timeout=10)
+        assert tested == [("demo", True)] and spawned == [], (tested, spawned)
+        
+        # 解释器文件变化后重新测试
+        os.utime(python_exe, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert bridge.testEnvironment("demo")
+        bridge._exec.submit(lambda: None).result(timeout=10)
+        assert spawned == ["demo"], spawned
+        
+        # 安装包成功后使缓存失效
+        st = os.stat(python_exe)
+        bridge._on_environment_test_completed("demo", (st.st_mtime_ns, st.st_size), True)
+        bridge._on_uv_command_completed("安装包", "demo", True, "ok")
+        assert "demo" not in bridge._test_cache
+        bridge._exec.shutdown()
+    
+    print("环境测试结果缓存测试完成\n")
+
+
+def test_environment_test_base_python():
+    """测试只有 pyvenv.cfg 记录的基础解释器文件存在时才跳过启动解释器"""
+    print("=== 测试基础解释器检查 ===")
+    
+    with tempfile.TemporaryDirectory() as work_dir, _bridge_in(Path(work_dir)) as bridge:
+        tested = []
+        bridge.environmentTested.connect(lambda env_name, available: tested.append((env_name, available)))
+        bridge._exec = ThreadPoolExecutor(max_workers=1)
+        
+        # 基础解释器已卸载但 home 目录仍在：不能直接判定可用，启动占位解释器失败
+        home = Path(work_dir) / "base"
+        home.mkdir()
+        cfg_file = Path(work_dir) / "demo" / ".venv" / "pyvenv.cfg"
+        cfg_file.write_text(f"home = {home}\nversion_info = 3.11.9\n", encoding="utf-8")
+        assert bridge.testEnvironment("demo")
+        bridge._exec.submit(lambda: None).result(timeout=10)
+        assert tested == [("demo", False)], tested
+        
+        # 基础解释器存在时直接判定可用
+        base_name = config_bridge.BASE_PYTHON_NAMES[0]
+        (home / base_name).write_bytes(b"")
+        tested.clear()
+        assert bridge.testEnvironment("demo")
+        assert tested == [("demo", True)], tested
+        
+        # pyvenv.cfg 记录的 executable 优先于 home
+        cfg_file.write_text(f"home = {home}\nexecutable = {home / 'missing'}\nversion_info = 3.11.9\n", encoding="utf-8")
+        assert not config_bridge.PythonEnvironmentWorker._base_python_exists(
+            config_bridge.PythonEnvironmentWorker._read_pyvenv_cfg(str(cfg_file.parent)))
+        bridge._exec.shutdown()
+    
+    print("基础解释器检查测试完成\n")
+
+
+def test_create_environment_from_template():
+    """测试新环境从模板复制：路径和提示符被改写，文件不与模板共享，模板只创建一次"""
+    print("=== 测试从模板创建环境 ===")
+    
+    with tempfile.TemporaryDirectory() as envs_dir:
+        envs_dir = Path(envs_dir)
+        worker = _make_worker(envs_dir)
+        try:
+            calls = _fake_uv_venv(worker)
+            created = []
+            worker.environmentCreated.connect(lambda *args: created.append(args[:2]))
+            
+            worker.create_environment("one", "3.11")
+            worker.create_environment("two", "3.11")
+            assert created == [("one", True), ("two", True)], created
+            assert len(calls) == 1, calls
+            assert calls[0][1] == envs_dir / config_bridge.ENV_TEMPLATES_DIR / "py3.11"
+            
+            template_venv = calls[0][1] / ".venv"
+            for name in ("one", "two"):
+                venv_path = envs_dir / name / ".venv"
+                cfg = (venv_path / "pyvenv.cfg").read_text(encoding="utf-8")
+                assert f"prompt = {name}\n" in cfg, cfg
+                activate = venv_path.joinpath(config_bridge.VENV_PYTHON_REL[0], "activate").read_text(encoding="utf-8")
+                assert f'VIRTUAL_ENV="{venv_path}"' in activate and f"({name})" in activate, activate
+                assert str(template_venv) not in activate
+                assert not os.path.samefile(venv_path / "_virtualenv.pth", template_venv / "_virtualenv.pth")
+            
+            # 原地改写环境中的文件不影响模板和其他环境
+            with open(envs_dir / "one" / ".venv" / "_virtualenv.pth", "a", encoding="utf-8") as f:
+                f.write("changed\n")
+            for venv_path in (template_venv, envs_dir / "two" / ".venv"):
+                assert (venv_path / "_virtualenv.pth").read_text(encoding="utf-8") == "import _virtualenv\n"
+            assert config_bridge.ENV_PROMPT_PLACEHOLDER in (template_venv / "pyvenv.cfg").read_text(encoding="utf-8")
+        finally:
+            worker.shutdown()
+    
+    print("从模板创建环境测试完成\n")
+
+
+def test_create_environment_fallback():
+    """测试从模板复制失败时清理半成品并改用 uv venv 直接创建"""
+    print("=== 测试模板复制失败时的回退 ===")
+    
+    with tempfile.TemporaryDirectory() as envs_dir:
+        envs_dir = Path(envs_dir)
+        worker = _make_worker(envs_dir)
+        try:
+            calls = _fake_uv_venv(worker)
+            created = []
+            worker.environmentCreated.connect(lambda *args: created.append(args[:2]))
+            
+            def broken_clone(template_venv, venv_path, env_name):
+                (venv_path / "partial").mkdir(parents=True)
+                raise OSError("disk full")
+            
+            worker._clone_template = broken_clone
+            worker.create_environment("demo", "3.12")
+            assert created == [("demo", True)], created
+            assert [cmd[1:] for cmd, cwd in calls][-1] == ["venv", "--python", "3.12"], calls
+            assert calls[-1][1] == envs_dir / "demo"
+            assert not (envs_dir / "demo" / ".venv" / "partial").exists()
+            assert "prompt = demo\n" in (envs_dir / "demo" / ".venv" / "pyvenv.cfg").read_text(encoding="utf-8")
+        finally:
+            worker.shutdown()
+    
+    print("模板复制失败回退测试完成\n")
+
+
+def test_info_cache_written_on_change():
+    """测试环境信息缓存只在内容变化时写盘，且不留下临时文件"""
+    print("=== 测试环境信息缓存写入 ===")
+    
+    with tempfile.TemporaryDirectory() as envs_dir:
+        envs_dir = Path(envs_dir)
+        worker = _make_worker(envs_dir)
+        cache_file = worker._info_cache_file
+        try:
+            _make_env(envs_dir, "demo")
+            
+            # 没有变化时不写盘
+            worker._save_info_cache()
+            assert not cache_file.exists()
+            
+            info = worker.get_environment_info("demo")
+            assert info["python_version"] == "Python 3.11.9", info
+            worker._save_info_cache()
+            assert "demo" in json.loads(cache_file.read_text(encoding="utf-8"))
+            assert not cache_file.with_name(cache_file.name + ".tmp").exists()
+            
+            # 缓存命中的刷新不会重写缓存文件
+            cache_file.unlink()
+            worker.refresh_environments()
+            worker._save_info_cache()
+            assert not cache_file.exists()
+            
+            # 环境被删除后缓存移除对应条目并写回
+            shutil.rmtree(envs_dir / "demo")
+            worker.refresh_environments()
+            assert json.loads(cache_file.read_text(encoding="utf-8")) == {}
+        finally:
+            worker.shutdown()
+    
+    print("环境信息缓存写入测试完成\n")
+
+
+if __name__ == "__main__":
+    print("开始测试配置桥接器...\n")
+    
+    try:
+        test_packages_listing_reused()
+        test_packages_cancel_before_start()
+        test_uv_command_results()
+        test_environment_test_results()
+        test_environment_test_cache()
+        test_environment_test_base_python()
+        test_create_environment_from_template()
+        test_create_environment_fallback()
+        test_info_cache_written_on_change()
+        
+        print("✅ 所有测试完成！")
+        
+    except Exception as e:
+        print(f"❌ 测试过程中发生错误: {e}")
+        import traceback
+        traceback.print_exc()
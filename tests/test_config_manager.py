@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+测试配置管理器
+"""
+
+import sys
+import pickle
+import tomllib
+import tempfile
+from pathlib import Path
+
+# 添加src目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core import config_manager
+from core.config_manager import ConfigManager
+
+
+def _load_manager(config_dir: str) -> ConfigManager:
+    """在指定目录中创建并加载配置管理器"""
+    manager = ConfigManager(str(Path(config_dir) / "config.toml"))
+    assert manager.load_config()
+    return manager
+
+
+def test_save_in_place_edit():
+    """测试原地修改 get() 的返回值并调用 _touch() 后会被保存"""
+    print("=== 测试原地修改后保存 ===")
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        manager.get("mirrors.sources").append(
+            {"name": "local", "url": "http://localhost/simple/", "priority": 9, "enabled": True}
+        )
+        assert manager._touch("mirrors.sources")
+        assert manager.save_config()
+        
+        reloaded = _load_manager(config_dir)
+        names = [source["name"] for source in reloaded.get_mirror_sources()]
+        assert "local" in names, names
+    
+    print("原地修改保存测试完成\n")
+
+
+def test_restore_in_place_edit():
+    """测试经 _touch() 标记的原地修改会被 has_changes() 报告并能通过 restore_backup() 撤销"""
+    print("=== 测试原地修改后恢复备份 ===")
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        assert not manager.has_changes()
+        
+        manager.get("environments.available").append("python3.13")
+        assert manager._touch("environments.available")
+        assert manager.has_changes()
+        
+        assert manager.restore_backup()
+        assert "python3.13" not in manager.get_available_environments()
+        assert not manager.has_changes()
+    
+    print("原地修改恢复测试完成\n")
+
+
+def test_get_after_section_mutated():
+    """测试原地修改 get() 返回的配置节后，读取其中的键得到最新值"""
+    print("=== 测试修改配置节后读取 ===")
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        assert manager.get("ui.theme") == "auto"
+        assert manager.get("ui.font_size", 12) == 12
+        
+        ui = manager.get("ui")
+        ui["theme"] = "dark"
+        ui["font_size"] = 14
+        assert manager.get("ui.theme") == "dark"
+        assert manager.get("ui.font_size", 12) == 14
+        
+        # 中间表缺失或不是表时返回默认值
+        assert manager.get("missing.key", "x") == "x"
+        assert manager.get("ui.theme.deeper", "x") == "x"
+    
+    print("修改配置节后读取测试完成\n")
+
+
+def test_parse_cache():
+    """测试解析缓存只在配置文件和默认配置指纹都一致时命中"""
+    print("=== 测试配置解析缓存 ===")
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        cache_file = manager._cache_file
+        assert cache_file.exists()
+        
+        # 伪造一份内容不同的缓存，验证命中时直接使用缓存中的快照
+        st = manager.config_file.stat()
+        cached_config = dict(manager.config, ui={"theme": "from-cache"})
+        snapshot = pickle.dumps(cached_config, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((config_manager.CONFIG_SCHEMA_FINGERPRINT, st.st_size, st.st_mtime_ns, snapshot), f)
+        assert _load_manager(config_dir).get("ui.theme") == "from-cache"
+        
+        # 默认配置指纹不一致（如程序升级后）时不使用旧缓存
+        with open(cache_file, 'wb') as f:
+            pickle.dump(("stale-fingerprint", st.st_size, st.st_mtime_ns, snapshot), f)
+        assert _load_manager(config_dir).get("ui.theme") == "auto"
+        
+        # 旧格式或损坏的缓存直接重新解析
+        cache_file.write_bytes(b"not a pickle")
+        assert _load_manager(config_dir).get("ui.theme") == "auto"
+    
+    print("配置解析缓存测试完成\n")
+
+
+def test_change_tracking():
+    """测试 set()/set_many() 只在值变化时标记修改，保存后清除"""
+    print("=== 测试配置修改跟踪 ===")
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        
+        assert manager.set("ui.theme", "auto")
+        assert not manager.has_changes()
+        assert manager.set("ui.theme", "dark")
+        assert manager.has_changes()
+        assert manager.save_config()
+        assert not manager.has_changes()
+        
+        assert manager.set_many("environments", {"default": "python3.11"})
+        assert not manager.has_changes()
+        assert manager.set_many("environments", {"current": "demo", "current_path": "/envs/demo"})
+        assert manager.has_changes()
+        assert manager.get("environments.current") == "demo"
+        assert manager.get("environments.current_path") == "/envs/demo"
+        
+        assert manager.save_config()
+        reloaded = _load_manager(config_dir)
+        assert reloaded.get("ui.theme") == "dark"
+        assert reloaded.get("environments.current") == "demo"
+    
+    print("配置修改跟踪测试完成\n")
+
+
+def test_set_many_single_signal():
+    """测试 set_many() 只对变化的值发送一次变化信号，配置节不存在时创建"""
+    print("=== 测试批量设置 ===")
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        changes = []
+        manager.config_changed.connect(lambda key, value: changes.append((key, value)))
+        
+        assert manager.set_many("ui", {"theme": "dark", "window_width": 1024, "window_height": 768})
+        assert manager.set_many("ui", {"theme": "dark", "window_width": 1024})
+        assert changes == [("ui", {"theme": "dark", "window_width": 1024, "window_height": 768})], changes
+        assert manager.get("ui.window_height") == 768
+        
+        changes.clear()
+        assert manager.set_many("ui", {"theme": "dark", "window_width": 800})
+        assert changes == [("ui", {"window_width": 800})], changes
+        
+        assert manager.set_many("extra.section", {"enabled": True})
+        assert manager.get("extra.section.enabled") is True
+    
+    print("批量设置测试完成\n")
+
+
+def test_set_after_table_replaced():
+    """测试整张表被替换后，set() 写入新表而不是跳转表中记录的旧表"""
+    print("=== 测试替换配置表后设置 ===")
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        
+        assert manager.set("ui.theme", "light")
+        assert manager.set("ui", {"theme": "x"})
+        assert manager.set("ui.theme", "dark")
+        assert manager.config["ui"] == {"theme": "dark"}
+        assert manager.get("ui.theme") == "dark"
+        
+        assert manager.reset_to_default()
+        assert manager.set("ui.theme", "light")
+        assert manager.config["ui"] == {"theme": "light"}
+        assert config_manager.DEFAULT_CONFIG["ui"]["theme"] == "auto"
+    
+    print("替换配置表后设置测试完成\n")
+
+
+def test_set_after_config_reloaded():
+    """测试恢复备份、重新加载或批量写入整张表后，跳转表不再指向旧的父字典"""
+    print("=== 测试重新加载配置后设置 ===")
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        
+        assert manager.set("ui.theme", "dark")
+        assert manager.restore_backup()
+        assert manager.set("ui.theme", "light")
+        assert manager.config["ui"]["theme"] == "light"
+        
+        assert manager.load_config()
+        assert manager.set("ui.theme", "dark")
+        assert manager.config["ui"]["theme"] == "dark"
+        
+        assert manager.set("plugins.options.demo", 1)
+        assert manager.set_many("plugins", {"options": {"demo": 2}})
+        assert manager.set("plugins.options.demo", 3)
+        assert manager.config["plugins"]["options"] == {"demo": 3}
+        assert manager.get("plugins.options.demo") == 3
+    
+    print("重新加载配置后设置测试完成\n")
+
+
+def test_default_config_read_only():
+    """测试默认配置模板逐层只读，重置后修改配置不会影响模板"""
+    print("=== 测试默认配置只读 ===")
+    
+    defaults = config_manager.thaw_config(config_manager.DEFAULT_CONFIG)
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        assert manager.reset_to_default()
+        manager.config["ui"]["theme"] = "dark"
+        manager.config["mirrors"]["sources"][0]["enabled"] = False
+        manager.config["mirrors"]["sources"].append({"name": "x"})
+        manager.config["environments"]["available"].clear()
+        assert manager.reset_to_default()
+        assert manager.config == defaults
+    
+    assert config_manager.thaw_config(config_manager.DEFAULT_CONFIG) == defaults
+    for mutate in (
+        lambda: config_manager.DEFAULT_CONFIG["ui"].__setitem__("theme", "dark"),
+        lambda: config_manager.DEFAULT_CONFIG["mirrors"]["sources"][0].__setitem__("enabled", False),
+        lambda: config_manager.DEFAULT_CONFIG["environments"]["available"].append("python3.13"),
+    ):
+        try:
+            mutate()
+        except (TypeError, AttributeError):
+            pass
+        else:
+            raise AssertionError("默认配置模板不应可修改")
+    
+    print("默认配置只读测试完成\n")
+
+
+def test_save_keeps_backup():
+    """测试保存时旧配置备份为 .toml.backup，新内容写入配置文件"""
+    print("=== 测试保存备份 ===")
+    
+    with tempfile.TemporaryDirectory() as config_dir:
+        manager = _load_manager(config_dir)
+        backup_file = manager.config_file.with_suffix('.toml.backup')
+        old_content = manager.config_file.read_bytes()
+        
+        assert manager.set("ui.theme", "dark")
+        assert manager.save_config()
+        assert backup_file.read_bytes() == old_content
+        with open(manager.config_file, 'rb') as f:
+            assert tomllib.load(f)["ui"]["theme"] == "dark"
+        
+        # 再次保存时备份替换为上一次保存的内容
+        saved_content = manager.config_file.read_bytes()
+        assert manager.set("ui.theme", "light")
+        assert manager.save_config()
+        assert backup_file.read_bytes() == saved_content
+        assert not manager.config_file.with_suffix('.toml.tmp').exists()
+    
+    print("保存备份测试完成\n")
+
+
+if __name__ == "__main__":
+    print("开始测试配置管理器...\n")
+    
+    try:
+        test_save_in_place_edit()
+        test_restore_in_place_edit()
+        test_get_after_section_mutated()
+        test_parse_cache()
+        test_change_tracking()
+        test_set_many_single_signal()
+        test_set_after_table_replaced()
+        test_set_after_config_reloaded()
+        test_default_config_read_only()
+        test_save_keeps_backup()
+        
+        print("✅ 所有测试完成！")
+        
+    except Exception as e:
+        print(f"❌ 测试过程中发生错误: {e}")
+        import traceback
+        traceback.print_exc()
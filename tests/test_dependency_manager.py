@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+测试依赖管理器
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# 添加src目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from packaging.specifiers import SpecifierSet
+from packaging.version import Version
+
+from core.dependency_manager import DependencyManager, DependencyInfo, VersionResolver
+
+
+def _write_plugin(plugins_dir: Path, name: str, dependencies) -> Path:
+    """创建只包含 pyproject.toml 的测试插件目录"""
+    plugin_dir = plugins_dir / name
+    plugin_dir.mkdir()
+    deps = ", ".join(f"'{dep}'" for dep in dependencies)
+    (plugin_dir / "pyproject.toml").write_text(
+        f'[project]\nname = "{name}"\nversion = "0.1.0"\ndependencies = [{deps}]\n',
+        encoding="utf-8"
+    )
+    return plugin_dir
+
+
+def test_requirement_extras_and_markers():
+    """测试依赖中的 extras 被保留、不满足环境标记的依赖被跳过"""
+    print("=== 测试依赖 extras 和环境标记 ===")
+    
+    manager = DependencyManager()
+    with tempfile.TemporaryDirectory() as plugins_dir:
+        plugin_dir = _write_plugin(Path(plugins_dir), "demo", [
+            "requests[socks,security]>=2.0,<3",
+            "psutil>=7.1.0",
+            'only-elsewhere>=1.0; sys_platform == "no-such-platform"',
+            'always-here; python_version >= "3"',
+        ])
+        deps = {dep.name: dep.version_spec for dep in manager.read_plugin_dependencies(plugin_dir)}
+    
+    assert SpecifierSet(deps["requests[security,socks]"]) == SpecifierSet(">=2.0,<3"), deps
+    assert deps["psutil"] == ">=7.1.0", deps
+    assert deps["always-here"] == "", deps
+    assert "only-elsewhere" not in deps, deps
+    
+    print("依赖 extras 和环境标记测试完成\n")
+
+
+def test_version_conflict_resolution():
+    """测试版本协商按下界版本比较，选择要求最高的规范"""
+    print("=== 测试版本协商 ===")
+    
+    assert VersionResolver._extract_lower_bound(SpecifierSet(">=7.1.0,<8")) == Version("7.1.0")
+    assert VersionResolver._extract_lower_bound(SpecifierSet("~=2.1")) == Version("2.1")
+    assert VersionResolver._extract_lower_bound(SpecifierSet("<2")) is None
+    assert VersionResolver._extract_lower_bound(SpecifierSet("==1.*")) is None
+    
+    def resolve(*specs):
+        return VersionResolver.resolve_version_conflict([DependencyInfo("pkg", spec) for spec in specs])
+    
+    # 1.1.0 高于 1.0.100（旧的 主*10000+次*100+修订 编码会把两者排反）
+    assert resolve(">=1.0.100", ">=1.1.0") == ">=1.1.0"
+    assert resolve(">=7.1.0", ">=8.0.0,<9") == ">=8.0.0,<9"
+    assert resolve("<2", ">=1.5") == ">=1.5"
+    assert resolve("<2", "<3") == "<2"
+    assert resolve(">=1.0") == ">=1.0"
+    assert resolve() is None
+    
+    print("版本协商测试完成\n")
+
+
+if __name__ == "__main__":
+    print("开始测试依赖管理器...\n")
+    
+    try:
+        test_requirement_extras_and_markers()
+        test_version_conflict_resolution()
+        
+        print("✅ 所有测试完成！")
+        
+    except Exception as e:
+        print(f"❌ 测试过程中发生错误: {e}")
+        import traceback
+        traceback.print_exc()
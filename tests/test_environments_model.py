@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+测试环境列表模型
+"""
+
+import sys
+from pathlib import Path
+
+# 添加src目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.environments_model import EnvironmentsModel
+
+
+def _env(name: str, size_mb: float = 1.0) -> dict:
+    """构造环境信息字典"""
+    return {"name": name, "path": f"envs/{name}", "python_version": "3.11", "packages_count": 0,
+            "size_mb": size_mb, "is_active": False}
+
+
+def _record_events(model: EnvironmentsModel) -> list:
+    """记录模型发出的行变化信号"""
+    events = []
+    model.dataChanged.connect(lambda first, last, *args: events.append(("changed", first.row())))
+    model.rowsInserted.connect(lambda parent, first, last: events.append(("inserted", first)))
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(("removed", first)))
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    return events
+
+
+def _names(model: EnvironmentsModel) -> list:
+    """按行读取模型中的环境名"""
+    return [model.data(model.index(row, 0), EnvironmentsModel.NameRole) for row in range(model.rowCount())]
+
+
+def test_set_environments_diff():
+    """测试 set_environments 只对新增、移除和变化的行发送通知"""
+    print("=== 测试环境列表增量更新 ===")
+    
+    model = EnvironmentsModel()
+    events = _record_events(model)
+    
+    model.set_environments([_env("a"), _env("b")])
+    assert _names(model) == ["a", "b"]
+    assert events == [("inserted", 0), ("inserted", 1)], events
+    
+    # 内容不变时不发送任何通知
+    events.clear()
+    model.set_environments([_env("a"), _env("b")])
+    assert events == [], events
+    
+    # 只有变化的行发送 dataChanged，新增的行就地插入
+    events.clear()
+    model.set_environments([_env("a"), _env("b", size_mb=2.0), _env("c")])
+    assert _names(model) == ["a", "b", "c"]
+    assert events == [("changed", 1), ("inserted", 2)], events
+    assert model.data(model.index(1, 0), EnvironmentsModel.SizeRole) == 2.0
+    
+    # 移除的行单独通知
+    events.clear()
+    model.set_environments([_env("a"), _env("c")])
+    assert _names(model) == ["a", "c"]
+    assert events == [("removed", 1)], events
+    
+    # 保留的行顺序变化时整体重置
+    events.clear()
+    model.set_environments([_env("c"), _env("a")])
+    assert _names(model) == ["c", "a"]
+    assert events == [("reset",)], events
+    
+    print("环境列表增量更新测试完成\n")
+
+
+if __name__ == "__main__":
+    print("开始测试环境列表模型...\n")
+    
+    try:
+        test_set_environments_diff()
+        
+        print("✅ 所有测试完成！")
+        
+    except Exception as e:
+        print(f"❌ 测试过程中发生错误: {e}")
+        import traceback
+        traceback.print_exc()
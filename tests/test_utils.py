@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """
-测试日志和异常管理器
+测试日志、异常管理器和 site-packages 工具
 """
 
 import sys
+import tempfile
 from pathlib import Path
 
 # 添加src目录到Python路径
@@ -11,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from utils.logger import Logger
 from utils.exception_handler import ExceptionHandler
+from utils.site_packages import scan_site_packages
 
 
 def test_logger():
@@ -138,6 +140,45 @@ def test_error_callback():
     print("错误回调功能测试完成\n")
 
 
+def test_scan_site_packages():
+    """测试从 dist-info / egg-info 元数据列出已安装的包"""
+    print("=== 测试 site-packages 扫描 ===")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        site_packages = Path(temp_dir)
+        
+        # wheel 安装：目录名已规范化，显示名以 METADATA 中的 Name 为准
+        dist_info = site_packages / "pyyaml-6.0.2.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            "Metadata-Version: 2.1\nName: PyYAML\nVersion: 6.0.2\n\nName: 正文中的内容不应被读取\n",
+            encoding="utf-8"
+        )
+        
+        # 旧式/开发模式安装：egg-info 目录和单文件 egg-info
+        egg_info = site_packages / "legacy_pkg-1.0-py3.11.egg-info"
+        egg_info.mkdir()
+        (egg_info / "PKG-INFO").write_text("Metadata-Version: 1.1\nName: legacy-pkg\nVersion: 1.0\n", encoding="utf-8")
+        (site_packages / "single_file-0.3-py3.11.egg-info").write_text(
+            "Metadata-Version: 1.0\nName: single-file\nVersion: 0.3\n", encoding="utf-8"
+        )
+        
+        # 元数据缺失时退回目录名
+        (site_packages / "broken-2.0.dist-info").mkdir()
+        (site_packages / "not_a_package").mkdir()
+        
+        packages = scan_site_packages(site_packages)
+    
+    assert packages == [
+        {"name": "broken", "version": "2.0"},
+        {"name": "legacy-pkg", "version": "1.0"},
+        {"name": "PyYAML", "version": "6.0.2"},
+        {"name": "single-file", "version": "0.3"},
+    ], packages
+    
+    print("site-packages 扫描测试完成\n")
+
+
 if __name__ == "__main__":
     print("开始测试日志和异常管理器...\n")
     
@@ -145,6 +186,7 @@ if __name__ == "__main__":
         test_logger()
         test_exception_handler()
         test_error_callback()
+        test_scan_site_packages()
         
         print("✅ 所有测试完成！")
         